@@ -0,0 +1,258 @@
+"""
+Compiled @constraint validators vs. the same checks written by hand in each resolver.
+
+The hand-written checks use regexes compiled once, as the directive does. List and input object
+arguments are checked by the directive once per field node within a request, the hand-written input object
+checks are run both on every resolution and memoized the same way, so the cost of the checks and
+the gain of the memo are reported separately. Times are per query, the validation cost is the time
+above the same schema without any check.
+
+    poetry run python benchmarks/constraint.py
+"""
+
+import re
+import timeit
+from typing import Any
+
+import graphene
+from graphql import GraphQLError
+
+from graphene_directives import ConstraintDirective, build_schema, directive
+
+ITEMS = 2000
+REPEAT = 15
+NUMBER = 3
+
+NAME_PATTERN = re.compile("^[a-z]+$")
+TAG_PATTERN = re.compile("^#")
+
+Constraint = ConstraintDirective()
+
+
+def items(*_: Any) -> list[dict]:
+    return [{"name": f"item {i}"} for i in range(ITEMS)]
+
+
+def label(root: dict, prefix: str, size: int) -> str:
+    return f"{prefix}{root['name']}"[:size]
+
+
+class FormatInput(graphene.InputObjectType):
+    prefix = directive(
+        Constraint, field=graphene.String(), pattern="^[a-z]+$", max_length=8
+    )
+    suffix = directive(
+        Constraint, field=graphene.String(), pattern="^[a-z]+$", max_length=8
+    )
+    tags = directive(
+        Constraint, field=graphene.List(graphene.String), max_length=5, pattern="^#"
+    )
+    size = directive(Constraint, field=graphene.Int(), min=1, max=64)
+
+
+class Item(graphene.ObjectType):
+    label = graphene.Field(
+        graphene.String,
+        prefix=directive(
+            Constraint,
+            field=graphene.Argument(graphene.String),
+            pattern="^[a-z]+$",
+            max_length=8,
+        ),
+        size=directive(
+            Constraint, field=graphene.Argument(graphene.Int), min=1, max=64
+        ),
+    )
+    formatted = graphene.Field(graphene.String, format=graphene.Argument(FormatInput))
+
+    @staticmethod
+    def resolve_label(root: dict, _info: Any, prefix: str, size: int) -> str:
+        return label(root, prefix, size)
+
+    @staticmethod
+    def resolve_formatted(root: dict, _info: Any, format: dict) -> str:  # noqa: A002
+        return label(root, format["prefix"], format["size"])
+
+
+class Query(graphene.ObjectType):
+    items = graphene.List(Item, resolver=items)
+
+
+def check(prefix: str, size: int, errors: list[str], path: str = "") -> None:
+    if not NAME_PATTERN.search(prefix):
+        errors.append(f"{path}prefix must match pattern '^[a-z]+$'")
+    if len(prefix) > 8:
+        errors.append(f"{path}prefix length must be at most 8")
+    if size < 1:
+        errors.append(f"{path}size must be at least 1")
+    if size > 64:
+        errors.append(f"{path}size must be at most 64")
+
+
+class HandFormatInput(graphene.InputObjectType):
+    class Meta:
+        name = "FormatInput"
+
+    prefix = graphene.String()
+    suffix = graphene.String()
+    tags = graphene.List(graphene.String)
+    size = graphene.Int()
+
+
+class HandItem(graphene.ObjectType):
+    class Meta:
+        name = "Item"
+
+    label = graphene.Field(
+        graphene.String, prefix=graphene.String(), size=graphene.Int()
+    )
+    formatted = graphene.Field(
+        graphene.String, format=graphene.Argument(HandFormatInput)
+    )
+
+    @staticmethod
+    def resolve_label(root: dict, _info: Any, prefix: str, size: int) -> str:
+        errors = []
+        check(prefix, size, errors)
+        if errors:
+            raise GraphQLError("Invalid arguments", extensions={"violations": errors})
+        return label(root, prefix, size)
+
+    @staticmethod
+    def resolve_formatted(root: dict, _info: Any, format: dict) -> str:  # noqa: A002
+        check_format(format)
+        return label(root, format["prefix"], format["size"])
+
+
+def check_format(format: dict) -> None:  # noqa: A002
+    errors = []
+    check(format["prefix"], format["size"], errors, "format.")
+    suffix = format.get("suffix")
+    if suffix is not None:
+        if not NAME_PATTERN.search(suffix):
+            errors.append("format.suffix must match pattern '^[a-z]+$'")
+        if len(suffix) > 8:
+            errors.append("format.suffix length must be at most 8")
+    tags = format.get("tags")
+    if tags is not None:
+        if len(tags) > 5:
+            errors.append("format.tags length must be at most 5")
+        for i, tag in enumerate(tags):
+            if tag is not None and not TAG_PATTERN.search(tag):
+                errors.append(f"format.tags[{i}] must match pattern '^#'")
+    if errors:
+        raise GraphQLError("Invalid arguments", extensions={"violations": errors})
+
+
+class MemoizedHandItem(HandItem):
+    class Meta:
+        name = "Item"
+
+    @staticmethod
+    def resolve_formatted(root: dict, info: Any, format: dict) -> str:  # noqa: A002
+        # Checked once per field node within a request, as @constraint does
+        validated = info.context.setdefault("validated_format_nodes", set())
+        node = info.field_nodes[0]
+        if node not in validated:
+            check_format(format)
+            validated.add(node)
+        return label(root, format["prefix"], format["size"])
+
+
+class PlainItem(HandItem):
+    class Meta:
+        name = "Item"
+
+    @staticmethod
+    def resolve_label(root: dict, _info: Any, prefix: str, size: int) -> str:
+        return label(root, prefix, size)
+
+    @staticmethod
+    def resolve_formatted(root: dict, _info: Any, format: dict) -> str:  # noqa: A002
+        return label(root, format["prefix"], format["size"])
+
+
+class HandQuery(graphene.ObjectType):
+    class Meta:
+        name = "Query"
+
+    items = graphene.List(HandItem, resolver=items)
+
+
+class MemoizedHandQuery(graphene.ObjectType):
+    class Meta:
+        name = "Query"
+
+    items = graphene.List(MemoizedHandItem, resolver=items)
+
+
+class PlainQuery(graphene.ObjectType):
+    class Meta:
+        name = "Query"
+
+    items = graphene.List(PlainItem, resolver=items)
+
+
+SCALAR_QUERY = '{ items { label(prefix: "abc", size: 12) } }'
+INPUT_QUERY = """{
+    items {
+        formatted(format: {prefix: "abc", suffix: "xyz", tags: ["#a", "#b", "#c"], size: 12})
+    }
+}"""
+
+compiled_schema = build_schema(query=Query, directives=[Constraint])
+hand_schema = graphene.Schema(query=HandQuery)
+memoized_hand_schema = graphene.Schema(query=MemoizedHandQuery)
+plain_schema = graphene.Schema(query=PlainQuery)
+
+for query in (SCALAR_QUERY, INPUT_QUERY):
+    compiled_result = compiled_schema.execute(query, context_value={})
+    assert compiled_result.errors is None
+    for schema in (hand_schema, memoized_hand_schema, plain_schema):
+        assert compiled_result.data == schema.execute(query, context_value={}).data
+
+
+def timed(schema: graphene.Schema, query: str) -> float:
+    return (
+        min(
+            timeit.repeat(
+                lambda: schema.execute(query, context_value={}),
+                repeat=REPEAT,
+                number=NUMBER,
+            )
+        )
+        / NUMBER
+    )
+
+
+def compare(query: str, schemas: list[tuple[str, graphene.Schema]]) -> None:
+    baseline = timed(plain_schema, query)
+    print(f"{'no checks':<40} {baseline * 1000:8.2f} ms / query")
+    for label_, schema in schemas:
+        best = timed(schema, query)
+        print(
+            f"{label_:<40} {best * 1000:8.2f} ms / query,"
+            f" checks {(best - baseline) * 1000:6.2f} ms"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    print(f"{ITEMS} items x 1 field with 2 constrained scalar arguments")
+    compare(
+        SCALAR_QUERY,
+        [
+            ("checks in resolver", hand_schema),
+            ("compiled @constraint", compiled_schema),
+        ],
+    )
+
+    print(f"{ITEMS} items x 1 field with a constrained input object argument")
+    compare(
+        INPUT_QUERY,
+        [
+            ("checks in resolver", hand_schema),
+            ("checks in resolver, once per field node", memoized_hand_schema),
+            ("compiled @constraint (once per field node)", compiled_schema),
+        ],
+    )
@@ -0,0 +1,124 @@
+"""
+Per worker unique memory (USS) of forked workers, with and without Schema.freeze(gc_freeze=True).
+
+The master builds a schema with many directive applications and renders its SDL, then forks
+workers which read the SDL and every directive application, and run a full collection,
+as a worker does while serving. The USS (private pages) of each worker is read from
+/proc/self/smaps_rollup, so this benchmark only runs on Linux.
+
+    poetry run python benchmarks/freeze_memory.py
+"""
+
+import gc
+import os
+import sys
+from typing import Any
+
+import graphene
+from graphql import GraphQLArgument, GraphQLInt, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    build_schema,
+    directive,
+)
+
+TYPES = 400
+FIELDS = 12
+WORKERS = 4
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+    args={"max_age": GraphQLArgument(GraphQLInt)},
+)
+TagDirective = CustomDirective(
+    name="tag",
+    locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+    args={"name": GraphQLArgument(GraphQLString)},
+    is_repeatable=True,
+)
+
+
+def make_schema() -> Any:
+    query_fields = {}
+    for i in range(TYPES):
+        fields = {
+            f"field_{j}": directive(
+                TagDirective,
+                field=directive(CacheDirective, field=graphene.String(), max_age=j),
+                name=f"tag-{i}-{j}",
+            )
+            for j in range(FIELDS)
+        }
+        entity = directive(TagDirective, name=f"type-{i}")(
+            type(f"Entity{i}", (graphene.ObjectType,), fields)
+        )
+        query_fields[f"entity_{i}"] = graphene.Field(entity)
+    query = type("Query", (graphene.ObjectType,), query_fields)
+    return build_schema(query=query, directives=[CacheDirective, TagDirective])
+
+
+def unique_set_size() -> int:
+    """
+    Private (clean and dirty) memory of the current process, in kB.
+    """
+    private = 0
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                private += int(line.split()[1])
+    return private
+
+
+def work(schema: Any) -> None:
+    len(str(schema))
+    index = schema.directive_index
+    for table in (index.types, index.fields, index.arguments):
+        for applications in table.values():
+            for application in applications:
+                dict(application.arguments)
+    for directives in schema.effective_directive_args.values():
+        len(directives)
+    gc.collect()
+
+
+def measure(freeze: bool) -> list[int]:
+    schema = make_schema()
+    str(schema)
+    if freeze:
+        schema.freeze(gc_freeze=True)
+    else:
+        schema.directive_index  # same precomputation as freeze, without freezing
+        schema.effective_directive_args
+
+    growths = []
+    for _ in range(WORKERS):
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # worker
+            os.close(read_end)
+            before = unique_set_size()
+            work(schema)
+            os.write(write_end, str(unique_set_size() - before).encode())
+            os._exit(0)
+        os.close(write_end)
+        growths.append(int(os.read(read_end, 64)))
+        os.close(read_end)
+        os.waitpid(pid, 0)
+
+    if freeze:
+        gc.unfreeze()
+    return growths
+
+
+if __name__ == "__main__":
+    if not os.path.exists("/proc/self/smaps_rollup") or not hasattr(os, "fork"):
+        sys.exit("requires Linux (fork and /proc/self/smaps_rollup)")
+
+    print(f"{TYPES} types x {FIELDS} fields, 2 directives per field, {WORKERS} workers")
+    for label, freeze in (("not frozen", False), ("frozen", True)):
+        growths = measure(freeze)
+        average = sum(growths) / len(growths)
+        print(f"{label:<12} USS growth per worker: {average:10.0f} kB")
@@ -0,0 +1,117 @@
+"""
+Compiled resolver wrappers vs. an equivalent graphene middleware.
+
+The middleware is dispatched for every resolved field, while the compiled wrapper
+only runs for the decorated field.
+
+    poetry run python benchmarks/resolver_wrapper.py
+"""
+
+import timeit
+from typing import Any, Callable
+
+import graphene
+
+from graphene_directives import CustomDirective, DirectiveLocation, Schema
+from graphene_directives import build_schema, directive
+
+ITEMS = 2000
+REPEAT = 5
+NUMBER = 3
+
+
+def upper_wrapper(
+    resolver: Callable,
+    _parent_type: Any,
+    _field_name: str,
+    _field_type: Any,
+    _inputs: list[dict],
+    _schema: Schema,
+) -> Callable:
+    def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+        return resolver(root, info, **kwargs).upper()
+
+    return resolve
+
+
+UpperDirective = CustomDirective(
+    name="upper",
+    locations=[DirectiveLocation.FIELD_DEFINITION],
+    resolver_wrapper=upper_wrapper,
+)
+
+
+class UpperMiddleware:
+    fields = {("Item", "name")}
+
+    def resolve(self, next_: Callable, root: Any, info: Any, **kwargs: Any) -> Any:
+        value = next_(root, info, **kwargs)
+        if (info.parent_type.name, info.field_name) in self.fields:
+            return value.upper()
+        return value
+
+
+def items(*_: Any) -> list[dict]:
+    return [
+        {"id": i, "name": f"item {i}", "kind": "a", "price": i * 1.5, "stock": i}
+        for i in range(ITEMS)
+    ]
+
+
+class Item(graphene.ObjectType):
+    id = graphene.Int()
+    name = directive(UpperDirective, field=graphene.String())
+    kind = graphene.String()
+    price = graphene.Float()
+    stock = graphene.Int()
+
+
+class Query(graphene.ObjectType):
+    items = graphene.List(Item, resolver=items)
+
+
+class PlainItem(graphene.ObjectType):
+    class Meta:
+        name = "Item"
+
+    id = graphene.Int()
+    name = graphene.String()
+    kind = graphene.String()
+    price = graphene.Float()
+    stock = graphene.Int()
+
+
+class PlainQuery(graphene.ObjectType):
+    class Meta:
+        name = "Query"
+
+    items = graphene.List(PlainItem, resolver=items)
+
+
+QUERY = "{ items { id name kind price stock } }"
+
+compiled_schema = build_schema(query=Query, directives=[UpperDirective])
+plain_schema = graphene.Schema(query=PlainQuery)
+middleware = [UpperMiddleware()]
+
+assert (
+    compiled_schema.execute(QUERY).data
+    == plain_schema.execute(QUERY, middleware=middleware).data
+)
+
+
+def run(label: str, statement: Callable) -> float:
+    best = min(timeit.repeat(statement, repeat=REPEAT, number=NUMBER)) / NUMBER
+    print(f"{label:<24} {best * 1000:8.2f} ms / query")
+    return best
+
+
+if __name__ == "__main__":
+    print(f"{ITEMS} items x 5 fields, 1 decorated field")
+    baseline = run("no directive", lambda: plain_schema.execute(QUERY))
+    compiled = run("compiled wrapper", lambda: compiled_schema.execute(QUERY))
+    middle = run(
+        "middleware", lambda: plain_schema.execute(QUERY, middleware=middleware)
+    )
+    print(f"wrapper overhead:    {(compiled / baseline - 1) * 100:6.1f} %")
+    print(f"middleware overhead: {(middle / baseline - 1) * 100:6.1f} %")
@@ -1,20 +1,93 @@
 from .constants import DirectiveLocation
-from .data_models import SchemaDirective
+from .data_models import (
+    DirectiveApplication,
+    DirectiveIndex,
+    SchemaChange,
+    SchemaDirective,
+)
 from .directive import ACCEPTED_TYPES
 from .directive import CustomDirective, directive, directive_decorator
-from .exceptions import DirectiveCustomValidationError, DirectiveValidationError
+from .diff import diff_schemas
+from .directives import (
+    AuthDirective,
+    CircuitBreakerDirective,
+    ColumnDirective,
+    ConstraintDirective,
+    EventLoopLag,
+    FanOutDirective,
+    HedgeDirective,
+    InMemoryRateLimitStore,
+    InFlightRequests,
+    MaxItemsDirective,
+    PriorityDirective,
+    RateLimitDirective,
+    RateLimitStore,
+    StaticDirective,
+    ThrottleDirective,
+    get_priority_table,
+    get_selected_columns,
+)
+from .exceptions import (
+    DirectiveAuthorizationError,
+    DirectiveCircuitOpenError,
+    DirectiveConstraintError,
+    DirectiveCustomValidationError,
+    DirectiveLoadSheddingError,
+    DirectiveMaxItemsError,
+    DirectiveRateLimitError,
+    DirectiveRuntimeError,
+    DirectiveValidationError,
+)
 from .main import build_schema
+from .render_cache import RenderCache, shared_render_cache
 from .schema import Schema
+from .service import ServiceType, service_field
+from .shared_sdl import SharedSDL
+from .telemetry import FieldUsageRecorder
 
 __all__ = [
     "build_schema",
     "Schema",
     "CustomDirective",
     "SchemaDirective",
+    "DirectiveApplication",
+    "DirectiveIndex",
     "directive_decorator",
     "directive",
     "ACCEPTED_TYPES",
     "DirectiveLocation",
     "DirectiveCustomValidationError",
     "DirectiveValidationError",
+    "DirectiveRuntimeError",
+    "DirectiveAuthorizationError",
+    "DirectiveConstraintError",
+    "AuthDirective",
+    "DirectiveLoadSheddingError",
+    "ConstraintDirective",
+    "PriorityDirective",
+    "InFlightRequests",
+    "EventLoopLag",
+    "get_priority_table",
+    "DirectiveMaxItemsError",
+    "MaxItemsDirective",
+    "ColumnDirective",
+    "get_selected_columns",
+    "ThrottleDirective",
+    "FanOutDirective",
+    "HedgeDirective",
+    "DirectiveCircuitOpenError",
+    "CircuitBreakerDirective",
+    "DirectiveRateLimitError",
+    "RateLimitDirective",
+    "RateLimitStore",
+    "InMemoryRateLimitStore",
+    "StaticDirective",
+    "FieldUsageRecorder",
+    "RenderCache",
+    "shared_render_cache",
+    "SchemaChange",
+    "diff_schemas",
+    "ServiceType",
+    "service_field",
+    "SharedSDL",
 ]
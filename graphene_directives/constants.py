@@ -52,3 +52,7 @@ class DirectiveLocation(Enum):
 
     def to_graphene_directive_location(self) -> GrapheneDirectiveLocation:
         return GrapheneDirectiveLocation(self.value)
+
+
+# Key (or attribute name) under which per request data is kept on the execution context value
+REQUEST_STORE_KEY = "_graphene_directives"
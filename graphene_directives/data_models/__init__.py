@@ -1,4 +1,14 @@
 from .custom_directive_meta import CustomDirectiveMeta
+from .directive_index import DirectiveApplication, DirectiveIndex
+from .schema_change import SchemaChange
 from .schema_directive import SchemaDirective
+from .sdl_blocks import SDLBlocks
 
-__all__ = ["SchemaDirective", "CustomDirectiveMeta"]
+__all__ = [
+    "SchemaDirective",
+    "CustomDirectiveMeta",
+    "DirectiveApplication",
+    "DirectiveIndex",
+    "SDLBlocks",
+    "SchemaChange",
+]
@@ -22,3 +22,9 @@ class CustomDirectiveMeta:
     field_validator: Union[
         Callable[[Any, Any, dict[str, Any], Any], bool], None
     ]  # (parent_type, field_type, args, schema) -> valid
+    resolver_wrapper: Union[
+        Callable[[Callable, Any, str, Any, list[dict[str, Any]], Any], Callable], None
+    ] = None  # (resolver, parent_type, field_name, field_type, args_list, schema) -> resolver
+    subscribe_wrapper: Union[
+        Callable[[Callable, Any, str, Any, list[dict[str, Any]], Any], Callable], None
+    ] = None  # (subscribe, parent_type, field_name, field_type, args_list, schema) -> subscribe
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from graphql import GraphQLDirective
+
+
+@dataclass
+class DirectiveApplication:
+    # Declared by hand, dataclass(slots=True) needs Python 3.10
+    __slots__ = ("target_directive", "arguments")
+
+    target_directive: GraphQLDirective
+    arguments: dict[str, Any]  # snake_cased, after input_transform
+
+
+@dataclass
+class DirectiveIndex:
+    """
+    Every directive application of a schema, keyed by schema (GraphQL) names.
+
+    types: type_name -> applications at non field level
+    fields: (type_name, field_name) -> applications at field / input field / enum value level
+    arguments: (type_name, field_name, argument_name) -> applications at argument level
+    """
+
+    types: dict[str, list[DirectiveApplication]] = field(default_factory=dict)
+    fields: dict[tuple[str, str], list[DirectiveApplication]] = field(
+        default_factory=dict
+    )
+    arguments: dict[tuple[str, str, str], list[DirectiveApplication]] = field(
+        default_factory=dict
+    )
+
+    def for_type(self, type_name: str) -> list[DirectiveApplication]:
+        return self.types.get(type_name, [])
+
+    def for_field(self, type_name: str, field_name: str) -> list[DirectiveApplication]:
+        return self.fields.get((type_name, field_name), [])
+
+    def for_argument(
+        self, type_name: str, field_name: str, argument_name: str
+    ) -> list[DirectiveApplication]:
+        return self.arguments.get((type_name, field_name, argument_name), [])
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SchemaChange:
+    """
+    A change between two schemas, see diff_schemas.
+
+    kind: e.g. type_added, field_type_changed, directive_changed
+    path: schema coordinate of the changed element (Type, Type.field, Type.field(argument:)),
+        followed by @directive for directive applications
+    old, new: the values before and after the change (type names, argument lists of the applications), if any
+    """
+
+    kind: str
+    path: str
+    old: Any = None
+    new: Any = None
@@ -0,0 +1,54 @@
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Callable
+
+
+class SDLBlocks(Mapping):
+    """
+    Lazily populated mapping: type name -> annotated SDL block of the type.
+
+    Blocks are rendered on first access and cached, iteration follows the schema's type order.
+    """
+
+    def __init__(self, type_names: Iterable[str], render: Callable[[str], str]):
+        self._type_names = tuple(type_names)
+        self._known = frozenset(self._type_names)
+        self._render = render
+        self._blocks: dict[str, str] = {}
+
+    def __getitem__(self, type_name: str) -> str:
+        block = self._blocks.get(type_name)
+        if block is None:
+            if type_name not in self._known:
+                raise KeyError(type_name)
+            block = self._blocks[type_name] = self._render(type_name)
+        return block
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._type_names)
+
+    def __len__(self) -> int:
+        return len(self._type_names)
+
+    def __contains__(self, type_name: object) -> bool:
+        return type_name in self._known
+
+    def copy(self, render: Callable[[str], str]) -> "SDLBlocks":
+        """
+        Independent copy reusing the blocks rendered so far, rendering the other blocks with render.
+        """
+        blocks = SDLBlocks(self._type_names, render)
+        blocks._blocks = dict(self._blocks)
+        return blocks
+
+    def invalidate(self, type_names: Iterable[str]) -> None:
+        """
+        Drop the cached blocks of some types, they are rendered again on next access.
+        """
+        for type_name in type_names:
+            self._blocks.pop(type_name, None)
+
+    def rendered(self) -> list[str]:
+        """
+        Names of the types whose block has already been rendered.
+        """
+        return list(self._blocks)
@@ -0,0 +1,227 @@
+from typing import Any
+
+from graphql import (
+    GraphQLNamedType,
+    is_enum_type,
+    is_input_object_type,
+    is_interface_type,
+    is_object_type,
+    is_union_type,
+)
+
+from .data_models import DirectiveApplication, SchemaChange
+
+_TYPE_KINDS = (
+    ("object", is_object_type),
+    ("interface", is_interface_type),
+    ("union", is_union_type),
+    ("enum", is_enum_type),
+    ("input", is_input_object_type),
+)
+
+
+def _type_kind(entity_type: GraphQLNamedType) -> str:
+    for kind, predicate in _TYPE_KINDS:
+        if predicate(entity_type):
+            return kind
+    return "scalar"
+
+
+def _group_arguments(
+    applications: list[DirectiveApplication],
+) -> dict[str, list[dict[str, Any]]]:
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for application in applications:
+        grouped.setdefault(application.target_directive.name, []).append(
+            application.arguments
+        )
+    return grouped
+
+
+def _diff_applications(
+    path: str,
+    old_applications: list[DirectiveApplication],
+    new_applications: list[DirectiveApplication],
+    changes: list[SchemaChange],
+) -> None:
+    if not old_applications and not new_applications:
+        return
+    old = _group_arguments(old_applications)
+    new = _group_arguments(new_applications)
+    for name in {**old, **new}:
+        if name not in old:
+            changes.append(
+                SchemaChange("directive_added", f"{path} @{name}", new=new[name])
+            )
+        elif name not in new:
+            changes.append(
+                SchemaChange("directive_removed", f"{path} @{name}", old=old[name])
+            )
+        elif old[name] != new[name]:
+            changes.append(
+                SchemaChange(
+                    "directive_changed", f"{path} @{name}", old=old[name], new=new[name]
+                )
+            )
+
+
+def _members(entity_type: GraphQLNamedType) -> dict[str, Any]:
+    """
+    Fields, input fields or enum values of a type, by name.
+    """
+    if is_enum_type(entity_type):
+        return entity_type.values
+    return getattr(entity_type, "fields", {})
+
+
+def _diff_type(
+    old_schema: Any, new_schema: Any, type_name: str, changes: list[SchemaChange]
+) -> None:
+    old_type = old_schema.graphql_schema.type_map[type_name]
+    new_type = new_schema.graphql_schema.type_map[type_name]
+    old_index = old_schema.directive_index
+    new_index = new_schema.directive_index
+
+    old_kind, new_kind = _type_kind(old_type), _type_kind(new_type)
+    if old_kind != new_kind:
+        changes.append(
+            SchemaChange("type_kind_changed", type_name, old=old_kind, new=new_kind)
+        )
+
+    _diff_applications(
+        type_name, old_index.for_type(type_name), new_index.for_type(type_name), changes
+    )
+
+    for kind, attribute in (("interface", "interfaces"), ("member", "types")):
+        old_names = [t.name for t in getattr(old_type, attribute, ())]
+        new_names = [t.name for t in getattr(new_type, attribute, ())]
+        changes.extend(
+            SchemaChange(f"{kind}_removed", type_name, old=name)
+            for name in old_names
+            if name not in new_names
+        )
+        changes.extend(
+            SchemaChange(f"{kind}_added", type_name, new=name)
+            for name in new_names
+            if name not in old_names
+        )
+
+    old_fields, new_fields = _members(old_type), _members(new_type)
+    for field_name, old_field in old_fields.items():
+        path = f"{type_name}.{field_name}"
+        new_field = new_fields.get(field_name)
+        if new_field is None:
+            changes.append(SchemaChange("field_removed", path))
+            continue
+
+        old_field_type = getattr(old_field, "type", None)
+        new_field_type = getattr(new_field, "type", None)
+        if str(old_field_type) != str(new_field_type):
+            changes.append(
+                SchemaChange(
+                    "field_type_changed",
+                    path,
+                    old=str(old_field_type),
+                    new=str(new_field_type),
+                )
+            )
+        _diff_applications(
+            path,
+            old_index.for_field(type_name, field_name),
+            new_index.for_field(type_name, field_name),
+            changes,
+        )
+
+        old_args = getattr(old_field, "args", None) or {}
+        new_args = getattr(new_field, "args", None) or {}
+        for arg_name, old_arg in old_args.items():
+            arg_path = f"{path}({arg_name}:)"
+            new_arg = new_args.get(arg_name)
+            if new_arg is None:
+                changes.append(SchemaChange("argument_removed", arg_path))
+                continue
+            if str(old_arg.type) != str(new_arg.type):
+                changes.append(
+                    SchemaChange(
+                        "argument_type_changed",
+                        arg_path,
+                        old=str(old_arg.type),
+                        new=str(new_arg.type),
+                    )
+                )
+            _diff_applications(
+                arg_path,
+                old_index.for_argument(type_name, field_name, arg_name),
+                new_index.for_argument(type_name, field_name, arg_name),
+                changes,
+            )
+        for arg_name, new_arg in new_args.items():
+            if arg_name not in old_args:
+                changes.append(
+                    SchemaChange(
+                        "argument_added", f"{path}({arg_name}:)", new=str(new_arg.type)
+                    )
+                )
+
+    for field_name, new_field in new_fields.items():
+        if field_name not in old_fields:
+            new_field_type = getattr(new_field, "type", None)
+            changes.append(
+                SchemaChange(
+                    "field_added",
+                    f"{type_name}.{field_name}",
+                    new=None if new_field_type is None else str(new_field_type),
+                )
+            )
+
+
+def diff_schemas(old: Any, new: Any) -> list[SchemaChange]:
+    """
+    Structural diff of two graphene_directives schemas, including the directive applications and their arguments.
+
+    The per type content hashes (sdl_hashes) are compared first, only the types whose hash changed are compared
+    in depth, so the cost beyond the hashes is proportional to the size of the change.
+    Description-only changes are not reported.
+
+    Returns:
+        the changes: type_added / type_removed / type_kind_changed,
+        field_added / field_removed / field_type_changed (fields, input fields and enum values),
+        argument_added / argument_removed / argument_type_changed,
+        interface_added / interface_removed, member_added / member_removed (union members),
+        directive_added / directive_removed / directive_changed (schema, type, field and argument level)
+    """
+    changes: list[SchemaChange] = []
+    if old.sdl_digest == new.sdl_digest:
+        return changes
+
+    _diff_applications(
+        "schema",
+        [
+            DirectiveApplication(
+                schema_directive.target_directive, schema_directive.arguments
+            )
+            for schema_directive in old.schema_directives
+        ],
+        [
+            DirectiveApplication(
+                schema_directive.target_directive, schema_directive.arguments
+            )
+            for schema_directive in new.schema_directives
+        ],
+        changes,
+    )
+
+    old_hashes, new_hashes = old.sdl_hashes, new.sdl_hashes
+    # Unlike the blocks, the hashes are kept by frozen schemas
+    for type_name in old_hashes:
+        new_hash = new_hashes.get(type_name)
+        if new_hash is None:
+            changes.append(SchemaChange("type_removed", type_name))
+        elif new_hash != old_hashes[type_name]:
+            _diff_type(old, new, type_name, changes)
+    changes.extend(
+        SchemaChange("type_added", type_name)
+        for type_name in new_hashes
+        if type_name not in old_hashes
+    )
+    return changes
@@ -31,6 +31,12 @@ def CustomDirective(  # noqa
     non_field_validator: Callable[[Any, dict[str, Any], Any], bool] = None,
     field_validator: Callable[[Any, Any, dict[str, Any], Any], bool] = None,
     input_transform: Callable[[dict[str, Any], Any], dict[str, Any]] = None,
+    resolver_wrapper: Callable[
+        [Callable, Any, str, Any, list[dict[str, Any]], Any], Callable
+    ] = None,
+    subscribe_wrapper: Callable[
+        [Callable, Any, str, Any, list[dict[str, Any]], Any], Callable
+    ] = None,
 ) -> GraphQLDirective:
     """
     Creates a GraphQLDirective
@@ -55,6 +61,14 @@ def CustomDirective(  # noqa
     :param input_transform: a function to transform the input arg's values before usage
                 def input_transform (inputs: dict[str, Any], schema: Schema) -> dict[str, Any]
 
+    :param resolver_wrapper: a resolver wrapper factory, called once per decorated field at schema build time
+                def resolver_wrapper (resolver: Callable, parent_type_: graphql type, field_name: str,
+                                      field_type_: graphene type, inputs: list[dict[str, Any]], schema: Schema) -> Callable,
+                    the returned callable replaces the field's resolver (root, info, **kwargs),
+                    inputs holds the args of every application of the directive on the field
+    :param subscribe_wrapper: same as resolver_wrapper, for the field's subscribe function (subscription fields),
+                subscribe is None for fields which are not subscriptions
+
     """
 
     if not isinstance(allow_all_directive_locations, bool):
@@ -72,6 +86,16 @@ def CustomDirective(  # noqa
             f"directive @{name} validator type invalid expected Callable[[GraphQLDirective, Any], bool] "
         )
 
+    if not (isinstance(resolver_wrapper, Callable) or resolver_wrapper is None):
+        raise DirectiveInvalidArgTypeError(
+            f"directive @{name} resolver_wrapper type invalid expected Callable[..., Callable]"
+        )
+
+    if not (isinstance(subscribe_wrapper, Callable) or subscribe_wrapper is None):
+        raise DirectiveInvalidArgTypeError(
+            f"directive @{name} subscribe_wrapper type invalid expected Callable[..., Callable]"
+        )
+
     if (
         any(not isinstance(location, DirectiveLocation) for location in locations)
         and not allow_all_directive_locations
@@ -120,6 +144,8 @@ def CustomDirective(  # noqa
         non_field_validator=non_field_validator,
         field_validator=field_validator,
         input_transform=input_transform,
+        resolver_wrapper=resolver_wrapper,
+        subscribe_wrapper=subscribe_wrapper,
     )
 
     # Check if target_directive.locations have accepted types
@@ -0,0 +1,36 @@
+from .auth import AuthDirective
+from .breaker import CircuitBreakerDirective
+from .constraint import ConstraintDirective
+from .fan_out import FanOutDirective
+from .hedge import HedgeDirective
+from .max_items import MaxItemsDirective
+from .priority import (
+    EventLoopLag,
+    InFlightRequests,
+    PriorityDirective,
+    get_priority_table,
+)
+from .projection import ColumnDirective, get_selected_columns
+from .rate_limit import InMemoryRateLimitStore, RateLimitDirective, RateLimitStore
+from .static import StaticDirective
+from .throttle import ThrottleDirective
+
+__all__ = [
+    "AuthDirective",
+    "ConstraintDirective",
+    "PriorityDirective",
+    "InFlightRequests",
+    "EventLoopLag",
+    "get_priority_table",
+    "MaxItemsDirective",
+    "ColumnDirective",
+    "get_selected_columns",
+    "ThrottleDirective",
+    "FanOutDirective",
+    "HedgeDirective",
+    "CircuitBreakerDirective",
+    "RateLimitDirective",
+    "RateLimitStore",
+    "InMemoryRateLimitStore",
+    "StaticDirective",
+]
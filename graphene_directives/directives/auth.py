@@ -0,0 +1,95 @@
+from collections.abc import Collection
+from typing import Any, Callable, Optional
+
+from graphql import (
+    GraphQLArgument,
+    GraphQLDirective,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLString,
+)
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveAuthorizationError
+from ..utils import get_request_store
+
+
+class _ScopeGuard:
+    """
+    Per request authorization state: the principal's scopes and the outcome of each distinct requirement.
+    """
+
+    __slots__ = ("scopes", "outcomes")
+
+    def __init__(self, scopes: Collection[str]):
+        self.scopes = frozenset(scopes)
+        self.outcomes: dict[frozenset[str], bool] = {}
+
+    def allows(self, required: frozenset[str]) -> bool:
+        outcome = self.outcomes.get(required)
+        if outcome is None:
+            outcome = self.outcomes[required] = required <= self.scopes
+        return outcome
+
+
+def AuthDirective(  # noqa
+    get_scopes: Callable[[Any], Collection[str]],
+    name: str = "auth",
+    description: Optional[str] = "Requires the principal to hold every listed scope.",
+) -> GraphQLDirective:
+    """
+    Creates a field level authorization directive: @auth(scopes: [String!]!)
+
+    The scopes of every application reaching a field (type level, then field level) are compiled at schema
+    build time into one frozenset. On execution, the principal's scopes are fetched once per request and the
+    outcome of each distinct requirement is memoized, so most fields cost a single dict lookup.
+
+    :param get_scopes: returns the scopes held by the principal of the request
+                def get_scopes (info: GraphQLResolveInfo) -> Collection[str]
+    :param name: directive name
+    :param description: directive description
+    """
+
+    store_key = f"@{name}"
+
+    def resolver_wrapper(
+        resolver: Callable,
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        inputs: list[dict[str, Any]],
+        _schema: Any,
+    ) -> Callable:
+        required = frozenset(scope for values in inputs for scope in values["scopes"])
+        if not required:
+            return resolver
+
+        def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+            store = get_request_store(info.context)
+            guard = store.get(store_key)
+            if guard is None:
+                guard = store[store_key] = _ScopeGuard(get_scopes(info))
+
+            if not guard.allows(required):
+                raise DirectiveAuthorizationError(
+                    f"Not authorized to access {parent_type.name}.{field_name}",
+                    extensions={"requiredScopes": sorted(required)},
+                )
+            return resolver(root, info, **kwargs)
+
+        return resolve
+
+    return CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "scopes": GraphQLArgument(
+                GraphQLNonNull(GraphQLList(GraphQLNonNull(GraphQLString))),
+                description="Scopes required to resolve the field.",
+            )
+        },
+        is_repeatable=True,
+        description=description,
+        resolver_wrapper=resolver_wrapper,
+    )
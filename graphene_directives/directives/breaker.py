@@ -0,0 +1,221 @@
+from inspect import isawaitable
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from graphql import GraphQLArgument, GraphQLDirective, GraphQLNonNull, GraphQLString
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveCircuitOpenError, DirectiveValidationError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Breaker:
+    """
+    Rolling failure rate over the last window calls, kept in a fixed-size ring buffer.
+    """
+
+    __slots__ = (
+        "ring",
+        "index",
+        "calls",
+        "failures",
+        "state",
+        "opened_at",
+        "probes",
+        "successes",
+        "period",
+    )
+
+    def __init__(self, window: int) -> None:
+        self.ring = bytearray(window)
+        self.index = 0
+        self.calls = 0
+        self.failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probes = 0
+        self.successes = 0
+        self.period = 0  # incremented on every state change
+
+    def reset(self) -> None:
+        self.ring = bytearray(len(self.ring))
+        self.index = self.calls = self.failures = 0
+
+    def add(self, failed: bool) -> None:
+        window = len(self.ring)
+        if self.calls == window:
+            self.failures -= self.ring[self.index]
+        else:
+            self.calls += 1
+        self.ring[self.index] = failed
+        self.failures += failed
+        self.index = (self.index + 1) % window
+
+
+def CircuitBreakerDirective(  # noqa
+    failure_rate: float = 0.5,
+    window: int = 20,
+    min_calls: int = 10,
+    reset_timeout: float = 30.0,
+    half_open_probes: int = 1,
+    on_open: str = "error",
+    on_state_change: Optional[Callable[[str, str], None]] = None,
+    clock: Callable[[], float] = monotonic,
+    name: str = "breaker",
+    description: Optional[str] = "Fails fast while the named dependency is unhealthy.",
+) -> GraphQLDirective:
+    """
+    Creates a circuit breaker keyed by dependency name: @breaker(dependency: String!)
+
+    The fields of a dependency share one breaker, which tracks the outcome of their last window resolutions.
+    Once at least min_calls resolutions were tracked and their failure rate reaches failure_rate, the breaker opens:
+    resolutions are short-circuited to a CIRCUIT_OPEN error (on_open="error") or to null (on_open="null").
+    After reset_timeout seconds the breaker is half-open and lets half_open_probes resolutions through,
+    it closes when they all succeed and opens again on the first failure.
+    A resolution fails when its resolver (or the awaitable it returns) raises an Exception,
+    a cancelled probe is not counted and lets another resolution probe.
+    Resolutions started before the breaker opened (or before the current half-open period) and finishing
+    while it is open or half-open are not counted, only probes decide whether it closes.
+
+    :param failure_rate: failure rate opening the breaker, between 0 and 1
+    :param window: number of resolutions tracked per dependency
+    :param min_calls: number of tracked resolutions before the breaker can open
+    :param reset_timeout: seconds before an open breaker lets probes through
+    :param half_open_probes: number of successful probes closing the breaker
+    :param on_open: error or null, how resolutions are short-circuited while the breaker is open
+    :param on_state_change: called each time a breaker changes state, to record a metric
+                def on_state_change (dependency: str, state: "closed" | "open" | "half_open") -> None
+    :param clock: monotonic clock in seconds
+    :param name: directive name
+    :param description: directive description
+    """
+
+    if not 0 < failure_rate <= 1:
+        raise DirectiveValidationError(f"@{name} failure_rate must be in ]0, 1]")
+    if window < 1 or not 1 <= min_calls <= window:
+        raise DirectiveValidationError(
+            f"@{name} window and min_calls must satisfy 1 <= min_calls <= window"
+        )
+    if half_open_probes < 1:
+        raise DirectiveValidationError(f"@{name} half_open_probes must be positive")
+    if on_open not in ("error", "null"):
+        raise DirectiveValidationError(f"@{name} on_open must be error or null")
+
+    breakers: dict[str, _Breaker] = {}
+
+    def set_state(dependency: str, breaker: _Breaker, state: str) -> None:
+        breaker.state = state
+        breaker.period += 1
+        if state == OPEN:
+            breaker.opened_at = clock()
+        elif state == HALF_OPEN:
+            breaker.probes = breaker.successes = 0
+        else:
+            breaker.reset()
+        if on_state_change is not None:
+            on_state_change(dependency, state)
+
+    def allow(dependency: str, breaker: _Breaker) -> bool:
+        if breaker.state == CLOSED:
+            return True
+        if breaker.state == OPEN:
+            if clock() - breaker.opened_at < reset_timeout:
+                return False
+            set_state(dependency, breaker, HALF_OPEN)
+        if breaker.probes < half_open_probes:
+            breaker.probes += 1
+            return True
+        return False
+
+    def record(dependency: str, breaker: _Breaker, period: int, failed: bool) -> None:
+        if breaker.state != CLOSED and breaker.period != period:
+            # Started before the breaker opened (or before this half-open period): not a probe
+            return
+        if breaker.state == HALF_OPEN:
+            if failed:
+                set_state(dependency, breaker, OPEN)
+            else:
+                breaker.successes += 1
+                if breaker.successes >= half_open_probes:
+                    set_state(dependency, breaker, CLOSED)
+            return
+        if breaker.state == OPEN:
+            return
+        breaker.add(failed)
+        if (
+            failed
+            and breaker.calls >= min_calls
+            and breaker.failures >= failure_rate * breaker.calls
+        ):
+            set_state(dependency, breaker, OPEN)
+
+    def release(breaker: _Breaker, period: int) -> None:
+        # A cancelled probe has no outcome, its slot is given back to the next resolution
+        if breaker.state == HALF_OPEN and breaker.period == period:
+            breaker.probes -= 1
+
+    def resolver_wrapper(
+        resolver: Callable,
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        inputs: list[dict[str, Any]],
+        _schema: Any,
+    ) -> Callable:
+        dependency = inputs[-1]["dependency"]
+        breaker = breakers.setdefault(dependency, _Breaker(window))
+
+        def short_circuit() -> None:
+            if on_open == "error":
+                raise DirectiveCircuitOpenError(
+                    f"{parent_type.name}.{field_name} is unavailable, {dependency} circuit is open",
+                    extensions={"dependency": dependency},
+                )
+
+        async def track(result: Any, period: int) -> Any:
+            try:
+                value = await result
+            except Exception:
+                record(dependency, breaker, period, True)
+                raise
+            except BaseException:  # cancelled, e.g. client disconnect or losing hedge
+                release(breaker, period)
+                raise
+            record(dependency, breaker, period, False)
+            return value
+
+        def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+            if not allow(dependency, breaker):
+                return short_circuit()
+            # The state the resolution started in, its outcome only counts for that state
+            period = breaker.period
+            try:
+                result = resolver(root, info, **kwargs)
+            except Exception:
+                record(dependency, breaker, period, True)
+                raise
+            except BaseException:
+                release(breaker, period)
+                raise
+            if isawaitable(result):
+                return track(result, period)
+            record(dependency, breaker, period, False)
+            return result
+
+        return resolve
+
+    return CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "dependency": GraphQLArgument(
+                GraphQLNonNull(GraphQLString), description="Dependency name."
+            )
+        },
+        description=description,
+        resolver_wrapper=resolver_wrapper,
+    )
@@ -0,0 +1,438 @@
+import math
+import re
+from typing import Any, Callable, Optional
+
+from graphene.utils.str_converters import to_camel_case
+from graphql import (
+    GraphQLArgument,
+    GraphQLBoolean,
+    GraphQLDirective,
+    GraphQLFloat,
+    GraphQLID,
+    GraphQLInt,
+    GraphQLString,
+    ListValueNode,
+    ObjectValueNode,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    is_input_object_type,
+    is_list_type,
+    is_scalar_type,
+)
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveConstraintError, DirectiveValidationError
+from ..utils import get_request_store
+
+# (value) -> True if valid, the fast path run on every call
+Predicate = Callable[[Any], Any]
+
+# (value, path, violations) -> None, appends the violations found, only run once a predicate failed
+Reporter = Callable[[Any, str, list[dict[str, str]]], None]
+
+Validator = tuple[Predicate, Reporter]
+
+
+def _fold(inputs: list[dict[str, Any]], key: str, pick: Callable) -> Any:
+    values = [values[key] for values in inputs if values.get(key) is not None]
+    return pick(values) if values else None
+
+
+def _check_applicable(inputs: list[dict[str, Any]], type_: Any, path: str) -> None:
+    """
+    Reject min / max on non numeric values, pattern on non string values
+    and minLength / maxLength on values which are neither strings nor lists,
+    custom scalars are not checked.
+    """
+    named_type = get_named_type(type_)
+    custom_scalar = is_scalar_type(named_type) and named_type.name not in {
+        GraphQLBoolean.name,
+        GraphQLFloat.name,
+        GraphQLID.name,
+        GraphQLInt.name,
+        GraphQLString.name,
+    }
+    if custom_scalar:
+        return
+
+    numeric = named_type.name in {GraphQLFloat.name, GraphQLInt.name}
+    textual = named_type.name in {GraphQLID.name, GraphQLString.name}
+    sized = textual or _is_list(type_)
+    for values in inputs:
+        for key in ("min", "max"):
+            if values.get(key) is not None and not numeric:
+                raise DirectiveValidationError(
+                    f"Constraint {key} can only be applied to Int and Float values, at {path}: {named_type}"
+                )
+        if values.get("pattern") is not None and not textual:
+            raise DirectiveValidationError(
+                f"Constraint pattern can only be applied to String and ID values, at {path}: {named_type}"
+            )
+        for key in ("min_length", "max_length"):
+            if values.get(key) is not None and not sized:
+                raise DirectiveValidationError(
+                    f"Constraint {to_camel_case(key)} can only be applied to String, ID and list values, at {path}: {type_}"
+                )
+
+
+def _all_of(predicates: list[Predicate]) -> Predicate:
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def valid(value: Any) -> bool:
+        for predicate in predicates:  # noqa: SIM110 (all() + generator is slower)
+            if not predicate(value):
+                return False
+        return True
+
+    return valid
+
+
+def _compile_validator(
+    inputs: list[dict[str, Any]], is_list: bool, nested: Optional[Validator]
+) -> Validator:
+    """
+    Fold every constraint application of an argument / input field into one validator.
+
+    minLength and maxLength apply to the value, min, max and pattern apply to the value
+    (or to each item of a list value).
+    """
+    minimum = _fold(inputs, "min", max)
+    maximum = _fold(inputs, "max", min)
+    min_length = _fold(inputs, "min_length", max)
+    max_length = _fold(inputs, "max_length", min)
+    regexes = []
+    for values in inputs:
+        pattern = values.get("pattern")
+        if pattern is None:
+            continue
+        try:
+            regexes.append(re.compile(pattern))
+        except re.error as error:
+            raise DirectiveValidationError(
+                f"Invalid constraint pattern {pattern!r}: {error}"
+            ) from error
+
+    item_predicates: list[Predicate] = []
+    if minimum is not None or maximum is not None:
+        low = -math.inf if minimum is None else minimum
+        high = math.inf if maximum is None else maximum
+        item_predicates.append(lambda value: low <= value <= high)
+    item_predicates.extend(regex.search for regex in regexes)
+    if nested is not None:
+        item_predicates.append(nested[0])
+
+    length_predicate: Optional[Predicate] = None
+    if min_length is not None or max_length is not None:
+        low_length = 0 if min_length is None else min_length
+        high_length = math.inf if max_length is None else max_length
+        length_predicate = lambda value: low_length <= len(value) <= high_length  # noqa: E731
+
+    if not is_list:
+        if length_predicate is not None and len(item_predicates) == 1 and regexes:
+            # The usual string constraint, a length range and a pattern in one call
+            search = regexes[0].search
+
+            def valid(value: Any) -> bool:
+                return (
+                    low_length <= len(value) <= high_length
+                    and search(value) is not None
+                )
+
+        else:
+            valid = _all_of(
+                ([length_predicate] if length_predicate is not None else [])
+                + item_predicates
+            )
+    else:
+        item_valid = _all_of(item_predicates) if item_predicates else None
+
+        def valid(value: Any) -> bool:
+            if length_predicate is not None and not length_predicate(value):
+                return False
+            if item_valid is not None:
+                for item in value:
+                    if item is not None and not item_valid(item):
+                        return False
+            return True
+
+    def report(value: Any, path: str, violations: list[dict[str, str]]) -> None:
+        if min_length is not None and len(value) < min_length:
+            violations.append({
+                "path": path,
+                "message": f"length must be at least {min_length}",
+            })
+        if max_length is not None and len(value) > max_length:
+            violations.append({
+                "path": path,
+                "message": f"length must be at most {max_length}",
+            })
+
+        items = (
+            [(f"{path}[{i}]", item) for i, item in enumerate(value)]
+            if is_list
+            else [(path, value)]
+        )
+        for item_path, item in items:
+            if item is None:
+                continue
+            if minimum is not None and item < minimum:
+                violations.append({
+                    "path": item_path,
+                    "message": f"must be at least {minimum}",
+                })
+            if maximum is not None and item > maximum:
+                violations.append({
+                    "path": item_path,
+                    "message": f"must be at most {maximum}",
+                })
+            for regex in regexes:
+                if regex.search(item) is None:
+                    violations.append({
+                        "path": item_path,
+                        "message": f"must match pattern {regex.pattern!r}",
+                    })
+            if nested is not None:
+                nested[1](item, item_path, violations)
+
+    return valid, report
+
+
+def _compile_input_object_validator(
+    input_type: Any, directive_name: str, schema: Any, memo: dict
+) -> Optional[Validator]:
+    """
+    Validator of an input object value, None if none of its (nested) input fields are constrained.
+    Recursive input objects are resolved through forwarding functions.
+    """
+    if input_type.name in memo:
+        return memo[input_type.name]
+
+    resolved: list[Validator] = []
+    memo[input_type.name] = (
+        lambda value: resolved[0][0](value),
+        lambda value, path, violations: resolved[0][1](value, path, violations),
+    )
+
+    field_validators = []
+    for field_name, field in input_type.fields.items():
+        inputs = [
+            application.arguments
+            for application in schema.directive_index.for_field(
+                input_type.name, field_name
+            )
+            if application.target_directive.name == directive_name
+        ]
+        _check_applicable(inputs, field.type, f"{input_type.name}.{field_name}")
+        field_type = get_named_type(field.type)
+        nested = (
+            _compile_input_object_validator(field_type, directive_name, schema, memo)
+            if is_input_object_type(field_type)
+            else None
+        )
+        if inputs or nested is not None:
+            field_validators.append((
+                field.out_name or field_name,
+                field_name,
+                *_compile_validator(inputs, _is_list(field.type), nested),
+            ))
+
+    if not field_validators:
+        resolved.append((_always_valid, _skip))
+        memo[input_type.name] = None
+        return None
+
+    def valid(value: Any) -> bool:
+        for out_name, _, field_valid, _ in field_validators:
+            field_value = value.get(out_name)
+            if field_value is not None and not field_valid(field_value):
+                return False
+        return True
+
+    def report(value: Any, path: str, violations: list[dict[str, str]]) -> None:
+        for out_name, field_name, _, field_report in field_validators:
+            field_value = value.get(out_name)
+            if field_value is not None:
+                field_report(field_value, f"{path}.{field_name}", violations)
+
+    resolved.append((valid, report))
+    memo[input_type.name] = (valid, report)
+    return valid, report
+
+
+def _is_list(type_: Any) -> bool:
+    return is_list_type(get_nullable_type(type_))
+
+
+def _is_constant(value_node: Any) -> bool:
+    if isinstance(value_node, VariableNode):
+        return False
+    if isinstance(value_node, ListValueNode):
+        return all(_is_constant(item) for item in value_node.values)
+    if isinstance(value_node, ObjectValueNode):
+        return all(_is_constant(field.value) for field in value_node.fields)
+    return True
+
+
+def _has_constant_arguments(field_node: Any) -> bool:
+    return all(_is_constant(argument.value) for argument in field_node.arguments or ())
+
+
+def _always_valid(_: Any) -> bool:
+    return True
+
+
+def _skip(*_: Any) -> None:
+    return None
+
+
+def ConstraintDirective(  # noqa
+    name: str = "constraint",
+    description: Optional[
+        str
+    ] = "Constrains the value of an argument or an input field.",
+) -> GraphQLDirective:
+    """
+    Creates an input constraint directive:
+        @constraint(min: Float, max: Float, minLength: Int, maxLength: Int, pattern: String)
+
+    Constraints are compiled at schema build time (regexes compiled once, bounds bound in closures)
+    into one validator per field, which checks all the coerced arguments before the resolver runs
+    and reports every violation together. Within a request, list and input object arguments of a field node
+    are checked once.
+
+    min, max and pattern apply to the value (or to each item of a list value),
+    minLength and maxLength apply to the length of the value. Patterns are searched, use ^ and $ to anchor.
+    min and max on non numeric values, and pattern on non string values, are rejected at build time.
+
+    :param name: directive name
+    :param description: directive description
+    """
+
+    store_key = f"@{name}"
+
+    def resolver_wrapper(
+        resolver: Callable,
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        _inputs: list[dict[str, Any]],
+        schema: Any,
+    ) -> Callable:
+        index = schema.directive_index
+        memo: dict[str, Optional[Validator]] = {}
+        argument_validators = []
+        # Lists and input objects are worth checking once per field node (see below)
+        structured = False
+
+        for arg_name, arg in parent_type.fields[field_name].args.items():
+            inputs = [
+                application.arguments
+                for application in index.for_argument(
+                    parent_type.name, field_name, arg_name
+                )
+                if application.target_directive.name == name
+            ]
+            _check_applicable(
+                inputs, arg.type, f"{parent_type.name}.{field_name}({arg_name}:)"
+            )
+            arg_type = get_named_type(arg.type)
+            nested = (
+                _compile_input_object_validator(arg_type, name, schema, memo)
+                if is_input_object_type(arg_type)
+                else None
+            )
+            if inputs or nested is not None:
+                is_list = _is_list(arg.type)
+                structured = structured or is_list or nested is not None
+                argument_validators.append((
+                    arg.out_name or arg_name,
+                    arg_name,
+                    *_compile_validator(inputs, is_list, nested),
+                ))
+
+        if not argument_validators:
+            return resolver
+
+        def violations_error(kwargs: dict[str, Any]) -> DirectiveConstraintError:
+            violations: list[dict[str, str]] = []
+            for out_name, arg_name, _, report in argument_validators:
+                value = kwargs.get(out_name)
+                if value is not None:
+                    report(value, arg_name, violations)
+            return DirectiveConstraintError(
+                f"Invalid arguments for {parent_type.name}.{field_name}",
+                extensions={"violations": violations},
+            )
+
+        predicates = tuple(
+            (out_name, valid) for out_name, _, valid, _ in argument_validators
+        )
+
+        def validate(kwargs: dict[str, Any]) -> None:
+            for out_name, valid in predicates:
+                value = kwargs.get(out_name)
+                if value is not None and not valid(value):
+                    raise violations_error(kwargs)
+
+        # Arguments written as literals only depend on the field node: once valid, they are valid for every
+        # request executing that node. The last such node is kept (with its document) and compared by identity.
+        constant_node = None
+
+        if not structured:
+
+            def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+                nonlocal constant_node
+                node = info.field_nodes[0]
+                if node is not constant_node:
+                    validate(kwargs)
+                    if _has_constant_arguments(node):
+                        constant_node = node
+                return resolver(root, info, **kwargs)
+
+            return resolve
+
+        def resolve_once_per_node(root: Any, info: Any, **kwargs: Any) -> Any:
+            nonlocal constant_node
+            node = info.field_nodes[0]
+            if node is constant_node:
+                return resolver(root, info, **kwargs)
+
+            # Arguments only depend on the field node and the variables, so within a request
+            # they are checked once per field node, not once per parent object of a list
+            store = get_request_store(info.context)
+            validated = store.get(store_key)
+            if validated is None:
+                validated = store[store_key] = set()
+
+            # Keyed on the node itself, not its id: the set keeps it alive, so no other node can alias it
+            if node not in validated:
+                validate(kwargs)
+                validated.add(node)
+                if _has_constant_arguments(node):
+                    constant_node = node
+            return resolver(root, info, **kwargs)
+
+        return resolve_once_per_node
+
+    return CustomDirective(
+        name=name,
+        locations=[
+            DirectiveLocation.ARGUMENT_DEFINITION,
+            DirectiveLocation.INPUT_FIELD_DEFINITION,
+        ],
+        args={
+            "min": GraphQLArgument(GraphQLFloat, description="Minimum value."),
+            "max": GraphQLArgument(GraphQLFloat, description="Maximum value."),
+            "min_length": GraphQLArgument(GraphQLInt, description="Minimum length."),
+            "max_length": GraphQLArgument(GraphQLInt, description="Maximum length."),
+            "pattern": GraphQLArgument(
+                GraphQLString, description="Regular expression to match."
+            ),
+        },
+        is_repeatable=True,
+        description=description,
+        resolver_wrapper=resolver_wrapper,
+    )
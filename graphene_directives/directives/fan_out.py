@@ -0,0 +1,210 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Hashable
+from inspect import isawaitable
+from typing import Any, Callable, Optional
+
+from graphql import GraphQLArgument, GraphQLDirective, GraphQLInt
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveValidationError
+
+FAN_OUT_DROP_POLICIES = ("oldest", "newest")
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _Subscriber:
+    __slots__ = ("queue", "wake")
+
+    def __init__(self) -> None:
+        self.queue: deque = deque()
+        self.wake = asyncio.Event()
+
+
+class _Topic:
+    """
+    A single upstream subscription shared by every subscriber of a (field, arguments) pair.
+    Each event is pushed to the bounded queue of every subscriber, the pump never waits for a subscriber.
+    """
+
+    __slots__ = (
+        "subscribers",
+        "queue_size",
+        "drop_newest",
+        "on_drop",
+        "task",
+        "done",
+        "error",
+    )
+
+    def __init__(
+        self, queue_size: int, drop_newest: bool, on_drop: Callable[[], None]
+    ) -> None:
+        self.subscribers: set[_Subscriber] = set()
+        self.queue_size = queue_size
+        self.drop_newest = drop_newest
+        self.on_drop = on_drop
+        self.task: Optional[asyncio.Task] = None
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+    def publish(self, item: Any) -> None:
+        for subscriber in self.subscribers:
+            queue = subscriber.queue
+            if len(queue) >= self.queue_size:
+                self.on_drop()
+                if self.drop_newest:
+                    continue
+                queue.popleft()
+            queue.append(item)
+            subscriber.wake.set()
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        self.done = True
+        self.error = error
+        for subscriber in self.subscribers:
+            subscriber.wake.set()
+
+    async def pump(
+        self, subscribe: Callable, root: Any, info: Any, kwargs: dict
+    ) -> None:
+        try:
+            source = subscribe(root, info, **kwargs)
+            if isawaitable(source):
+                source = await source
+            iterator = source.__aiter__()
+            try:
+                async for item in iterator:
+                    self.publish(item)
+            finally:
+                aclose = getattr(iterator, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        except asyncio.CancelledError:
+            self.close()
+            raise
+        except Exception as error:  # noqa: BLE001 forwarded to every subscriber
+            self.close(error)
+        else:
+            self.close()
+
+
+def FanOutDirective(  # noqa
+    queue_size: int = 100,
+    drop: str = "oldest",
+    on_drop: Optional[Callable[[str, str], None]] = None,
+    name: str = "fanOut",
+    description: Optional[
+        str
+    ] = "Shares one upstream subscription between identical subscriptions.",
+) -> GraphQLDirective:
+    """
+    Creates a subscription multiplexer: @fanOut(queueSize: Int)
+
+    Subscriptions to the same field with the same arguments share a single upstream subscribe call,
+    started by the first subscriber and torn down when the last one leaves.
+    Subscribers joining later only receive the events published after they joined.
+    The upstream is called with the root and info of the first subscriber, so fanned out fields must
+    not depend on the subscriber's context.
+    Every subscriber has a bounded queue (queueSize, or queue_size by default), when a slow subscriber's queue is full
+    its oldest event is dropped (drop="oldest") or the new event is not queued for it (drop="newest").
+
+    :param queue_size: default number of events queued per subscriber
+    :param drop: slow subscriber drop policy, oldest or newest
+    :param on_drop: called each time an event is dropped for a slow subscriber, to record a metric
+                def on_drop (type_name: str, field_name: str) -> None
+    :param name: directive name
+    :param description: directive description
+    """
+
+    if not isinstance(queue_size, int) or queue_size < 1:
+        raise DirectiveValidationError(f"@{name} queue_size must be a positive integer")
+    if drop not in FAN_OUT_DROP_POLICIES:
+        raise DirectiveValidationError(
+            f"@{name} drop must be one of {', '.join(FAN_OUT_DROP_POLICIES)}"
+        )
+
+    def subscribe_wrapper(
+        subscribe: Optional[Callable],
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        inputs: list[dict[str, Any]],
+        _schema: Any,
+    ) -> Callable:
+        if subscribe is None:
+            raise DirectiveValidationError(
+                f"@{name} can only be used on subscription fields, at {parent_type.name}.{field_name}"
+            )
+
+        size = inputs[-1].get("queue_size") or queue_size
+        if size < 1:
+            raise DirectiveValidationError(
+                f"@{name} queueSize must be positive, at {parent_type.name}.{field_name}"
+            )
+
+        def dropped() -> None:
+            if on_drop is not None:
+                on_drop(parent_type.name, field_name)
+
+        topics: dict[Hashable, _Topic] = {}
+
+        def join(key: Hashable, root: Any, info: Any, kwargs: dict) -> _Topic:
+            topic = topics.get(key)
+            if topic is None or topic.done:
+                topic = _Topic(size, drop == "newest", dropped)
+                topics[key] = topic
+                topic.task = asyncio.ensure_future(
+                    topic.pump(subscribe, root, info, kwargs)
+                )
+            return topic
+
+        def leave(key: Hashable, topic: _Topic, subscriber: _Subscriber) -> None:
+            topic.subscribers.discard(subscriber)
+            if topic.subscribers:
+                return
+            if topics.get(key) is topic:
+                del topics[key]
+            if topic.task is not None and not topic.task.done():
+                topic.task.cancel()
+
+        async def fan_out(root: Any, info: Any, **kwargs: Any) -> AsyncIterator:
+            key = _freeze(kwargs)
+            topic = join(key, root, info, kwargs)
+            subscriber = _Subscriber()
+            topic.subscribers.add(subscriber)
+            try:
+                while True:
+                    if subscriber.queue:
+                        yield subscriber.queue.popleft()
+                        continue
+                    if topic.done:
+                        if topic.error is not None:
+                            raise topic.error
+                        return
+                    subscriber.wake.clear()
+                    await subscriber.wake.wait()
+            finally:
+                leave(key, topic, subscriber)
+
+        return fan_out
+
+    return CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "queue_size": GraphQLArgument(
+                GraphQLInt, description="Number of events queued per subscriber."
+            )
+        },
+        description=description,
+        subscribe_wrapper=subscribe_wrapper,
+    )
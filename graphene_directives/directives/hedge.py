@@ -0,0 +1,165 @@
+import asyncio
+from array import array
+from bisect import bisect_left
+from inspect import isawaitable
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from graphql import GraphQLArgument, GraphQLDirective, GraphQLInt
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveValidationError
+
+# Geometric bucket upper bounds, from 50us to ~70s, in seconds
+_BUCKET_BOUNDS = tuple(0.00005 * 1.25**i for i in range(64))
+
+
+class _LatencyHistogram:
+    """
+    Compact latency histogram with geometric buckets (~25% resolution).
+    Counts are halved every window samples, so old latencies fade out.
+    """
+
+    __slots__ = ("counts", "total", "window")
+
+    def __init__(self, window: int) -> None:
+        self.counts = array("I", bytes(4 * len(_BUCKET_BOUNDS)))
+        self.total = 0
+        self.window = window
+
+    def record(self, seconds: float) -> None:
+        self.counts[
+            min(bisect_left(_BUCKET_BOUNDS, seconds), len(self.counts) - 1)
+        ] += 1
+        self.total += 1
+        if self.total >= self.window:
+            for i, count in enumerate(self.counts):
+                self.counts[i] = count >> 1
+            self.total = sum(self.counts)
+
+    def quantile(self, q: float) -> float:
+        rank = q * self.total
+        seen = 0
+        for bound, count in zip(_BUCKET_BOUNDS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return _BUCKET_BOUNDS[-1]
+
+
+async def _await(result: Any) -> Any:
+    if isawaitable(result):
+        return await result
+    return result
+
+
+def HedgeDirective(  # noqa
+    after_ms: int = 100,
+    percentile: float = 0.95,
+    min_samples: int = 20,
+    window: int = 1000,
+    name: str = "hedge",
+    description: Optional[str] = "Hedges slow resolutions of an idempotent field.",
+) -> GraphQLDirective:
+    """
+    Creates a hedged resolution directive for idempotent async fields: @hedge(afterMs: Int, maxExtra: Int)
+
+    When a resolution has not completed after the hedge delay, a duplicate resolution is started
+    (up to maxExtra, default 1, one more after each delay), the first successful result is used
+    and the others are cancelled.
+    The hedge delay is the percentile of the field's observed latencies, kept in a compact per-field histogram,
+    capped at afterMs. afterMs (or after_ms by default) is used until min_samples latencies were observed.
+    Synchronous results are returned as is.
+
+    :param after_ms: default maximum hedge delay, in milliseconds
+    :param percentile: latency percentile used as hedge delay, between 0 and 1
+    :param min_samples: number of observed latencies before the adaptive delay is used
+    :param window: number of samples after which the histogram counts are halved
+    :param name: directive name
+    :param description: directive description
+    """
+
+    if not 0 < percentile <= 1:
+        raise DirectiveValidationError(f"@{name} percentile must be in ]0, 1]")
+    if not isinstance(window, int) or window < 2:
+        raise DirectiveValidationError(f"@{name} window must be an integer >= 2")
+
+    def resolver_wrapper(
+        resolver: Callable,
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        inputs: list[dict[str, Any]],
+        _schema: Any,
+    ) -> Callable:
+        max_delay = inputs[-1].get("after_ms")
+        max_delay = (after_ms if max_delay is None else max_delay) / 1000
+        max_extra = inputs[-1].get("max_extra")
+        max_extra = 1 if max_extra is None else max_extra
+        if max_delay < 0 or max_extra < 0:
+            raise DirectiveValidationError(
+                f"@{name} afterMs and maxExtra must not be negative, at {parent_type.name}.{field_name}"
+            )
+
+        histogram = _LatencyHistogram(window)
+
+        def hedge_delay() -> float:
+            if histogram.total < min_samples:
+                return max_delay
+            return min(histogram.quantile(percentile), max_delay)
+
+        async def hedged(first: Any, root: Any, info: Any, kwargs: dict) -> Any:
+            started = {}
+
+            def start(result: Any) -> None:
+                task = asyncio.ensure_future(_await(result))
+                started[task] = perf_counter()
+
+            start(first)
+            pending = set(started)
+            extra = max_extra
+            error = None
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=hedge_delay() if extra else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for task in done:
+                        if task.exception() is None:
+                            histogram.record(perf_counter() - started[task])
+                            return task.result()
+                        error = error or task.exception()
+                    if not done and extra:
+                        extra -= 1
+                        start(resolver(root, info, **kwargs))
+                        pending = {task for task in started if not task.done()}
+                raise error
+            finally:
+                for task in started:
+                    task.cancel()
+
+        def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+            result = resolver(root, info, **kwargs)
+            if not isawaitable(result):
+                return result
+            return hedged(result, root, info, kwargs)
+
+        return resolve
+
+    return CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "after_ms": GraphQLArgument(
+                GraphQLInt, description="Maximum delay before hedging, in milliseconds."
+            ),
+            "max_extra": GraphQLArgument(
+                GraphQLInt, description="Maximum number of duplicate resolutions."
+            ),
+        },
+        description=description,
+        resolver_wrapper=resolver_wrapper,
+    )
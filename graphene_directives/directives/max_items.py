@@ -0,0 +1,132 @@
+from collections.abc import AsyncIterator, Iterator
+from inspect import isawaitable
+from typing import Any, Callable, Optional
+
+from graphql import (
+    GraphQLArgument,
+    GraphQLBoolean,
+    GraphQLDirective,
+    GraphQLInt,
+    GraphQLNonNull,
+    get_nullable_type,
+    is_list_type,
+)
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveMaxItemsError, DirectiveValidationError
+
+
+def _limit_iterator(items: Any, limit: int, exceeded: Callable[[], None]) -> Iterator:
+    iterator = iter(items)
+    try:
+        for count, item in enumerate(iterator):
+            if count == limit:
+                exceeded()
+                break
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+async def _limit_async_iterator(
+    items: Any, limit: int, exceeded: Callable[[], None]
+) -> AsyncIterator:
+    iterator = items.__aiter__()
+    try:
+        count = 0
+        async for item in iterator:
+            if count == limit:
+                exceeded()
+                break
+            count += 1
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def MaxItemsDirective(  # noqa
+    on_exceeded: Optional[Callable[[str, str, int], None]] = None,
+    name: str = "maxItems",
+    description: Optional[str] = "Limits the number of items of a list field.",
+) -> GraphQLDirective:
+    """
+    Creates a result size guard for list fields: @maxItems(limit: Int!, reject: Boolean = false)
+
+    Results longer than limit are truncated, or rejected with a MAX_ITEMS_EXCEEDED error when reject is set.
+    Lists and tuples are sliced, generators and (async) iterators are wrapped lazily and never
+    materialized: at most limit + 1 items are pulled from them, then the source is closed.
+
+    :param on_exceeded: called each time a guard fires, to record a metric
+                def on_exceeded (type_name: str, field_name: str, limit: int) -> None
+    :param name: directive name
+    :param description: directive description
+    """
+
+    def resolver_wrapper(
+        resolver: Callable,
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        inputs: list[dict[str, Any]],
+        _schema: Any,
+    ) -> Callable:
+        if not is_list_type(get_nullable_type(parent_type.fields[field_name].type)):
+            raise DirectiveValidationError(
+                f"@{name} can only be used on list fields, at {parent_type.name}.{field_name}"
+            )
+
+        limit = inputs[-1]["limit"]
+        reject = inputs[-1].get("reject") or False
+
+        def exceeded() -> None:
+            if on_exceeded is not None:
+                on_exceeded(parent_type.name, field_name, limit)
+            if reject:
+                raise DirectiveMaxItemsError(
+                    f"{parent_type.name}.{field_name} returned more than {limit} items",
+                    extensions={"limit": limit},
+                )
+
+        def limit_result(result: Any) -> Any:
+            if isinstance(result, (list, tuple)):
+                if len(result) > limit:
+                    exceeded()
+                    return result[:limit]
+                return result
+            if hasattr(result, "__aiter__"):
+                return _limit_async_iterator(result, limit, exceeded)
+            if result is None or isinstance(result, (str, bytes, dict)):
+                return result
+            return _limit_iterator(result, limit, exceeded)
+
+        async def limit_awaitable(result: Any) -> Any:
+            return limit_result(await result)
+
+        def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+            result = resolver(root, info, **kwargs)
+            if isawaitable(result):
+                return limit_awaitable(result)
+            return limit_result(result)
+
+        return resolve
+
+    return CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "limit": GraphQLArgument(
+                GraphQLNonNull(GraphQLInt), description="Maximum number of items."
+            ),
+            "reject": GraphQLArgument(
+                GraphQLBoolean,
+                description="Reject (instead of truncating) results over the limit.",
+            ),
+        },
+        description=description,
+        resolver_wrapper=resolver_wrapper,
+    )
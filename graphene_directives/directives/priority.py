@@ -0,0 +1,179 @@
+import asyncio
+import threading
+from typing import Any, Callable, Optional
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    GraphQLArgument,
+    GraphQLDirective,
+    GraphQLInt,
+    GraphQLNonNull,
+    is_object_type,
+)
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveLoadSheddingError
+
+
+class InFlightRequests:
+    """
+    Load signal: number of requests being executed.
+
+    Wrap the execution of each request with it:
+        with in_flight:
+            result = schema.execute(...)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "InFlightRequests":
+        with self._lock:
+            self.count += 1
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        with self._lock:
+            self.count -= 1
+
+    def __call__(self) -> float:
+        return self.count
+
+
+class EventLoopLag:
+    """
+    Load signal: event loop lag in seconds, sampled by a task sleeping for `interval` seconds.
+
+    Call start() from the running event loop, and stop() on shutdown.
+    """
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._sample())
+        return self._task
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag = max(0.0, loop.time() - start - self.interval)
+
+    def __call__(self) -> float:
+        return self.lag
+
+
+def get_priority_table(
+    schema: Any, priority_directive: GraphQLDirective
+) -> dict[tuple[str, str], int]:
+    """
+    Priority level of every (type_name, field_name) reached by the priority directive,
+    with the precedence of the resolver wrappers: a field level application overrides the type level one,
+    which overrides the ones inherited from interfaces and unions (inherited_directives).
+    """
+    index = schema.directive_index
+    inherited = schema.inherited_directives
+    table = {}
+    for type_name, entity_type in schema.graphql_schema.type_map.items():
+        if not is_object_type(entity_type):
+            continue
+        type_levels = [
+            application.arguments["level"]
+            for application in index.for_type(type_name)
+            if application.target_directive is priority_directive
+        ]
+        for field_name in entity_type.fields:
+            levels = [
+                application.arguments["level"]
+                for application in inherited.get((type_name, field_name), ())
+                if application.target_directive is priority_directive
+            ]
+            levels += type_levels
+            levels += [
+                application.arguments["level"]
+                for application in index.for_field(type_name, field_name)
+                if application.target_directive is priority_directive
+            ]
+            if levels:
+                table[(type_name, field_name)] = levels[-1]
+    return table
+
+
+def PriorityDirective(  # noqa
+    load_signal: Callable[[], float],
+    thresholds: dict[int, float],
+    name: str = "priority",
+    description: Optional[str] = "Priority level of the field, used for load shedding.",
+) -> GraphQLDirective:
+    """
+    Creates a load shedding directive: @priority(level: Int!)
+
+    While load_signal() is above the threshold of a field's priority level, the field resolves
+    to null with a LOAD_SHED error instead of running its resolver. The level of each field (see get_priority_table,
+    interface and union applications included) is resolved at schema build time, so the per call
+    decision is a single comparison. Fields without a priority, or whose level has no threshold,
+    are not wrapped.
+
+    :param load_signal: returns the current load, e.g. InFlightRequests(), EventLoopLag() or any callable
+    :param thresholds: priority level -> load above which fields of that level are shed
+    :param name: directive name
+    :param description: directive description
+    """
+
+    def resolver_wrapper(
+        resolver: Callable,
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        _inputs: list[dict[str, Any]],
+        schema: Any,
+    ) -> Callable:
+        # One table per schema and directive index, shared by the wrappers of every field
+        index, table = priority_tables.get(schema, (None, None))
+        if index is not schema.directive_index:
+            index, table = priority_tables[schema] = (
+                schema.directive_index,
+                get_priority_table(schema, priority_directive),
+            )
+        level = table.get((parent_type.name, field_name))
+        threshold = thresholds.get(level)
+        if threshold is None:
+            return resolver
+
+        def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+            load = load_signal()
+            if load > threshold:
+                raise DirectiveLoadSheddingError(
+                    f"{parent_type.name}.{field_name} was shed under load",
+                    extensions={"priority": level, "load": load},
+                )
+            return resolver(root, info, **kwargs)
+
+        return resolve
+
+    priority_tables: WeakKeyDictionary = WeakKeyDictionary()
+
+    priority_directive = CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "level": GraphQLArgument(
+                GraphQLNonNull(GraphQLInt), description="Priority level."
+            )
+        },
+        description=description,
+        resolver_wrapper=resolver_wrapper,
+    )
+    return priority_directive
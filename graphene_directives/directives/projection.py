@@ -0,0 +1,215 @@
+import weakref
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLArgument,
+    GraphQLDirective,
+    GraphQLIncludeDirective,
+    GraphQLNonNull,
+    GraphQLResolveInfo,
+    GraphQLSkipDirective,
+    GraphQLString,
+    InlineFragmentNode,
+    SelectionSetNode,
+    VariableNode,
+    get_named_type,
+)
+from graphql.execution.values import get_directive_values
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveValidationError
+from ..utils import get_graphene_schema
+
+# id(operation node) -> (weak reference to the operation node,
+#   GraphQLSchema -> {(id(field node), path, return type, directive name): (field node, columns)}),
+# entries go away with the operation or the schema: a document can be executed against several schemas.
+# AST nodes hash and compare by structure, equal nodes of two documents may spread different fragments,
+# so nodes are keyed by identity (the memo keeps the field nodes alive, their ids are not reused)
+_selected_columns_memo: dict[int, tuple[weakref.ref, WeakKeyDictionary]] = {}
+
+
+def _operation_memo(operation: Any) -> WeakKeyDictionary:
+    operation_id = id(operation)
+    entry = _selected_columns_memo.get(operation_id)
+    if entry is None or entry[0]() is not operation:
+        entry = _selected_columns_memo[operation_id] = (
+            weakref.ref(
+                operation,
+                lambda _, key=operation_id: _selected_columns_memo.pop(key, None),
+            ),
+            WeakKeyDictionary(),
+        )
+    return entry[1]
+
+
+def ColumnDirective(  # noqa
+    name: str = "column", description: Optional[str] = "Backing column of the field."
+) -> GraphQLDirective:
+    """
+    Creates a projection directive: @column(name: String!)
+
+    Resolvers call get_selected_columns(info) to fetch only the columns backing the selected fields.
+    Repeat the directive for fields computed from several columns.
+
+    :param name: directive name
+    :param description: directive description
+    """
+    return CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "name": GraphQLArgument(
+                GraphQLNonNull(GraphQLString), description="Column (or path) name."
+            )
+        },
+        is_repeatable=True,
+        description=description,
+    )
+
+
+def _uses_variables(node: Any) -> bool:
+    return any(
+        isinstance(argument.value, VariableNode)
+        for directive in node.directives or ()
+        if directive.name.value in ("skip", "include")
+        for argument in directive.arguments or ()
+    )
+
+
+def _is_included(node: Any, info: GraphQLResolveInfo) -> bool:
+    skip = get_directive_values(GraphQLSkipDirective, node, info.variable_values)
+    if skip and skip["if"] is True:
+        return False
+    include = get_directive_values(GraphQLIncludeDirective, node, info.variable_values)
+    return not (include and include["if"] is False)
+
+
+def _collect_columns(
+    info: GraphQLResolveInfo,
+    index: Any,
+    directive_name: str,
+    parent_type: Any,
+    selection_set: SelectionSetNode,
+    prefix: str,
+    columns: set[str],
+) -> bool:
+    """
+    Add the columns backing the selections to columns, descending into the object fields without a column.
+    Returns False if the result depends on variables (@skip / @include) and can't be memoized.
+    """
+    cacheable = True
+    fields = getattr(parent_type, "fields", {})
+
+    for selection in selection_set.selections:
+        if _uses_variables(selection):
+            cacheable = False
+        if not _is_included(selection, info):
+            continue
+
+        if isinstance(selection, FieldNode):
+            field_name = selection.name.value
+            field = fields.get(field_name)
+            if field is None:  # __typename
+                continue
+
+            backing_columns = [
+                application.arguments["name"]
+                for application in index.for_field(parent_type.name, field_name)
+                if application.target_directive.name == directive_name
+            ]
+            if backing_columns:
+                columns.update(prefix + column for column in backing_columns)
+            elif selection.selection_set is not None:
+                cacheable &= _collect_columns(
+                    info,
+                    index,
+                    directive_name,
+                    get_named_type(field.type),
+                    selection.selection_set,
+                    f"{prefix}{field_name}.",
+                    columns,
+                )
+            continue
+
+        if isinstance(selection, InlineFragmentNode):
+            fragment = selection
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = info.fragments[selection.name.value]
+        else:
+            continue
+
+        fragment_type = (
+            info.schema.get_type(fragment.type_condition.name.value)
+            if fragment.type_condition is not None
+            else parent_type
+        )
+        cacheable &= _collect_columns(
+            info,
+            index,
+            directive_name,
+            fragment_type,
+            fragment.selection_set,
+            prefix,
+            columns,
+        )
+
+    return cacheable
+
+
+def get_selected_columns(
+    info: GraphQLResolveInfo, directive_name: str = "column"
+) -> frozenset[str]:
+    """
+    Columns backing the fields selected under the field being resolved.
+
+    Fields annotated with @column contribute their column names, selected object fields without a column
+    are descended into and contribute "field.column" paths. Results are memoized per (document, path)
+    and schema, unless the selection depends on variables.
+
+    :param info: resolve info of the field being resolved
+    :param directive_name: name of the column directive
+    """
+    schema = get_graphene_schema(info.schema)
+    if schema is None:
+        raise DirectiveValidationError(
+            "get_selected_columns requires a schema built by graphene_directives"
+        )
+
+    field_node = info.field_nodes[0]
+    return_type = get_named_type(info.return_type)
+    key = (
+        id(field_node),
+        tuple(key for key in info.path.as_list() if isinstance(key, str)),
+        return_type.name,
+        directive_name,
+    )
+
+    memo = _operation_memo(info.operation).get(info.schema)
+    cached = None if memo is None else memo.get(key)
+    if cached is not None and cached[0] is field_node:
+        return cached[1]
+
+    columns: set[str] = set()
+    cacheable = True
+    for node in info.field_nodes:
+        if node.selection_set is not None:
+            cacheable &= _collect_columns(
+                info,
+                schema.directive_index,
+                directive_name,
+                return_type,
+                node.selection_set,
+                "",
+                columns,
+            )
+
+    result = frozenset(columns)
+    if cacheable:
+        if memo is None:
+            memo = _operation_memo(info.operation).setdefault(info.schema, {})
+        memo[key] = (field_node, result)
+    return result
@@ -0,0 +1,181 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Hashable
+from time import monotonic
+from typing import Any, Callable, Optional
+
+from graphql import (
+    GraphQLArgument,
+    GraphQLDirective,
+    GraphQLFloat,
+    GraphQLInt,
+    GraphQLNonNull,
+    GraphQLString,
+)
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveRateLimitError, DirectiveValidationError
+
+
+class RateLimitStore(ABC):
+    """
+    Storage of the token buckets: maps a bucket key to its (tokens, updated_at) state.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[tuple[float, float]]:
+        """
+        The state of a bucket, None when unknown.
+        """
+
+    @abstractmethod
+    def set(self, key: Hashable, state: tuple[float, float]) -> None:
+        """
+        Store the state of a bucket.
+        """
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """
+    Bounded in-memory store, the least recently used buckets are evicted past max_keys.
+    An evicted bucket is full when it comes back, so only idle keys should be evicted.
+    Safe to share between threads.
+    """
+
+    def __init__(self, max_keys: int = 10_000):
+        if max_keys < 1:
+            raise DirectiveValidationError("max_keys must be positive")
+        self.max_keys = max_keys
+        self.buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+        # Reading then moving a bucket is not atomic, a concurrent set could evict it in between
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.buckets)
+
+    def get(self, key: Hashable) -> Optional[tuple[float, float]]:
+        with self._lock:
+            state = self.buckets.get(key)
+            if state is not None:
+                self.buckets.move_to_end(key)
+        return state
+
+    def set(self, key: Hashable, state: tuple[float, float]) -> None:
+        with self._lock:
+            self.buckets[key] = state
+            if len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+
+
+def RateLimitDirective(  # noqa
+    get_client: Optional[Callable[[Any], Hashable]] = None,
+    store: Optional[RateLimitStore] = None,
+    clock: Callable[[], float] = monotonic,
+    name: str = "rateLimit",
+    description: Optional[str] = "Limits the rate at which a field can be resolved.",
+) -> GraphQLDirective:
+    """
+    Creates a token bucket rate limit: @rateLimit(perSecond: Float!, burst: Int, key: String)
+
+    Each resolution takes a token from a bucket refilled at perSecond tokens per second, holding at most burst
+    tokens (default max(1, perSecond)). Resolutions finding the bucket empty fail with a RATE_LIMITED error.
+    key selects the bucket of a resolution:
+        field (default): one bucket per field
+        client: one bucket per field and client, as returned by get_client
+        any argument name of the field: one bucket per field and argument value
+
+    :param get_client: returns the client of the request, required for key: "client"
+                def get_client (info: GraphQLResolveInfo) -> Hashable
+    :param store: bucket storage, defaults to an InMemoryRateLimitStore
+    :param clock: monotonic clock in seconds
+    :param name: directive name
+    :param description: directive description
+    """
+
+    buckets = InMemoryRateLimitStore() if store is None else store
+
+    def resolver_wrapper(
+        resolver: Callable,
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        inputs: list[dict[str, Any]],
+        _schema: Any,
+    ) -> Callable:
+        rate = inputs[-1]["per_second"]
+        burst = inputs[-1].get("burst")
+        burst = max(1.0, rate) if burst is None else burst
+        key = inputs[-1].get("key") or "field"
+        location = f"{parent_type.name}.{field_name}"
+        if rate <= 0 or burst < 1:
+            raise DirectiveValidationError(
+                f"@{name} perSecond must be positive and burst at least 1, at {location}"
+            )
+
+        def take(bucket_key: Hashable) -> None:
+            now = clock()
+            state = buckets.get(bucket_key)
+            tokens = (
+                burst
+                if state is None
+                else min(burst, state[0] + (now - state[1]) * rate)
+            )
+            if tokens < 1:
+                buckets.set(bucket_key, (tokens, now))
+                raise DirectiveRateLimitError(
+                    f"Rate limit exceeded for {location}",
+                    extensions={"retryAfter": (1 - tokens) / rate},
+                )
+            buckets.set(bucket_key, (tokens - 1, now))
+
+        if key == "field":
+
+            def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+                take(location)
+                return resolver(root, info, **kwargs)
+
+        elif key == "client":
+            if get_client is None:
+                raise DirectiveValidationError(
+                    f"@{name} key client requires get_client, at {location}"
+                )
+
+            def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+                take((location, get_client(info)))
+                return resolver(root, info, **kwargs)
+
+        else:
+            arguments = parent_type.fields[field_name].args
+            if key not in arguments:
+                raise DirectiveValidationError(
+                    f"@{name} key must be field, client or an argument name, at {location}"
+                )
+            argument = arguments[key].out_name or key
+
+            def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+                value = kwargs.get(argument)
+                take((location, value if isinstance(value, Hashable) else repr(value)))
+                return resolver(root, info, **kwargs)
+
+        return resolve
+
+    return CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "per_second": GraphQLArgument(
+                GraphQLNonNull(GraphQLFloat), description="Tokens added per second."
+            ),
+            "burst": GraphQLArgument(
+                GraphQLInt, description="Maximum number of tokens of a bucket."
+            ),
+            "key": GraphQLArgument(
+                GraphQLString,
+                description="field (default), client or an argument name.",
+            ),
+        },
+        description=description,
+        resolver_wrapper=resolver_wrapper,
+    )
@@ -0,0 +1,161 @@
+import asyncio
+import math
+import threading
+import time
+from inspect import isawaitable
+from typing import Any, Callable, Optional
+
+from graphql import GraphQLArgument, GraphQLBoolean, GraphQLDirective, GraphQLFloat
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveValidationError
+
+
+async def _await(value: Any) -> Any:
+    return await value
+
+
+class _StaticValue:
+    __slots__ = ("value", "ready", "lock", "expires", "refreshing")
+
+    def __init__(self) -> None:
+        self.value = None
+        self.ready = False
+        self.lock = threading.Lock()
+        self.expires = math.inf
+        self.refreshing = False
+
+
+def _refresh(
+    compute: Callable[[], Any],
+    cell: _StaticValue,
+    interval: float,
+    on_error: Optional[Callable[[Exception], None]],
+) -> None:
+    try:
+        value = compute()
+        if isawaitable(value):
+            value = asyncio.run(_await(value))
+    except Exception as error:  # noqa: BLE001 the previous value is kept
+        if on_error is not None:
+            on_error(error)
+    else:
+        cell.value = value
+    finally:
+        cell.expires = time.monotonic() + interval
+        cell.refreshing = False
+
+
+def StaticDirective(  # noqa
+    on_refresh_error: Optional[Callable[[Exception], None]] = None,
+    name: str = "static",
+    description: Optional[
+        str
+    ] = "The field's value is computed once and shared by every request.",
+) -> GraphQLDirective:
+    """
+    Creates a constant field directive: @static(lazy: Boolean, refreshSeconds: Float)
+
+    The field's resolver is called once, with None as root and info, when the schema is built (or on the first
+    resolution when lazy is set), every resolution then returns the stored value.
+    Async resolvers must be lazy. The field must not have arguments.
+    With refreshSeconds, the first resolution after the value expired starts a background thread which
+    recomputes the value and swaps it in (async resolvers are run in their own event loop on that thread),
+    requests are never blocked: they get the previous value meanwhile, and keep it when a refresh fails.
+    Nothing runs while the field is not resolved, and no thread outlives a refresh.
+
+    :param on_refresh_error: called with the exception raised by a failed refresh
+    :param name: directive name
+    :param description: directive description
+    """
+
+    def resolver_wrapper(
+        resolver: Callable,
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        inputs: list[dict[str, Any]],
+        _schema: Any,
+    ) -> Callable:
+        location = f"{parent_type.name}.{field_name}"
+        if parent_type.fields[field_name].args:
+            raise DirectiveValidationError(
+                f"@{name} can only be used on fields without arguments, at {location}"
+            )
+
+        lazy = inputs[-1].get("lazy") or False
+        interval = inputs[-1].get("refresh_seconds")
+        if interval is not None and interval <= 0:
+            raise DirectiveValidationError(
+                f"@{name} refreshSeconds must be positive, at {location}"
+            )
+
+        cell = _StaticValue()
+
+        def compute() -> Any:
+            # Not resolved for a request: there is no root nor info to pass
+            return resolver(None, None)
+
+        def start_refresh() -> None:
+            with cell.lock:
+                if cell.refreshing or time.monotonic() < cell.expires:
+                    return
+                cell.refreshing = True
+            threading.Thread(
+                target=_refresh,
+                args=(compute, cell, interval, on_refresh_error),
+                name=f"@{name} {location}",
+                daemon=True,
+            ).start()
+
+        def store(value: Any) -> Any:
+            with cell.lock:
+                if not cell.ready:
+                    cell.value = value
+                    cell.ready = True
+                    if interval is not None:
+                        cell.expires = time.monotonic() + interval
+            return cell.value
+
+        async def store_awaitable(value: Any) -> Any:
+            return store(await value)
+
+        if not lazy:
+            value = compute()
+            if isawaitable(value):
+                close = getattr(value, "close", None)
+                if close is not None:
+                    close()
+                raise DirectiveValidationError(
+                    f"@{name} async resolvers must be lazy, at {location}"
+                )
+            store(value)
+
+        def resolve(_root: Any, _info: Any, **_kwargs: Any) -> Any:
+            if cell.ready:
+                if time.monotonic() >= cell.expires:
+                    start_refresh()
+                return cell.value
+            value = compute()
+            if isawaitable(value):
+                return store_awaitable(value)
+            return store(value)
+
+        return resolve
+
+    return CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "lazy": GraphQLArgument(
+                GraphQLBoolean,
+                description="Compute the value on the first resolution instead of at build.",
+            ),
+            "refresh_seconds": GraphQLArgument(
+                GraphQLFloat, description="Interval at which the value is recomputed."
+            ),
+        },
+        description=description,
+        resolver_wrapper=resolver_wrapper,
+    )
@@ -0,0 +1,166 @@
+import asyncio
+from collections import deque
+from contextlib import suppress
+from collections.abc import AsyncIterator
+from inspect import isawaitable
+from typing import Any, Callable, Optional
+
+from graphql import (
+    GraphQLArgument,
+    GraphQLDirective,
+    GraphQLInt,
+    GraphQLNonNull,
+    GraphQLString,
+    get_nullable_type,
+    is_list_type,
+)
+
+from ..constants import DirectiveLocation
+from ..directive import CustomDirective
+from ..exceptions import DirectiveValidationError
+
+THROTTLE_STRATEGIES = ("latest", "batch")
+
+
+async def _throttle(
+    source: Any, interval: float, maxlen: int, as_list: bool
+) -> AsyncIterator:
+    """
+    Emits the first event of a burst immediately, then at most one emission per interval:
+    the latest buffered event, or the buffered events as a list when as_list is set.
+    The buffer holds at most maxlen events, older ones are dropped.
+    """
+    iterator = source.__aiter__()
+    loop = asyncio.get_running_loop()
+    buffer: deque = deque(maxlen=maxlen)
+    window_end = loop.time()
+    pending: Optional[asyncio.Future] = None
+
+    def flush() -> Any:
+        items = list(buffer) if as_list else buffer[-1]
+        buffer.clear()
+        return items
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+            timeout = None
+            if buffer:
+                timeout = window_end - loop.time()
+                if timeout <= 0:
+                    window_end = loop.time() + interval
+                    yield flush()
+                    continue
+
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                continue
+
+            task, pending = pending, None
+            try:
+                item = task.result()
+            except StopAsyncIteration:
+                break
+
+            if not buffer and loop.time() >= window_end:
+                window_end = loop.time() + interval
+                yield [item] if as_list else item
+            else:
+                buffer.append(item)
+
+        if buffer:
+            yield flush()
+    finally:
+        if pending is not None:
+            # The source can only be closed once its pending __anext__ has finished
+            pending.cancel()
+            with suppress(asyncio.CancelledError, StopAsyncIteration):
+                await pending
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def ThrottleDirective(  # noqa
+    max_batch: int = 100,
+    name: str = "throttle",
+    description: Optional[str] = "Throttles the events of a subscription field.",
+) -> GraphQLDirective:
+    """
+    Creates a subscription throttle: @throttle(ms: Int!, strategy: String)
+
+    The first event of a burst is emitted immediately, following events are buffered and
+    flushed at most once every ms milliseconds.
+    With the latest strategy (default) only the last buffered event is emitted, intermediate ones are dropped.
+    With the batch strategy the buffered events are emitted as a list, the field type must then be a list.
+    Each subscriber buffers at most max_batch events (one with the latest strategy), the oldest are dropped.
+
+    :param max_batch: maximum number of events buffered per subscriber with the batch strategy
+    :param name: directive name
+    :param description: directive description
+    """
+
+    if not isinstance(max_batch, int) or max_batch < 1:
+        raise DirectiveValidationError(f"@{name} max_batch must be a positive integer")
+
+    def subscribe_wrapper(
+        subscribe: Optional[Callable],
+        parent_type: Any,
+        field_name: str,
+        _field_type: Any,
+        inputs: list[dict[str, Any]],
+        _schema: Any,
+    ) -> Optional[Callable]:
+        if subscribe is None:
+            raise DirectiveValidationError(
+                f"@{name} can only be used on subscription fields, at {parent_type.name}.{field_name}"
+            )
+
+        ms = inputs[-1]["ms"]
+        strategy = inputs[-1].get("strategy") or "latest"
+        if ms <= 0:
+            raise DirectiveValidationError(
+                f"@{name} ms must be positive, at {parent_type.name}.{field_name}"
+            )
+        if strategy not in THROTTLE_STRATEGIES:
+            raise DirectiveValidationError(
+                f"@{name} strategy must be one of {', '.join(THROTTLE_STRATEGIES)}, at {parent_type.name}.{field_name}"
+            )
+
+        as_list = strategy == "batch"
+        if as_list and not is_list_type(
+            get_nullable_type(parent_type.fields[field_name].type)
+        ):
+            raise DirectiveValidationError(
+                f"@{name} batch strategy can only be used on list fields, at {parent_type.name}.{field_name}"
+            )
+
+        interval = ms / 1000
+        maxlen = max_batch if as_list else 1
+
+        async def throttled(root: Any, info: Any, **kwargs: Any) -> AsyncIterator:
+            source = subscribe(root, info, **kwargs)
+            if isawaitable(source):
+                source = await source
+            return _throttle(source, interval, maxlen, as_list)
+
+        return throttled
+
+    return CustomDirective(
+        name=name,
+        locations=[DirectiveLocation.FIELD_DEFINITION],
+        args={
+            "ms": GraphQLArgument(
+                GraphQLNonNull(GraphQLInt),
+                description="Minimum interval between two emissions, in milliseconds.",
+            ),
+            "strategy": GraphQLArgument(
+                GraphQLString,
+                description="latest (default) drops intermediate events, batch emits them as a list.",
+            ),
+        },
+        description=description,
+        subscribe_wrapper=subscribe_wrapper,
+    )
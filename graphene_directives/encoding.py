@@ -0,0 +1,38 @@
+import gzip
+import zlib
+
+from .exceptions import DirectiveValidationError
+
+SDL_ENCODINGS = ("identity", "gzip", "deflate", "zstd")
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    try:
+        from compression import zstd  # Python 3.14+
+
+        return zstd.compress(data)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise DirectiveValidationError(
+            "zstd encoding requires Python 3.14+ or the zstandard package"
+        ) from None
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Compress bytes with a HTTP content coding: gzip, deflate (zlib format) or zstd.
+    The output only depends on the input (no timestamp), so it can be cached and compared.
+    """
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "deflate":
+        return zlib.compress(data, 9)
+    if encoding == "zstd":
+        return _zstd_compress(data)
+    raise DirectiveValidationError(
+        f"encoding must be one of {', '.join(SDL_ENCODINGS[1:])}"
+    )
@@ -1,4 +1,6 @@
-from graphql import GraphQLDirective
+from typing import Any, Optional
+
+from graphql import GraphQLDirective, GraphQLError
 
 
 class DirectiveValidationError(Exception):
@@ -25,3 +27,39 @@ class DirectiveInvalidArgTypeError(Exception):
 class DirectiveInvalidArgValueTypeError(Exception):
     def __init__(self, errors: list[str]):
         super().__init__("\n".join(errors))
+
+
+class DirectiveRuntimeError(GraphQLError):
+    """
+    Raised by directive resolver wrappers while executing a request,
+    the error code is exposed in the error's extensions.
+    """
+
+    code = "DIRECTIVE_ERROR"
+
+    def __init__(self, message: str, extensions: Optional[dict[str, Any]] = None):
+        super().__init__(message, extensions={"code": self.code, **(extensions or {})})
+
+
+class DirectiveAuthorizationError(DirectiveRuntimeError):
+    code = "FORBIDDEN"
+
+
+class DirectiveConstraintError(DirectiveRuntimeError):
+    code = "BAD_USER_INPUT"
+
+
+class DirectiveLoadSheddingError(DirectiveRuntimeError):
+    code = "LOAD_SHED"
+
+
+class DirectiveMaxItemsError(DirectiveRuntimeError):
+    code = "MAX_ITEMS_EXCEEDED"
+
+
+class DirectiveCircuitOpenError(DirectiveRuntimeError):
+    code = "CIRCUIT_OPEN"
+
+
+class DirectiveRateLimitError(DirectiveRuntimeError):
+    code = "RATE_LIMITED"
@@ -8,7 +8,9 @@ from graphql import specified_directives
 
 from . import DirectiveValidationError
 from .data_models import SchemaDirective
+from .render_cache import RenderCache
 from .schema import Schema
+from .utils import validate_schema_directives
 
 
 def build_schema(
@@ -20,6 +22,8 @@ def build_schema(
     auto_camelcase: bool = True,
     schema_directives: Collection[SchemaDirective] = None,
     include_graphql_spec_directives: bool = True,
+    render_cache: Union[RenderCache, None] = None,
+    canonical_sdl: bool = False,
 ) -> GrapheneSchema:
     """
     Build Schema.
@@ -41,17 +45,15 @@ def build_schema(
             with their argument values.
         include_graphql_spec_directives (bool): Includes directives defined by GraphQL spec (@include, @skip,
             @deprecated, @specifiedBy)
+        render_cache (RenderCache, optional): Cache of rendered type blocks and directive scans
+            shared with the other schemas built with it, e.g. shared_render_cache
+        canonical_sdl (bool): Render a canonical SDL, independent of the declaration order:
+            directive definitions, types, fields, enum values, interfaces, union members
+            and directive applications are sorted by name.
+            Default False.
     """
 
-    _schema_directive_set: set[str] = set()
-    for schema_directive in schema_directives or []:
-        if schema_directive.target_directive.name in _schema_directive_set:
-            if not schema_directive.target_directive.is_repeatable:
-                raise DirectiveValidationError(
-                    f"{schema_directive.target_directive} is not repeatable on schema"
-                )
-        else:
-            _schema_directive_set.add(schema_directive.target_directive.name)
+    validate_schema_directives(schema_directives)
 
     directives = list(directives) if directives is not None else []
 
@@ -81,4 +83,6 @@ def build_schema(
         auto_camelcase=auto_camelcase,
         include_graphql_spec_directives=include_graphql_spec_directives,
         schema_directives=schema_directives,
+        render_cache=render_cache,
+        canonical_sdl=canonical_sdl,
     )
@@ -0,0 +1,138 @@
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Collection, Iterable
+from typing import Any, Union
+
+from graphql import GraphQLDirective
+
+from .exceptions import DirectiveValidationError
+
+
+class RenderCache:
+    """
+    LRU cache of rendered type blocks and directive scans, shared by the schemas built with it.
+
+    Entries are keyed by graphene type identity (weakly, entries of a collected type are dropped),
+    the directives of the schema and its auto_camelcase setting, so a type shared by several schemas
+    is scanned and rendered once.
+    Blocks applying a directive with an input_transform or a validator are not cached,
+    as those are called with the schema and may render differently per schema.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        :param max_entries: number of entries kept, the least recently used are evicted
+        """
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise DirectiveValidationError("max_entries must be a positive integer")
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        # Keeps the directives of the keys alive while an entry uses them, so their ids are never reused,
+        # along with the number of entries using them
+        self._directive_sets: dict[
+            tuple[int, ...], tuple[tuple[GraphQLDirective, ...], int]
+        ] = {}
+        self._collected_refs: list[weakref.ref] = []
+        self._lock = threading.Lock()
+
+    def _key(
+        self,
+        kind: str,
+        graphene_type: Any,
+        directives: Collection[GraphQLDirective],
+        auto_camelcase: bool,
+    ) -> tuple:
+        return (
+            kind,
+            weakref.ref(graphene_type, self._collected),
+            tuple(id(directive) for directive in directives),
+            auto_camelcase,
+        )
+
+    def get(
+        self,
+        kind: str,
+        graphene_type: Any,
+        directives: Collection[GraphQLDirective],
+        auto_camelcase: bool,
+    ) -> Any:
+        """
+        The cached value, None when missing.
+        """
+        key = self._key(kind, graphene_type, directives, auto_camelcase)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        kind: str,
+        graphene_type: Any,
+        directives: Collection[GraphQLDirective],
+        auto_camelcase: bool,
+        value: Any,
+    ) -> None:
+        key = self._key(kind, graphene_type, directives, auto_camelcase)
+        with self._lock:
+            if self._collected_refs:
+                self._purge_collected()
+            if key not in self._entries:
+                directive_set, users = self._directive_sets.get(key[2], (directives, 0))
+                self._directive_sets[key[2]] = (tuple(directive_set), users + 1)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate(self, graphene_types: Union[Iterable[Any], None] = None) -> None:
+        """
+        Drop the entries of some graphene types, every entry by default.
+        """
+        with self._lock:
+            if self._collected_refs:
+                self._purge_collected()
+            if graphene_types is None:
+                self._entries.clear()
+                self._directive_sets.clear()
+                return
+            targets = {id(graphene_type) for graphene_type in graphene_types}
+            for key in [key for key in self._entries if id(key[1]()) in targets]:
+                self._drop(key)
+
+    def _drop(self, key: tuple) -> None:
+        # The directives of the key are released with the last entry using them
+        del self._entries[key]
+        directive_set, users = self._directive_sets[key[2]]
+        if users == 1:
+            del self._directive_sets[key[2]]
+        else:
+            self._directive_sets[key[2]] = (directive_set, users - 1)
+
+    def _collected(self, ref: weakref.ref) -> None:
+        # Called by the garbage collector, possibly while the lock is held: purged on next write
+        self._collected_refs.append(ref)
+
+    def _purge_collected(self) -> None:
+        collected = set(self._collected_refs)
+        self._collected_refs.clear()
+        for key in [key for key in self._entries if key[1] in collected]:
+            self._drop(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._collected_refs:
+                self._purge_collected()
+            return len(self._entries)
+
+
+# Process-wide cache, pass it as render_cache to share the rendering work between schemas
+shared_render_cache = RenderCache()
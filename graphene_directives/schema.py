@@ -1,6 +1,10 @@
+import gc
 import re
-from typing import Callable, Union
-from collections.abc import Collection
+from collections import OrderedDict
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import Any, Callable, Union
+from collections.abc import Collection, Iterable
 
 import graphene
 from graphene import Schema as GrapheneSchema
@@ -14,24 +18,32 @@ from graphql import (
     GraphQLField,
     GraphQLInputField,
     GraphQLNamedType,
+    default_field_resolver,
+    get_named_type,
     is_enum_type,
+    is_input_object_type,
     is_input_type,
     is_interface_type,
     is_object_type,
     is_scalar_type,
+    is_specified_directive,
     is_union_type,
-    print_schema,
 )
 from graphql import specified_directives
 from graphql.utilities.print_schema import (
+    is_defined_type,
     print_args,
     print_description,
     print_directive,
     print_input_value,
+    print_schema_definition,
+    print_type,
 )
 
+from .data_models import DirectiveApplication, DirectiveIndex, SDLBlocks
 from .data_models.schema_directive import SchemaDirective
 from .directive import CustomDirectiveMeta
+from .encoding import SDL_ENCODINGS, compress
 from .exceptions import DirectiveCustomValidationError, DirectiveValidationError
 from .parsers import (
     arg_camel_case,
@@ -42,14 +54,53 @@ from .parsers import (
     extend_schema_string,
     input_type_to_fields_string,
 )
+from .render_cache import RenderCache
+from .service import is_service_type
+from .shared_sdl import SharedSDL
 from .utils import (
     get_field_attribute_value,
     get_non_field_attribute_value,
     get_single_field_type,
     has_field_attribute,
     has_non_field_attribute,
+    validate_schema_directives,
 )
 
+# Rendered variants kept per schema, the least recently used are evicted
+SDL_VARIANTS_MAX_ENTRIES = 32
+
+
+def _shallow_copy(value: Any) -> Any:
+    # graphene's GraphQL types define __copy__ returning a bare GrapheneGraphQLType
+    copied = object.__new__(type(value))
+    copied.__dict__.update(value.__dict__)
+    return copied
+
+
+def _canonical_copy(entity_type: GraphQLNamedType) -> GraphQLNamedType:
+    """
+    Copy of a type with its fields, enum values, interfaces and union members sorted by name.
+    Arguments keep their declaration order.
+    """
+    if is_object_type(entity_type) or is_interface_type(entity_type):
+        sorted_type = _shallow_copy(entity_type)
+        sorted_type.fields = dict(sorted(entity_type.fields.items()))
+        sorted_type.interfaces = sorted(entity_type.interfaces, key=lambda t: t.name)
+        return sorted_type
+    if is_input_object_type(entity_type):
+        sorted_type = _shallow_copy(entity_type)
+        sorted_type.fields = dict(sorted(entity_type.fields.items()))
+        return sorted_type
+    if is_enum_type(entity_type):
+        sorted_type = _shallow_copy(entity_type)
+        sorted_type.values = dict(sorted(entity_type.values.items()))
+        return sorted_type
+    if is_union_type(entity_type):
+        sorted_type = _shallow_copy(entity_type)
+        sorted_type.types = sorted(entity_type.types, key=lambda t: t.name)
+        return sorted_type
+    return entity_type
+
 
 class Schema(GrapheneSchema):
     def __init__(
@@ -62,6 +113,8 @@ class Schema(GrapheneSchema):
         auto_camelcase: bool = True,
         schema_directives: Collection[SchemaDirective] = None,
         include_graphql_spec_directives: bool = True,
+        render_cache: Union[RenderCache, None] = None,
+        canonical_sdl: bool = False,
     ):
         """
         Schema Definition.
@@ -83,12 +136,32 @@ class Schema(GrapheneSchema):
                 with their argument values.
             include_graphql_spec_directives (bool): Includes directives defined by GraphQL spec (@include, @skip,
                 @deprecated, @specifiedBy)
+            render_cache (RenderCache, optional): Cache of rendered type blocks and directive scans
+                shared with the other schemas built with it, e.g. shared_render_cache
+            canonical_sdl (bool): Render a canonical SDL, independent of the declaration order:
+                directive definitions, types, fields, enum values, interfaces, union members
+                and directive applications are sorted by name.
+                Default False.
         """
 
         self.custom_directives = directives or []
         self.schema_directives = schema_directives or []
         self.auto_camelcase = auto_camelcase
         self.directives_used: dict[str, GraphQLDirective] = {}
+        self._directive_index: Union[DirectiveIndex, None] = None
+        self._effective_directive_args: Union[MappingProxyType, None] = None
+        self._inherited_directives: Union[MappingProxyType, None] = None
+        self._sdl_blocks: Union[SDLBlocks, None] = None
+        self._sdl_dependencies: dict[str, frozenset[str]] = {}
+        self._sdl_document: Union[str, None] = None
+        self._sdl_variants: OrderedDict[Any, str] = OrderedDict()
+        self._sdl_encoded: dict[str, bytes] = {}
+        self._shared_sdl: Union[SharedSDL, None] = None
+        self._frozen = False
+        self._render_cache = render_cache
+        self.canonical_sdl = canonical_sdl
+        self._sdl_hashes: dict[str, str] = {}
+        self._sdl_digest: Union[str, None] = None
 
         directives = tuple(self.custom_directives) + (
             tuple(specified_directives) if include_graphql_spec_directives else ()
@@ -102,6 +175,368 @@ class Schema(GrapheneSchema):
             auto_camelcase=auto_camelcase,
         )
 
+        # Lets runtime helpers reach this schema (and its directive index) from info.schema
+        self.graphql_schema._graphene_directives_schema = self
+        self._compile_resolver_wrappers()
+
+    @property
+    def directive_index(self) -> DirectiveIndex:
+        """
+        Index of every directive application in the schema, built on first access.
+        """
+        if self._directive_index is None:
+            self._directive_index = self._build_directive_index()
+        return self._directive_index
+
+    @property
+    def inherited_directives(self) -> MappingProxyType:
+        """
+        Read-only mapping (type_name, field_name) -> tuple of the directive applications a field of an object
+        or interface type inherits, built on first access.
+
+        Applications come from the unions the type belongs to (type level) and from the interfaces it implements
+        (type level, then field level), ordered from the lowest to the highest precedence:
+        unions, then interfaces from the last declared to the first declared.
+        Fields inheriting nothing are not in the mapping.
+        """
+        if self._inherited_directives is None:
+            self._inherited_directives = self._build_inherited_directives()
+        return self._inherited_directives
+
+    @property
+    def effective_directive_args(self) -> MappingProxyType:
+        """
+        Read-only mapping (type_name, field_name) -> directive_name -> effective arguments, built on first access.
+
+        The arguments of every application reaching a field of an object or interface type are merged,
+        field level over type level over interface (and union) level over schema level (schema_directives),
+        later applications at the same level override earlier ones and None values never override.
+        """
+        if self._effective_directive_args is None:
+            self._effective_directive_args = self._build_effective_directive_args()
+        return self._effective_directive_args
+
+    def _get_directive_applications(
+        self, type_: Any, non_field: bool = False
+    ) -> list[DirectiveApplication]:
+        """
+        Collect the (snake_cased, input transformed) directive applications set on a graphene type or field.
+        """
+        applications = []
+        for directive in self.custom_directives:
+            if non_field:
+                if not has_non_field_attribute(type_, directive):
+                    continue
+                directive_values = get_non_field_attribute_value(type_, directive)
+            else:
+                if not has_field_attribute(type_, directive):
+                    continue
+                directive_values = get_field_attribute_value(type_, directive)
+
+            meta_data: CustomDirectiveMeta = getattr(directive, "_graphene_directive")
+            for directive_value in directive_values:
+                arguments = arg_snake_case(directive_value)
+                if meta_data.input_transform is not None:
+                    arguments = meta_data.input_transform(arguments, self)
+                applications.append(
+                    DirectiveApplication(
+                        target_directive=directive, arguments=arguments
+                    )
+                )
+        return applications
+
+    def _get_graphene_field(self, graphene_type: Any, field_name: str) -> Any:
+        """
+        Get the graphene field (which holds the directive attributes) for a schema field name.
+        """
+        return getattr(
+            graphene_type,
+            self.field_name_to_type_attribute(graphene_type)(field_name),
+            None,
+        )
+
+    def _build_directive_index(self) -> DirectiveIndex:
+        """
+        Scan the schema once and index all the directive applications by schema names.
+        """
+        index = DirectiveIndex()
+
+        for type_name, entity_type in self.graphql_schema.type_map.items():
+            graphene_type = getattr(entity_type, "graphene_type", None)
+            if graphene_type is None:
+                continue
+
+            applications = self._get_directive_applications(
+                graphene_type, non_field=True
+            )
+            if applications:
+                index.types[type_name] = applications
+
+            if is_enum_type(entity_type):
+                for value_name, value in entity_type.values.items():
+                    applications = self._get_directive_applications(value.value)
+                    if applications:
+                        index.fields[(type_name, value_name)] = applications
+                continue
+
+            if not (
+                is_object_type(entity_type)
+                or is_interface_type(entity_type)
+                or is_input_object_type(entity_type)
+            ):
+                continue
+
+            get_field_graphene_type = self.field_name_to_type_attribute(graphene_type)
+            graphene_fields = getattr(graphene_type._meta, "fields", {})  # noqa
+
+            for field_name, field in entity_type.fields.items():
+                attribute_name = get_field_graphene_type(field_name)
+                applications = self._get_directive_applications(
+                    getattr(graphene_type, attribute_name, None)
+                )
+                if applications:
+                    index.fields[(type_name, field_name)] = applications
+
+                graphene_args = getattr(
+                    graphene_fields.get(attribute_name), "args", None
+                )
+                for arg_name, arg in getattr(field, "args", {}).items():
+                    applications = self._get_directive_applications(
+                        (graphene_args or {}).get(arg.out_name or arg_name)
+                    )
+                    if applications:
+                        index.arguments[(type_name, field_name, arg_name)] = (
+                            applications
+                        )
+
+        return index
+
+    def _build_inherited_directives(self) -> MappingProxyType:
+        index = self.directive_index
+
+        unions: dict[str, list[str]] = {}
+        for type_name, entity_type in self.graphql_schema.type_map.items():
+            if is_union_type(entity_type) and index.for_type(type_name):
+                for member in entity_type.types:
+                    unions.setdefault(member.name, []).append(type_name)
+
+        table = {}
+        for type_name, entity_type in self.graphql_schema.type_map.items():
+            if not (is_object_type(entity_type) or is_interface_type(entity_type)):
+                continue
+
+            type_applications = [
+                application
+                for union_name in unions.get(type_name, ())
+                for application in index.for_type(union_name)
+            ]
+            interfaces = tuple(reversed(entity_type.interfaces))
+            for interface in interfaces:
+                type_applications.extend(index.for_type(interface.name))
+
+            for field_name in entity_type.fields:
+                applications = list(type_applications)
+                for interface in interfaces:
+                    applications.extend(index.for_field(interface.name, field_name))
+                if applications:
+                    table[(type_name, field_name)] = tuple(applications)
+
+        return MappingProxyType(table)
+
+    def _build_effective_directive_args(self) -> MappingProxyType:
+        index = self.directive_index
+        inherited = self.inherited_directives
+
+        schema_applications = []
+        for schema_directive in self.schema_directives:
+            directive = schema_directive.target_directive
+            if not {
+                DirectiveLocation.OBJECT,
+                DirectiveLocation.INTERFACE,
+                DirectiveLocation.FIELD_DEFINITION,
+            } & set(directive.locations):
+                continue
+            arguments = arg_snake_case(schema_directive.arguments)
+            meta_data = getattr(directive, "_graphene_directive", None)
+            if meta_data is not None and meta_data.input_transform is not None:
+                arguments = meta_data.input_transform(arguments, self)
+            schema_applications.append(
+                DirectiveApplication(target_directive=directive, arguments=arguments)
+            )
+
+        table = {}
+        for type_name, entity_type in self.graphql_schema.type_map.items():
+            # Introspection types (__Schema, __Type, ...) never carry directives
+            if type_name.startswith("__") or not (
+                is_object_type(entity_type) or is_interface_type(entity_type)
+            ):
+                continue
+
+            for field_name in entity_type.fields:
+                levels = (
+                    schema_applications,
+                    inherited.get((type_name, field_name), ()),
+                    index.for_type(type_name),
+                    index.for_field(type_name, field_name),
+                )
+
+                merged: dict[str, dict[str, Any]] = {}
+                for applications in levels:
+                    for application in applications:
+                        arguments = merged.setdefault(
+                            application.target_directive.name, {}
+                        )
+                        arguments.update(
+                            (key, value)
+                            for key, value in application.arguments.items()
+                            if value is not None
+                        )
+                if merged:
+                    table[(type_name, field_name)] = MappingProxyType({
+                        directive_name: MappingProxyType(arguments)
+                        for directive_name, arguments in merged.items()
+                    })
+
+        return MappingProxyType(table)
+
+    def _get_input_field_directives(self, input_type: Any, memo: dict) -> set[str]:
+        """
+        Names of the directives applied on the input fields of an input object type, nested input objects included.
+        """
+        input_type = get_named_type(input_type)
+        if not is_input_object_type(input_type):
+            return set()
+
+        if input_type.name not in memo:
+            directive_names = set()
+            visited = set()
+            pending = [input_type]
+            while pending:
+                current = pending.pop()
+                if current.name in visited:
+                    continue
+                visited.add(current.name)
+                for field_name, field in current.fields.items():
+                    directive_names.update(
+                        application.target_directive.name
+                        for application in self.directive_index.for_field(
+                            current.name, field_name
+                        )
+                    )
+                    field_type = get_named_type(field.type)
+                    if is_input_object_type(field_type):
+                        pending.append(field_type)
+            memo[input_type.name] = directive_names
+
+        return memo[input_type.name]
+
+    def _compile_resolver_wrappers(self) -> None:
+        """
+        Compose the resolver_wrapper (and subscribe_wrapper) of the directives applied on a field into
+        that field's resolve (and subscribe) function.
+
+        This runs once at schema build time, fields without such directives keep their original resolver.
+        Wrappers are composed in the declared directive order, the first declared directive being the outermost.
+        Directives applied at type level are inherited by every field of the type, their inputs come
+        before the field level ones. Directives inherited from interfaces and unions (inherited_directives)
+        come first.
+        Directives applied on a field's arguments (or on input fields reachable from them) also wrap the field,
+        those applications are looked up from the directive_index by the wrapper factory.
+        """
+        wrapping_directives = [
+            directive
+            for directive in self.custom_directives
+            if getattr(directive, "_graphene_directive").resolver_wrapper is not None
+            or getattr(directive, "_graphene_directive").subscribe_wrapper is not None
+        ]
+        if not wrapping_directives:
+            return
+
+        index = self.directive_index
+        inherited = self.inherited_directives
+        input_field_directives_memo: dict[str, set[str]] = {}
+
+        for type_name, entity_type in self.graphql_schema.type_map.items():
+            if not is_object_type(entity_type):
+                continue
+
+            type_applications = [
+                application
+                for application in index.for_type(type_name)
+                if application.target_directive in wrapping_directives
+            ]
+
+            for field_name, field in entity_type.fields.items():
+                applications = [
+                    application
+                    for application in inherited.get((type_name, field_name), ())
+                    if application.target_directive in wrapping_directives
+                ]
+                applications += type_applications
+                applications += [
+                    application
+                    for application in index.for_field(type_name, field_name)
+                    if application.target_directive in wrapping_directives
+                ]
+                argument_directives = set()
+                for arg_name, arg in field.args.items():
+                    argument_directives.update(
+                        application.target_directive.name
+                        for application in index.for_argument(
+                            type_name, field_name, arg_name
+                        )
+                    )
+                    argument_directives.update(
+                        self._get_input_field_directives(
+                            arg.type, input_field_directives_memo
+                        )
+                    )
+
+                if not applications and not any(
+                    directive.name in argument_directives
+                    for directive in wrapping_directives
+                ):
+                    continue
+
+                graphene_field = self._get_graphene_field(
+                    entity_type.graphene_type, field_name
+                )
+                resolver = field.resolve or default_field_resolver
+                subscribe = field.subscribe
+
+                for directive in reversed(wrapping_directives):
+                    inputs = [
+                        application.arguments
+                        for application in applications
+                        if application.target_directive is directive
+                    ]
+                    if not inputs and directive.name not in argument_directives:
+                        continue
+                    meta_data: CustomDirectiveMeta = getattr(
+                        directive, "_graphene_directive"
+                    )
+                    if meta_data.resolver_wrapper is not None:
+                        resolver = meta_data.resolver_wrapper(
+                            resolver,
+                            entity_type,
+                            field_name,
+                            graphene_field,
+                            inputs,
+                            self,
+                        )
+                    if meta_data.subscribe_wrapper is not None:
+                        subscribe = meta_data.subscribe_wrapper(
+                            subscribe,
+                            entity_type,
+                            field_name,
+                            graphene_field,
+                            inputs,
+                            self,
+                        )
+
+                field.resolve = resolver
+                field.subscribe = subscribe
+
     def field_name_to_type_attribute(
         self, model: graphene.ObjectType
     ) -> Callable[[str], str]:
@@ -132,6 +567,22 @@ class Schema(GrapheneSchema):
             return to_camel_case(attribute)
         return attribute
 
+    def _rendered_directives(self) -> Collection[GraphQLDirective]:
+        """
+        The custom directives in the order their applications are rendered, sorted by name with canonical_sdl.
+        """
+        if self.canonical_sdl:
+            return sorted(self.custom_directives, key=lambda directive: directive.name)
+        return self.custom_directives
+
+    def _rendered_schema_directives(self) -> Collection[SchemaDirective]:
+        if self.canonical_sdl:
+            return sorted(
+                self.schema_directives,
+                key=lambda schema_directive: schema_directive.target_directive.name,
+            )
+        return self.schema_directives
+
     def _add_argument_decorators(
         self,
         entity_name: str,
@@ -153,9 +604,13 @@ class Schema(GrapheneSchema):
 
         str_field = "(" if print_single_line else "(\n"
 
-        for i, (name, arg) in enumerate(args.items()):
+        for name, arg in args.items():
             name = self.type_attribute_to_field_name(name)
             gql_arg = original_args.get(name)
+            if gql_arg is None:
+                # Pruned from the rendered variant, see render
+                continue
+            i = len(new_args)
             if print_single_line:
                 base_str = f"{print_input_value(name, gql_arg)} "
             else:
@@ -165,7 +620,7 @@ class Schema(GrapheneSchema):
                     + f"{print_input_value(name, gql_arg)} "
                 )
             directives = []
-            for directive in self.custom_directives:
+            for directive in self._rendered_directives():
                 if has_field_attribute(arg, directive):
                     directive_values = get_field_attribute_value(arg, directive)
                     meta_data: CustomDirectiveMeta = getattr(
@@ -207,18 +662,26 @@ class Schema(GrapheneSchema):
 
         return str_field
 
-    def _add_field_decorators(self, graphene_types: set, string_schema: str) -> str:
+    def _add_field_decorators(
+        self,
+        graphene_types: set,
+        string_schema: str,
+        entity_types: Union[dict[str, GraphQLNamedType], None] = None,
+    ) -> str:
         """
         For a given entity, go through all its fields and see if any directive decorator needs to be added.
 
         This method simply goes through the fields that need to be modified and replace them with their annotated
         version in the schema string representation.
+        entity_types overrides the schema types by name (pruned types of a rendered variant).
         """
 
         for graphene_type in graphene_types:
             entity_name = graphene_type._meta.name  # noqa
 
-            entity_type = self.graphql_schema.get_type(entity_name)
+            entity_type = (entity_types or {}).get(
+                entity_name
+            ) or self.graphql_schema.get_type(entity_name)
             get_field_graphene_type = self.field_name_to_type_attribute(graphene_type)
 
             required_directive_locations = set()
@@ -299,7 +762,7 @@ class Schema(GrapheneSchema):
                     str_fields.append(str_field)
                     continue
 
-                for directive in self.custom_directives:
+                for directive in self._rendered_directives():
                     if not has_field_attribute(field, directive):
                         continue
                     directive_values = get_field_attribute_value(field, directive)
@@ -415,7 +878,7 @@ class Schema(GrapheneSchema):
                 continue
 
             directive_annotations = []
-            for directive in self.custom_directives:
+            for directive in self._rendered_directives():
                 if has_non_field_attribute(non_field, directive):
                     meta_data: CustomDirectiveMeta = getattr(
                         directive, "_graphene_directive"
@@ -487,14 +950,29 @@ class Schema(GrapheneSchema):
         }
 
         for schema_type in schema_types.values():
-            if not hasattr(schema_type, "graphene_type"):
-                continue
-            for directive in self.custom_directives:
-                if has_non_field_attribute(schema_type.graphene_type, directive):
-                    self.directives_used[directive.name] = directive
-                    directives_types.add(schema_type.graphene_type)
+            if self._get_non_field_directives(schema_type):
+                directives_types.add(schema_type.graphene_type)
         return directives_types
 
+    def _get_non_field_directives(self, schema_type: Any) -> set[str]:
+        """
+        Names of the directives applied on a schema type itself (non-field level), recording the directives used.
+        """
+        applied = set()
+        if not hasattr(schema_type, "graphene_type"):
+            return applied
+        cached = self._get_cached("non_field_scan", schema_type.graphene_type)
+        if cached is not None:
+            return self._record_directives_used(cached)
+        for directive in self.custom_directives:
+            if has_non_field_attribute(schema_type.graphene_type, directive):
+                self._use_directive(directive)
+                applied.add(directive.name)
+        self._set_cached(
+            "non_field_scan", schema_type.graphene_type, frozenset(applied)
+        )
+        return applied
+
     def _get_directive_applied_field_types(self) -> set:
         """
         Find all the directive applied field types from the schema.
@@ -509,51 +987,90 @@ class Schema(GrapheneSchema):
         }
 
         for _, entity_type in schema_types.items():
-            if (
-                not hasattr(entity_type, "graphene_type")  # noqa:SIM101
-                or isinstance(entity_type.graphene_type._meta, UnionOptions)  # noqa
-                or isinstance(entity_type.graphene_type._meta, ScalarOptions)  # noqa
-            ):
-                continue
+            if self._get_field_directives(entity_type):
+                directives_fields.add(entity_type.graphene_type)
+
+        return directives_fields
 
-            fields = (
-                list(entity_type.values.values())  # Enum class fields
-                if is_enum_type(entity_type)
-                else list(entity_type.fields)  # noqa
+    def _get_field_directives(self, entity_type: Any) -> set[str]:
+        """
+        Names of the directives applied on the fields (or field arguments) of a schema type,
+        recording the directives used.
+        """
+        applied = set()
+        if (
+            not hasattr(entity_type, "graphene_type")  # noqa:SIM101
+            or isinstance(entity_type.graphene_type._meta, UnionOptions)  # noqa
+            or isinstance(entity_type.graphene_type._meta, ScalarOptions)  # noqa
+        ):
+            return applied
+        cached = self._get_cached("field_scan", entity_type.graphene_type)
+        if cached is not None:
+            return self._record_directives_used(cached)
+
+        fields = (
+            list(entity_type.values.values())  # Enum class fields
+            if is_enum_type(entity_type)
+            else list(entity_type.fields)  # noqa
+        )
+
+        for field in fields:
+            field_type = (
+                # auto-camelcasing can cause problems
+                getattr(entity_type.graphene_type, to_camel_case(field), None)
+                or getattr(entity_type.graphene_type, to_snake_case(field), None)
+                if not is_enum_type(entity_type)
+                else field.value
             )
+            for directive_ in self.custom_directives:
+                if has_field_attribute(field_type, directive_):
+                    self._use_directive(directive_)
+                    applied.add(directive_.name)
+
+                # Handle Argument Decorators
+                if (
+                    hasattr(field_type, "args")
+                    and field_type.args is not None
+                    and isinstance(field_type.args, dict)
+                ):
+                    for arg_name, arg_type in field_type.args.items():
+                        if has_field_attribute(arg_type, directive_):
+                            if (
+                                DirectiveLocation.ARGUMENT_DEFINITION
+                                not in directive_.locations
+                            ):
+                                raise DirectiveValidationError(
+                                    f"{directive_} cannot be used at argument level at {entity_type}->{field}"
+                                )
+                            self._use_directive(directive_)
+                            applied.add(directive_.name)
 
-            for field in fields:
-                field_type = (
-                    # auto-camelcasing can cause problems
-                    getattr(entity_type.graphene_type, to_camel_case(field), None)
-                    or getattr(entity_type.graphene_type, to_snake_case(field), None)
-                    if not is_enum_type(entity_type)
-                    else field.value
-                )
-                for directive_ in self.custom_directives:
-                    if has_field_attribute(field_type, directive_):
-                        self.directives_used[directive_.name] = directive_
-                        directives_fields.add(entity_type.graphene_type)
+        self._set_cached("field_scan", entity_type.graphene_type, frozenset(applied))
+        return applied
 
-                    # Handle Argument Decorators
-                    if (
-                        hasattr(field_type, "args")
-                        and field_type.args is not None
-                        and isinstance(field_type.args, dict)
-                    ):
-                        for arg_name, arg_type in field_type.args.items():
-                            if has_field_attribute(arg_type, directive_):
-                                if (
-                                    DirectiveLocation.ARGUMENT_DEFINITION
-                                    not in directive_.locations
-                                ):
-                                    raise DirectiveValidationError(
-                                        f"{directive_} cannot be used at argument level at {entity_type}->{field}"
-                                    )
-                                self.directives_used[directive_.name] = directive_
-                                directives_fields.add(entity_type.graphene_type)
+    def _get_cached(self, kind: str, graphene_type: Any) -> Any:
+        if self._render_cache is None:
+            return None
+        return self._render_cache.get(
+            kind, graphene_type, self.custom_directives, self.auto_camelcase
+        )
 
-        return directives_fields
+    def _set_cached(self, kind: str, graphene_type: Any, value: Any) -> None:
+        if self._render_cache is not None:
+            self._render_cache.set(
+                kind, graphene_type, self.custom_directives, self.auto_camelcase, value
+            )
+
+    def _record_directives_used(self, directive_names: frozenset[str]) -> set[str]:
+        for directive in self.custom_directives:
+            if directive.name in directive_names:
+                self._use_directive(directive)
+        return set(directive_names)
+
+    def _use_directive(self, directive: GraphQLDirective) -> None:
+        # Every directive used is recorded before freezing, see freeze
+        if not self._frozen:
+            self.directives_used[directive.name] = directive
 
     def get_directives_used(self) -> list[GraphQLDirective]:
         """
@@ -564,22 +1081,540 @@ class Schema(GrapheneSchema):
         self._get_directive_applied_non_field_types()
         return list(self.directives_used.values())
 
-    def __str__(self):
-        string_schema = ""
-        string_schema += extend_schema_string(string_schema, self.schema_directives)
-        string_schema += print_schema(self.graphql_schema)
+    @property
+    def sdl_blocks(self) -> SDLBlocks:
+        """
+        Mapping type name -> annotated SDL block of that type, each block is rendered on first access and cached.
+        """
+        if self._sdl_blocks is None:
+            self._sdl_blocks = SDLBlocks(
+                (
+                    type_name
+                    for type_name, type_ in self.graphql_schema.type_map.items()
+                    if is_defined_type(type_) and not is_service_type(type_)
+                ),
+                self._render_type_block,
+            )
+        return self._sdl_blocks
 
-        field_types = self._get_directive_applied_field_types()
-        non_field_types = self._get_directive_applied_non_field_types()
+    def sdl_for_type(self, type_name: str) -> str:
+        """
+        Annotated SDL of a single type, rendered in time proportional to the type's size.
+        """
+        try:
+            return self.sdl_blocks[type_name]
+        except KeyError:
+            raise KeyError(f"{type_name} is not a type of the schema") from None
 
-        string_schema = self._add_field_decorators(field_types, string_schema)
-        string_schema = self.add_non_field_decorators(non_field_types, string_schema)
+    def _render_type_block(self, type_name: str) -> str:
+        """
+        Print a single type and annotate it with its directives.
 
-        for directive in self.custom_directives:
-            meta_data: CustomDirectiveMeta = getattr(directive, "_graphene_directive")
-            if not meta_data.add_definition_to_schema:
-                string_schema = string_schema.replace(
-                    print_directive(directive) + "\n\n", ""
+        The directives applied in the block are recorded as its dependencies, see refresh.
+        """
+        entity_type = self.graphql_schema.type_map[type_name]
+        graphene_type = getattr(entity_type, "graphene_type", None)
+        cache_kind = "canonical_block" if self.canonical_sdl else "block"
+        cached = (
+            self._get_cached(cache_kind, graphene_type)
+            if graphene_type is not None
+            else None
+        )
+        if cached is not None:
+            block, dependencies, content_hash = cached
+        else:
+            block, dependencies = self._render_block(entity_type)
+            content_hash = blake2b(block.encode(), digest_size=16).hexdigest()
+            if graphene_type is not None and not any(
+                meta_data.input_transform is not None
+                or meta_data.field_validator is not None
+                or meta_data.non_field_validator is not None
+                for meta_data in (
+                    getattr(directive, "_graphene_directive")
+                    for directive in self.custom_directives
+                    if directive.name in dependencies
+                )
+            ):
+                self._set_cached(
+                    cache_kind, graphene_type, (block, dependencies, content_hash)
                 )
+        self._sdl_dependencies[type_name] = dependencies
+        self._sdl_hashes[type_name] = content_hash
+        return block
 
+    def _render_block(
+        self, entity_type: GraphQLNamedType
+    ) -> tuple[str, frozenset[str]]:
+        """
+        Print a type and annotate it with its directives, returns the block and the names of the directives applied.
+        """
+        if (
+            is_object_type(entity_type)
+            and "_service" in entity_type.fields
+            and is_service_type(get_named_type(entity_type.fields["_service"].type))
+        ):
+            entity_type = _shallow_copy(entity_type)
+            entity_type.fields = {
+                field_name: field
+                for field_name, field in entity_type.fields.items()
+                if field_name != "_service"
+            }
+        if self.canonical_sdl:
+            entity_type = _canonical_copy(entity_type)
+        block = print_type(entity_type)
+        field_directives = self._get_field_directives(entity_type)
+        if field_directives:
+            block = self._add_field_decorators(
+                {entity_type.graphene_type}, block, {entity_type.name: entity_type}
+            )
+        non_field_directives = self._get_non_field_directives(entity_type)
+        if non_field_directives:
+            block = self.add_non_field_decorators({entity_type.graphene_type}, block)
+        return block, frozenset(field_directives | non_field_directives)
+
+    def refresh(
+        self,
+        types: Collection[Union[str, Any]] = (),
+        directives: Collection[Union[str, GraphQLDirective]] = (),
+    ) -> list[str]:
+        """
+        Re-render the SDL blocks affected by a change, after the directive applications of some types
+        or the input_transform of some directives changed. The other cached blocks are reused.
+
+        The directive_index (and the tables derived from it) are rebuilt on next access,
+        resolver wrappers compiled at build time are left untouched.
+
+        Args:
+            types: changed types, as schema names or graphene types
+            directives: directives whose input_transform results changed, as names or directives,
+                every block applying them is re-rendered
+
+        Returns:
+            the names of the re-rendered types
+        """
+        if self._frozen:
+            raise DirectiveValidationError("A frozen schema cannot be refreshed")
+
+        type_names = {getattr(getattr(t, "_meta", None), "name", t) for t in types}
+        directive_names = {getattr(d, "name", d) for d in directives}
+
+        affected = [
+            type_name
+            for type_name in self.sdl_blocks
+            if type_name in type_names
+            or directive_names & self._sdl_dependencies.get(type_name, frozenset())
+        ]
+        self.sdl_blocks.invalidate(affected)
+        if self._render_cache is not None:
+            self._render_cache.invalidate(
+                getattr(self.graphql_schema.type_map[type_name], "graphene_type", None)
+                for type_name in affected
+            )
+        self._sdl_document = None
+        self._sdl_encoded.clear()
+        self._shared_sdl = None
+        self._sdl_digest = None
+        self._sdl_variants.clear()
+        self._directive_index = None
+        self._inherited_directives = None
+        self._effective_directive_args = None
+
+        for type_name in affected:
+            self.sdl_blocks[type_name]  # re-render now, not on next read
+        return affected
+
+    def with_schema_directives(
+        self, schema_directives: Collection[SchemaDirective]
+    ) -> "Schema":
+        """
+        Derive a schema which only differs by its schema_directives, without building the type map again.
+
+        The derived schema shares the types of the graphql_schema (and so the resolvers), the directive_index
+        and the type blocks rendered so far, only the extend schema header is rendered again.
+        Its graphql_schema is a shallow copy, so info.schema resolves to the derived schema when it executes.
+        The caches are copied: a refresh only applies to the schema it is called on, refresh the derived schemas too.
+
+        Args:
+            schema_directives (Collection[SchemaDirective]): Directives that can be defined at
+                DIRECTIVE_LOCATION.SCHEMA with their argument values.
+        """
+        validate_schema_directives(schema_directives)
+
+        directive_index = self.directive_index
+        sdl_blocks = self.sdl_blocks
+
+        derived = _shallow_copy(self)
+        derived.schema_directives = schema_directives or []
+        derived.graphql_schema = _shallow_copy(self.graphql_schema)
+        derived.graphql_schema._graphene_directives_schema = derived
+        derived._directive_index = directive_index
+        derived._sdl_blocks = sdl_blocks.copy(derived._render_type_block)
+        derived._sdl_dependencies = dict(self._sdl_dependencies)
+        derived._sdl_hashes = dict(self._sdl_hashes)
+        if not self._frozen:
+            derived.directives_used = dict(self.directives_used)
+        derived._effective_directive_args = None
+        derived._sdl_document = None
+        derived._sdl_encoded = {}
+        derived._shared_sdl = None
+        derived._sdl_digest = None
+        derived._sdl_variants = OrderedDict()
+        return derived
+
+    def _print_directive_definitions(self) -> list[str]:
+        definitions = []
+        for directive in self.graphql_schema.directives:
+            if is_specified_directive(directive):
+                continue
+            meta_data: Union[CustomDirectiveMeta, None] = getattr(
+                directive, "_graphene_directive", None
+            )
+            if meta_data is not None and not meta_data.add_definition_to_schema:
+                continue
+            definitions.append(print_directive(directive))
+        if self.canonical_sdl:
+            definitions.sort()
+        return definitions
+
+    def render(
+        self,
+        include: Union[Callable[[list[DirectiveApplication]], bool], None] = None,
+        exclude: Union[Callable[[list[DirectiveApplication]], bool], None] = None,
+        key: Any = None,
+    ) -> str:
+        """
+        Render a variant (contract) of the annotated SDL, filtered by predicates over the applied directives.
+
+        exclude prunes every type, field, argument, enum value and input field whose own applications match.
+        include keeps only the object and interface fields whose applications (inherited from interfaces
+        and unions, type level and field level) match.
+        Fields and arguments of a pruned type are pruned, and the types not reachable from the root types
+        (or from a reachable interface / union) anymore are left out, in the same traversal.
+        Variants are cached by key, (include, exclude) by default: predicates created per call never hit the cache,
+        define them once (e.g. at module level) or pass a key. The last SDL_VARIANTS_MAX_ENTRIES variants are kept.
+
+        Args:
+            include: def include (applications: list[DirectiveApplication]) -> bool
+            exclude: def exclude (applications: list[DirectiveApplication]) -> bool
+            key: cache key of the variant, required to hit the cache when the predicates are created per call
+        """
+        if include is None and exclude is None:
+            return str(self)
+
+        cache_key = (include, exclude) if key is None else key
+        document = self._sdl_variants.get(cache_key)
+        if document is None:
+            document = self._sdl_variants[cache_key] = self._render_variant(
+                include, exclude
+            )
+            if len(self._sdl_variants) > SDL_VARIANTS_MAX_ENTRIES:
+                self._sdl_variants.popitem(last=False)
+        else:
+            self._sdl_variants.move_to_end(cache_key)
+        return document
+
+    def _render_variant(
+        self,
+        include: Union[Callable[[list[DirectiveApplication]], bool], None],
+        exclude: Union[Callable[[list[DirectiveApplication]], bool], None],
+    ) -> str:
+        index = self.directive_index
+        inherited = self.inherited_directives
+        kept_types: dict[str, bool] = {}
+
+        def excluded(applications: list[DirectiveApplication]) -> bool:
+            return exclude is not None and bool(applications) and exclude(applications)
+
+        def keeps_type(type_: Any) -> bool:
+            named_type = get_named_type(type_)
+            if is_service_type(named_type):
+                return False
+            if not is_defined_type(named_type):
+                return True
+            kept = kept_types.get(named_type.name)
+            if kept is None:
+                kept = kept_types[named_type.name] = not excluded(
+                    index.for_type(named_type.name)
+                )
+            return kept
+
+        def keeps_field(entity_type: Any, field_name: str, field: Any) -> bool:
+            type_name = entity_type.name
+            applications = index.for_field(type_name, field_name)
+            if excluded(applications) or not keeps_type(field.type):
+                return False
+            if include is None or not (
+                is_object_type(entity_type) or is_interface_type(entity_type)
+            ):
+                return True
+            return include([
+                *inherited.get((type_name, field_name), ()),
+                *index.for_type(type_name),
+                *applications,
+            ])
+
+        variant: dict[str, GraphQLNamedType] = {}
+        pending = [
+            root_type
+            for root_type in (
+                self.graphql_schema.query_type,
+                self.graphql_schema.mutation_type,
+                self.graphql_schema.subscription_type,
+            )
+            if root_type is not None and keeps_type(root_type)
+        ]
+        while pending:
+            entity_type = pending.pop()
+            if entity_type.name in variant or not is_defined_type(entity_type):
+                continue
+            type_name = entity_type.name
+            pruned = _shallow_copy(entity_type)
+
+            if is_enum_type(entity_type):
+                pruned.values = {
+                    value_name: value
+                    for value_name, value in entity_type.values.items()
+                    if not excluded(index.for_field(type_name, value_name))
+                }
+            elif is_union_type(entity_type):
+                pruned.types = [
+                    member for member in entity_type.types if keeps_type(member)
+                ]
+                pending.extend(pruned.types)
+            elif is_input_object_type(entity_type):
+                pruned.fields = {
+                    field_name: field
+                    for field_name, field in entity_type.fields.items()
+                    if keeps_field(entity_type, field_name, field)
+                }
+                pending.extend(get_named_type(f.type) for f in pruned.fields.values())
+            elif is_object_type(entity_type) or is_interface_type(entity_type):
+                fields = {}
+                for field_name, field in entity_type.fields.items():
+                    if not keeps_field(entity_type, field_name, field):
+                        continue
+                    args = {
+                        arg_name: arg
+                        for arg_name, arg in field.args.items()
+                        if keeps_type(arg.type)
+                        and not excluded(
+                            index.for_argument(type_name, field_name, arg_name)
+                        )
+                    }
+                    if len(args) != len(field.args):
+                        field = _shallow_copy(field)
+                        field.args = args
+                    fields[field_name] = field
+                    pending.append(get_named_type(field.type))
+                    pending.extend(get_named_type(arg.type) for arg in args.values())
+                pruned.fields = fields
+                pruned.interfaces = [
+                    interface
+                    for interface in entity_type.interfaces
+                    if keeps_type(interface)
+                ]
+                pending.extend(pruned.interfaces)
+                if is_interface_type(entity_type):
+                    implementations = self.graphql_schema.get_implementations(
+                        entity_type
+                    )
+                    pending.extend(
+                        implementation
+                        for implementation in (
+                            *implementations.objects,
+                            *implementations.interfaces,
+                        )
+                        if keeps_type(implementation)
+                    )
+
+            variant[type_name] = pruned
+
+        type_names = self.graphql_schema.type_map
+        if self.canonical_sdl:
+            type_names = sorted(type_names)
+        return self._print_document(
+            self._render_block(variant[type_name])[0]
+            for type_name in type_names
+            if type_name in variant
+        )
+
+    def _print_header(self) -> str:
+        string_schema = ""
+        string_schema += extend_schema_string(
+            string_schema, self._rendered_schema_directives()
+        )
+        string_schema += "\n\n".join((
+            *filter(None, (print_schema_definition(self.graphql_schema),)),
+            *self._print_directive_definitions(),
+        ))
+        return string_schema
+
+    @property
+    def sdl_hashes(self) -> MappingProxyType:
+        """
+        Read-only mapping type name -> content hash of the type's annotated SDL block, computed as blocks are rendered.
+        """
+        if not self._frozen:  # the hashes of a frozen schema are all computed
+            for type_name in self.sdl_blocks:
+                self.sdl_blocks[type_name]
+        return MappingProxyType(self._sdl_hashes)
+
+    @property
+    def sdl_digest(self) -> str:
+        """
+        Digest of the annotated SDL (e.g. as ETag), combining the header and the content hashes of the types.
+        With canonical_sdl, it does not depend on the declaration order.
+        """
+        if self._sdl_digest is None:
+            hashes = self.sdl_hashes
+            digest = blake2b(self._print_header().encode(), digest_size=16)
+            type_names = sorted(hashes) if self.canonical_sdl else self.sdl_blocks
+            for type_name in type_names:
+                digest.update(f"\n{type_name}:{hashes[type_name]}".encode())
+            self._sdl_digest = digest.hexdigest()
+        return self._sdl_digest
+
+    def _print_document(self, blocks: Iterable[str]) -> str:
+        string_schema = ""
+        string_schema += extend_schema_string(
+            string_schema, self._rendered_schema_directives()
+        )
+        string_schema += "\n\n".join((
+            *filter(None, (print_schema_definition(self.graphql_schema),)),
+            *self._print_directive_definitions(),
+            *blocks,
+        ))
         return string_schema.strip()
+
+    def sdl_bytes(self, encoding: str = "identity") -> bytes:
+        """
+        The annotated SDL as UTF-8 bytes, compressed with a HTTP content coding, encoded once and cached
+        (until refresh), to be written as is to responses.
+
+        Args:
+            encoding: identity, gzip, deflate or zstd (Python 3.14+ or the zstandard package)
+        """
+        encoded = self._sdl_encoded.get(encoding)
+        if encoded is None:
+            if encoding not in SDL_ENCODINGS:
+                raise DirectiveValidationError(
+                    f"SDL encoding must be one of {', '.join(SDL_ENCODINGS)}"
+                )
+            if encoding == "identity":
+                encoded = str(self).encode()
+            else:
+                encoded = compress(self.sdl_bytes(), encoding)
+            self._sdl_encoded[encoding] = encoded
+        return encoded
+
+    def freeze(self, gc_freeze: bool = False) -> "Schema":
+        """
+        Prepare the schema to be shared by forked workers, after build_schema in the master process.
+
+        Everything workers read (the SDL, its digest and content hashes, the directive index and the tables
+        derived from it) is computed now, the index entries of the schema become tuples of read-only mappings,
+        directives_used becomes read-only and the intermediates only needed to refresh or to re-render
+        (type blocks, variants, dependencies) are dropped.
+        With gc_freeze, the surviving objects are moved to the permanent generation (gc.freeze),
+        so collections in the workers never touch (and copy) their pages. It freezes every object
+        of the process, not only the schema: call it once the process is fully set up, or call gc.freeze yourself.
+
+        A frozen schema cannot be refreshed. The graphene types and the directive definitions may be shared
+        with other schemas and are left as is: directives added to the types afterwards are not seen by the frozen schema.
+        """
+        if self._frozen:
+            return self
+
+        self._sdl_document = str(self)
+        self._sdl_digest = self.sdl_digest
+        self.get_directives_used()
+
+        # A new index, the current one may be shared with the schemas derived by with_schema_directives
+        index = self.directive_index
+        self._directive_index = DirectiveIndex(**{
+            table_name: {
+                key: tuple(
+                    DirectiveApplication(
+                        target_directive=application.target_directive,
+                        arguments=MappingProxyType(dict(application.arguments)),
+                    )
+                    for application in applications
+                )
+                for key, applications in getattr(index, table_name).items()
+            }
+            for table_name in ("types", "fields", "arguments")
+        })
+        # Derived from the frozen index, so they hold its read-only applications, not the previous ones
+        self._inherited_directives = None
+        self._effective_directive_args = None
+        self._inherited_directives = self.inherited_directives
+        self._effective_directive_args = self.effective_directive_args
+
+        # The hashes in document order, they can not be recomputed once the blocks are dropped
+        self._sdl_hashes = {
+            type_name: self._sdl_hashes[type_name] for type_name in self.sdl_blocks
+        }
+        self.directives_used = MappingProxyType(dict(self.directives_used))
+        self._sdl_blocks = None
+        self._sdl_dependencies = {}
+        self._sdl_variants = OrderedDict()
+        self._render_cache = None
+        self._frozen = True
+
+        if gc_freeze:
+            gc.collect()
+            gc.freeze()
+        return self
+
+    def publish_sdl(
+        self, path: str, encodings: Collection[str] = ("identity",)
+    ) -> SharedSDL:
+        """
+        Render the SDL once into a read-only, mmap-backed artifact (e.g. in the master process of a pre-fork server),
+        then release the in-process copies: the document, its encodings and the type blocks.
+
+        Workers forked afterward read the shared pages zero-copy with sdl_view, str(schema) decodes them per call.
+        A refresh stops using the artifact, the SDL is rendered in-process again.
+        The returned artifact is owned by the caller, the schema never closes it: close it once the schema
+        is refreshed or dropped and the views it returned are released.
+
+        Args:
+            path: artifact file, written atomically
+            encodings: SDL encodings stored in the artifact, see sdl_bytes
+        """
+        digest = self.sdl_digest  # computed while the blocks are still rendered
+        shared = SharedSDL.write(
+            path, {encoding: self.sdl_bytes(encoding) for encoding in encodings}, digest
+        )
+        self._shared_sdl = shared
+        self._sdl_document = None
+        self._sdl_encoded.clear()
+        self._sdl_variants.clear()
+        self._sdl_blocks = None
+        return shared
+
+    def sdl_view(self, encoding: str = "identity") -> memoryview:
+        """
+        Read-only view of the SDL bytes, zero-copy from the published artifact (see publish_sdl),
+        over the cached sdl_bytes otherwise.
+        """
+        if self._shared_sdl is not None and encoding in self._shared_sdl.encodings:
+            return self._shared_sdl.view(encoding)
+        return memoryview(self.sdl_bytes(encoding))
+
+    def __str__(self):
+        if (
+            self._sdl_document is None
+            and self._shared_sdl is not None
+            and "identity" in self._shared_sdl.encodings
+        ):
+            with self._shared_sdl.view() as view:
+                return str(view, "utf-8")
+        if self._sdl_document is None:
+            type_names = self.sdl_blocks
+            if self.canonical_sdl:
+                type_names = sorted(type_names)
+            self._sdl_document = self._print_document(
+                self.sdl_blocks[type_name] for type_name in type_names
+            )
+        return self._sdl_document
@@ -0,0 +1,40 @@
+from typing import Any
+
+import graphene
+
+from .utils import get_graphene_schema
+
+
+class ServiceType(graphene.ObjectType):
+    """
+    Federation _Service type, its sdl is the schema's cached SDL.
+    """
+
+    class Meta:
+        name = "_Service"
+
+    sdl = graphene.String()
+
+    @staticmethod
+    def resolve_sdl(schema: Any, _info: Any) -> str:
+        return str(schema)
+
+
+def _resolve_service(_root: Any, info: Any) -> Any:
+    return get_graphene_schema(info.schema)
+
+
+def service_field() -> graphene.Field:
+    """
+    Federation _service field, to add to the Query type: _service = service_field()
+
+    It resolves _service { sdl } to the cached annotated SDL, the _service field and
+    the _Service type are left out of that SDL.
+    """
+    return graphene.Field(
+        graphene.NonNull(ServiceType), name="_service", resolver=_resolve_service
+    )
+
+
+def is_service_type(entity_type: Any) -> bool:
+    return getattr(entity_type, "graphene_type", None) is ServiceType
@@ -0,0 +1,103 @@
+import json
+import mmap
+import os
+import tempfile
+from typing import Any, Union
+
+from .exceptions import DirectiveValidationError
+
+_MAGIC = b"graphene-directives-sdl\n"
+_HEADER_SIZE_BYTES = 8
+
+
+class SharedSDL:
+    """
+    Read-only, mmap-backed SDL artifact, rendered once (e.g. in the master process of a pre-fork server)
+    and read zero-copy by every worker through memoryviews.
+
+    The mapping is file backed and shared: workers forked after publishing share its pages,
+    workers started afresh map the same file with SharedSDL.open(path).
+    Close it (or use it as a context manager) once its views are released.
+    """
+
+    def __init__(self, path: str, mapping: mmap.mmap):
+        self.path = path
+        self._mapping = mapping
+        header_start = len(_MAGIC) + _HEADER_SIZE_BYTES
+        if mapping[: len(_MAGIC)] != _MAGIC:
+            raise DirectiveValidationError(f"{path} is not a SDL artifact")
+        header_size = int.from_bytes(mapping[len(_MAGIC) : header_start], "big")
+        header = json.loads(mapping[header_start : header_start + header_size])
+        self.digest: str = header["digest"]
+        # Payload offsets are relative to the end of the header
+        payloads_start = header_start + header_size
+        self._offsets: dict[str, tuple[int, int]] = {
+            encoding: (payloads_start + offset, length)
+            for encoding, (offset, length) in header["encodings"].items()
+        }
+
+    @property
+    def encodings(self) -> tuple[str, ...]:
+        return tuple(self._offsets)
+
+    @classmethod
+    def write(cls, path: str, payloads: dict[str, bytes], digest: str) -> "SharedSDL":
+        """
+        Atomically write an artifact holding one payload per encoding, then map it.
+        """
+        offsets = {}
+        position = 0
+        for encoding, payload in payloads.items():
+            offsets[encoding] = [position, len(payload)]
+            position += len(payload)
+        header = json.dumps({"digest": digest, "encodings": offsets}).encode()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=".sdl-")
+        try:
+            try:
+                file = os.fdopen(descriptor, "wb")
+            except BaseException:
+                os.close(descriptor)
+                raise
+            with file:
+                file.write(_MAGIC)
+                file.write(len(header).to_bytes(_HEADER_SIZE_BYTES, "big"))
+                file.write(header)
+                for payload in payloads.values():
+                    file.write(payload)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path: str) -> "SharedSDL":
+        """
+        Map an artifact written by write (or Schema.publish_sdl), read-only.
+        """
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(path, mapping)
+
+    def view(self, encoding: str = "identity") -> memoryview:
+        """
+        Zero-copy view of the SDL bytes in an encoding, release it before close.
+        """
+        offsets: Union[tuple[int, int], None] = self._offsets.get(encoding)
+        if offsets is None:
+            raise DirectiveValidationError(
+                f"{encoding} is not in the SDL artifact, available: {', '.join(self.encodings)}"
+            )
+        offset, length = offsets
+        return memoryview(self._mapping)[offset : offset + length]
+
+    def close(self) -> None:
+        self._mapping.close()
+
+    def __enter__(self) -> "SharedSDL":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
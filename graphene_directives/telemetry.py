@@ -0,0 +1,166 @@
+import threading
+import weakref
+from collections.abc import Collection
+from random import random
+from typing import Any, Callable
+
+from graphql import GraphQLDirective, default_field_resolver, is_object_type
+
+from .exceptions import DirectiveValidationError
+
+
+class _ExitMarker:
+    """
+    Stored in a thread local, collected when its thread exits.
+    """
+
+
+class FieldUsageRecorder:
+    """
+    Opt-in, sampled usage counters for the fields annotated with tracking directives or @deprecated.
+
+    instrument(schema) wraps the resolvers of those fields only, the other fields are left untouched.
+    Each resolution is sampled with probability sample_rate, sampled resolutions increment a counter
+    of the current thread (no lock is taken), counters of every thread are summed by snapshot().
+    The counters of a thread are folded into the totals and dropped when the thread exits.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.01,
+        directives: Collection[GraphQLDirective] = (),
+        include_deprecated: bool = True,
+        sample: Callable[[], float] = random,
+    ):
+        """
+        :param sample_rate: probability of a resolution being counted, between 0 and 1
+        :param directives: tracking directives, a field is tracked when one of them reaches it
+                (field, type, interface or union level)
+        :param include_deprecated: also track the fields marked @deprecated
+        :param sample: returns a uniform random float in [0, 1)
+        """
+        if not 0 < sample_rate <= 1:
+            raise DirectiveValidationError("sample_rate must be in ]0, 1]")
+
+        self.sample_rate = sample_rate
+        self.directive_names = frozenset(directive.name for directive in directives)
+        self.include_deprecated = include_deprecated
+        self._sample = sample
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # id(counters) -> counters of a live thread
+        self._thread_counters: dict[int, dict[str, int]] = {}
+        # counts of the exited threads
+        self._exited_counters: dict[str, int] = {}
+
+    def _counters(self) -> dict[str, int]:
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters = self._local.counters = {}
+            with self._lock:
+                self._thread_counters[id(counters)] = counters
+            # The thread local values are dropped when the thread exits
+            self._local.exit_marker = marker = _ExitMarker()
+            weakref.finalize(marker, self._fold, counters)
+            return counters
+
+    def _fold(self, counters: dict[str, int]) -> None:
+        with self._lock:
+            del self._thread_counters[id(counters)]
+            for key, count in counters.items():
+                self._exited_counters[key] = self._exited_counters.get(key, 0) + count
+
+    def _is_tracked(
+        self, schema: Any, type_name: str, field_name: str, field: Any
+    ) -> bool:
+        if self.include_deprecated and field.deprecation_reason is not None:
+            return True
+        if not self.directive_names:
+            return False
+        index = schema.directive_index
+        applications = (
+            *schema.inherited_directives.get((type_name, field_name), ()),
+            *index.for_type(type_name),
+            *index.for_field(type_name, field_name),
+        )
+        return any(
+            application.target_directive.name in self.directive_names
+            for application in applications
+        )
+
+    def instrument(self, schema: Any) -> list[str]:
+        """
+        Wrap the resolvers of the tracked fields of a graphene_directives Schema.
+        Instrumenting a schema again with the same recorder does not wrap its resolvers twice.
+
+        :return: the tracked fields, as Type.field
+        """
+        tracked = []
+        for type_name, entity_type in schema.graphql_schema.type_map.items():
+            if not is_object_type(entity_type) or type_name.startswith("__"):
+                continue
+            for field_name, field in entity_type.fields.items():
+                if not self._is_tracked(schema, type_name, field_name, field):
+                    continue
+                key = f"{type_name}.{field_name}"
+                if getattr(field.resolve, "_field_usage_recorder", None) is not self:
+                    field.resolve = self._wrap(
+                        field.resolve or default_field_resolver, key, bool(field.args)
+                    )
+                tracked.append(key)
+        return tracked
+
+    def _wrap(self, resolver: Callable, key: str, has_args: bool) -> Callable:
+        sample = self._sample
+        sample_rate = self.sample_rate
+        counters = self._counters
+
+        def record() -> None:
+            local = counters()
+            local[key] = local.get(key, 0) + 1
+
+        if has_args:
+
+            def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+                if sample() < sample_rate:
+                    record()
+                return resolver(root, info, **kwargs)
+
+            resolve._field_usage_recorder = self  # type: ignore[attr-defined]
+            return resolve
+
+        # graphql-core calls resolvers with **args, skipping the kwargs dict when the field has no argument
+        def resolve_without_args(root: Any, info: Any) -> Any:
+            if sample() < sample_rate:
+                record()
+            return resolver(root, info)
+
+        resolve_without_args._field_usage_recorder = self  # type: ignore[attr-defined]
+        return resolve_without_args
+
+    def snapshot(self, estimate: bool = True) -> dict[str, float]:
+        """
+        Usage counts per Type.field, summed over every thread.
+
+        :param estimate: scale the sampled counts by 1 / sample_rate
+        """
+        with self._lock:
+            totals: dict[str, float] = dict(self._exited_counters)
+            for counters in self._thread_counters.values():
+                for key, count in counters.copy().items():
+                    totals[key] = totals.get(key, 0) + count
+        if estimate:
+            return {key: count / self.sample_rate for key, count in totals.items()}
+        return totals
+
+    def reset(self) -> dict[str, float]:
+        """
+        Reset every counter, returns the sampled counts before the reset.
+        """
+        totals = self.snapshot(estimate=False)
+        with self._lock:
+            self._exited_counters.clear()
+            for counters in self._thread_counters.values():
+                counters.clear()
+        return totals
@@ -1,3 +1,4 @@
+from contextlib import suppress
 from copy import copy
 from typing import Any
 from typing import Union
@@ -11,6 +12,7 @@ from graphql import (
     GraphQLObjectType,
 )
 
+from .constants import REQUEST_STORE_KEY
 from .exceptions import DirectiveValidationError
 
 
@@ -80,3 +82,43 @@ def get_non_field_attribute_value(
     type_: Any, target_directive: GraphQLDirective
 ) -> list[dict]:
     return getattr(type_, non_field_attribute_name(target_directive))
+
+
+def validate_schema_directives(schema_directives: Any) -> None:
+    """
+    Raise DirectiveValidationError when a non-repeatable directive is applied more than once on the schema.
+    """
+    _schema_directive_set: set[str] = set()
+    for schema_directive in schema_directives or []:
+        if schema_directive.target_directive.name in _schema_directive_set:
+            if not schema_directive.target_directive.is_repeatable:
+                raise DirectiveValidationError(
+                    f"{schema_directive.target_directive} is not repeatable on schema"
+                )
+        else:
+            _schema_directive_set.add(schema_directive.target_directive.name)
+
+
+def get_request_store(context: Any) -> dict:
+    """
+    Per request storage kept on the execution context value (dict key or attribute).
+
+    If the context value can't hold it (None, slotted objects), a new dict is returned every time
+    and nothing gets memoized.
+    """
+    if isinstance(context, dict):
+        return context.setdefault(REQUEST_STORE_KEY, {})
+
+    store = getattr(context, REQUEST_STORE_KEY, None)
+    if store is None:
+        store = {}
+        with suppress(AttributeError):
+            setattr(context, REQUEST_STORE_KEY, store)
+    return store
+
+
+def get_graphene_schema(graphql_schema: Any) -> Any:
+    """
+    The graphene_directives Schema which built a GraphQLSchema (e.g. info.schema), None otherwise.
+    """
+    return getattr(graphql_schema, "_graphene_directives_schema", None)
@@ -0,0 +1,100 @@
+import graphene
+from graphql import GraphQLArgument, GraphQLInt, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    SchemaChange,
+    build_schema,
+    diff_schemas,
+    directive,
+)
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+    args={"max_age": GraphQLArgument(GraphQLInt)},
+)
+KeyDirective = CustomDirective(
+    name="key",
+    locations=[DirectiveLocation.OBJECT],
+    args={"fields": GraphQLArgument(GraphQLString)},
+)
+TagDirective = CustomDirective(
+    name="tag",
+    locations=[DirectiveLocation.ARGUMENT_DEFINITION],
+    args={"name": GraphQLArgument(GraphQLString)},
+)
+directives = [CacheDirective, KeyDirective, TagDirective]
+
+
+class Review(graphene.ObjectType):
+    stars = graphene.Int()
+
+
+def build_v1() -> object:
+    @directive(KeyDirective, fields="id")
+    class Product(graphene.ObjectType):
+        id = graphene.ID()
+        name = directive(CacheDirective, field=graphene.String(), max_age=60)
+        price = graphene.Float()
+
+    class Query(graphene.ObjectType):
+        product = graphene.Field(
+            Product,
+            id=directive(
+                TagDirective, field=graphene.Argument(graphene.ID), name="lookup"
+            ),
+        )
+        review = graphene.Field(Review)
+
+    return build_schema(query=Query, directives=directives)
+
+
+def build_v2() -> object:
+    class Product(graphene.ObjectType):
+        id = graphene.ID()
+        name = directive(CacheDirective, field=graphene.String(), max_age=5)
+        price = graphene.Int()
+
+    class Query(graphene.ObjectType):
+        product = graphene.Field(
+            Product, id=graphene.Argument(graphene.ID), sku=graphene.String()
+        )
+        review = graphene.Field(Review)
+        reviews = graphene.List(Review)
+
+    return build_schema(query=Query, directives=directives)
+
+
+def test_diff_schemas_reports_changes() -> None:
+    changes = diff_schemas(build_v1(), build_v2())
+
+    assert changes == [
+        SchemaChange(
+            "directive_removed", "Query.product(id:) @tag", old=[{"name": "lookup"}]
+        ),
+        SchemaChange("argument_added", "Query.product(sku:)", new="String"),
+        SchemaChange("field_added", "Query.reviews", new="[Review]"),
+        SchemaChange("directive_removed", "Product @key", old=[{"fields": "id"}]),
+        SchemaChange(
+            "directive_changed",
+            "Product.name @cache",
+            old=[{"max_age": 60}],
+            new=[{"max_age": 5}],
+        ),
+        SchemaChange("field_type_changed", "Product.price", old="Float", new="Int"),
+    ]
+
+
+def test_diff_schemas_skips_unchanged_types() -> None:
+    old, new = build_v1(), build_v1()
+    assert diff_schemas(old, new) == []
+    assert diff_schemas(new, build_v2()) == diff_schemas(old, build_v2())
+
+    removed = diff_schemas(build_v2(), build_v1())
+    assert SchemaChange("field_removed", "Query.reviews") in removed
+    assert (
+        SchemaChange("directive_added", "Product @key", new=[{"fields": "id"}])
+        in removed
+    )
@@ -0,0 +1,96 @@
+from functools import partial
+from typing import Any
+
+import graphene
+
+from graphene_directives import AuthDirective, build_schema, directive
+
+scope_lookups: list[str] = []
+
+
+def get_scopes(info: Any) -> set[str]:
+    scope_lookups.append(info.context["user"])
+    return info.context["scopes"]
+
+
+Auth = AuthDirective(get_scopes=get_scopes)
+
+
+@directive(Auth, scopes=["read:account"])
+class Account(graphene.ObjectType):
+    name = graphene.String()
+    balance = directive(Auth, field=graphene.Int(), scopes=["read:balance"])
+
+
+class Item(graphene.ObjectType):
+    name = graphene.String()
+    price = directive(Auth, field=graphene.Int(), scopes=["read:price"])
+
+
+class Query(graphene.ObjectType):
+    account = graphene.Field(Account)
+    items = graphene.List(Item)
+
+    @staticmethod
+    def resolve_account(*_: Any) -> dict:
+        return {"name": "main", "balance": 100}
+
+    @staticmethod
+    def resolve_items(*_: Any) -> list[dict]:
+        return [{"name": f"item {i}", "price": i} for i in range(1000)]
+
+
+schema = build_schema(query=Query, directives=[Auth])
+
+
+def test_auth_schema() -> None:
+    schema_str = str(schema)
+    assert 'type Account  @auth(scopes: ["read:account"])' in schema_str
+    assert 'balance: Int @auth(scopes: ["read:balance"])' in schema_str
+    assert "directive @auth(" in schema_str
+
+
+def test_auth_type_level_inherited() -> None:
+    result = schema.execute(
+        "{ account { name } }", context_value={"user": "a", "scopes": set()}
+    )
+    assert result.data == {"account": {"name": None}}
+    assert result.errors[0].extensions == {
+        "code": "FORBIDDEN",
+        "requiredScopes": ["read:account"],
+    }
+
+    result = schema.execute(
+        "{ account { name balance } }",
+        context_value={"user": "b", "scopes": {"read:account"}},
+    )
+    assert result.data == {"account": {"name": "main", "balance": None}}
+    assert result.errors[0].extensions["requiredScopes"] == [
+        "read:account",
+        "read:balance",
+    ]
+
+    result = schema.execute(
+        "{ account { name balance } }",
+        context_value={"user": "c", "scopes": {"read:account", "read:balance"}},
+    )
+    assert result.errors is None
+    assert result.data == {"account": {"name": "main", "balance": 100}}
+
+
+def test_auth_scopes_fetched_once_per_request() -> None:
+    scope_lookups.clear()
+    context = {"user": "d", "scopes": {"read:price"}}
+    result = schema.execute("{ items { name price } }", context_value=context)
+    assert result.errors is None
+    assert len(result.data["items"]) == 1000
+    assert scope_lookups == ["d"]
+
+    guard = context["_graphene_directives"]["@auth"]
+    assert guard.outcomes == {frozenset({"read:price"}): True}
+
+
+def test_auth_non_annotated_fields_untouched() -> None:
+    item_type = schema.graphql_schema.get_type("Item")
+    # graphene's default resolver
+    assert isinstance(item_type.fields["name"].resolve, partial)
@@ -0,0 +1,226 @@
+import asyncio
+
+import graphene
+import pytest
+
+from graphene_directives import (
+    CircuitBreakerDirective,
+    DirectiveValidationError,
+    build_schema,
+    directive,
+)
+
+now = [0.0]
+transitions: list[tuple[str, str]] = []
+healthy = {"inventory": False, "pricing": True}
+calls: list[str] = []
+
+Breaker = CircuitBreakerDirective(
+    window=4,
+    min_calls=4,
+    failure_rate=0.5,
+    reset_timeout=10,
+    on_state_change=lambda dependency, state: transitions.append((dependency, state)),
+    clock=lambda: now[0],
+)
+NullBreaker = CircuitBreakerDirective(
+    window=2, min_calls=2, on_open="null", clock=lambda: now[0], name="nullBreaker"
+)
+
+
+def call(dependency: str) -> int:
+    calls.append(dependency)
+    if not healthy[dependency]:
+        raise ConnectionError(f"{dependency} down")
+    return 1
+
+
+@directive(Breaker, dependency="inventory")
+class Product(graphene.ObjectType):
+    stock = graphene.Int()
+    reserved = graphene.Int()
+
+    @staticmethod
+    def resolve_stock(*_: object) -> int:
+        return call("inventory")
+
+    @staticmethod
+    async def resolve_reserved(*_: object) -> int:
+        return call("inventory")
+
+
+class Query(graphene.ObjectType):
+    product = graphene.Field(Product)
+    price = directive(Breaker, field=graphene.Int(), dependency="pricing")
+    discount = directive(NullBreaker, field=graphene.Int(), dependency="inventory")
+
+    @staticmethod
+    def resolve_product(*_: object) -> dict:
+        return {}
+
+    @staticmethod
+    def resolve_price(*_: object) -> int:
+        return call("pricing")
+
+    @staticmethod
+    def resolve_discount(*_: object) -> int:
+        return call("inventory")
+
+
+schema = build_schema(query=Query, directives=[Breaker, NullBreaker])
+
+
+def execute(query: str) -> graphene.types.schema.ExecutionResult:
+    return asyncio.run(schema.execute_async(query))
+
+
+def test_breaker_opens_and_recovers() -> None:
+    # 2 failing resolutions per request, the breaker opens after the 4th
+    for _ in range(2):
+        result = execute("{ product { stock reserved } price }")
+        assert [error.extensions for error in result.errors] == [{}, {}]
+    assert transitions == [("inventory", "open")]
+
+    calls.clear()
+    result = execute("{ product { stock reserved } price }")
+    assert result.data == {"product": {"stock": None, "reserved": None}, "price": 1}
+    assert [error.extensions for error in result.errors] == [
+        {"code": "CIRCUIT_OPEN", "dependency": "inventory"}
+    ] * 2
+    # other dependencies are not affected
+    assert calls == ["pricing"]
+
+    # after reset_timeout a failing probe opens the breaker again
+    now[0] += 10
+    calls.clear()
+    execute("{ product { stock reserved } }")
+    assert calls == ["inventory"]
+    assert transitions[1:] == [("inventory", "half_open"), ("inventory", "open")]
+
+    # a successful probe closes it
+    now[0] += 10
+    healthy["inventory"] = True
+    calls.clear()
+    result = execute("{ product { stock } }")
+    assert result.data == {"product": {"stock": 1}}
+    assert transitions[3:] == [("inventory", "half_open"), ("inventory", "closed")]
+    result = execute("{ product { stock reserved } }")
+    assert not result.errors
+    assert calls == ["inventory"] * 3
+
+
+def test_breaker_null_fallback() -> None:
+    healthy["inventory"] = False
+    for _ in range(2):
+        assert execute("{ discount }").errors
+    calls.clear()
+    result = execute("{ discount }")
+    assert not result.errors
+    assert result.data == {"discount": None}
+    assert calls == []
+
+
+def test_breaker_invalid_usage() -> None:
+    with pytest.raises(DirectiveValidationError):
+        CircuitBreakerDirective(window=4, min_calls=5)
+    with pytest.raises(DirectiveValidationError):
+        CircuitBreakerDirective(on_open="retry")
+
+
+def test_breaker_cancelled_probe_releases_its_slot() -> None:
+    clock = [0.0]
+    ProbeBreaker = CircuitBreakerDirective(  # noqa: N806
+        window=2, min_calls=2, reset_timeout=10, clock=lambda: clock[0], name="probe"
+    )
+    state = {"fail": True, "hang": False}
+
+    class ProbeQuery(graphene.ObjectType):
+        value = directive(ProbeBreaker, field=graphene.Int(), dependency="db")
+
+        @staticmethod
+        async def resolve_value(*_: object) -> int:
+            if state["hang"]:
+                await asyncio.Event().wait()
+            if state["fail"]:
+                raise ConnectionError("db down")
+            return 1
+
+    probe_schema = build_schema(query=ProbeQuery, directives=[ProbeBreaker])
+
+    async def scenario() -> None:
+        for _ in range(2):
+            assert (await probe_schema.execute_async("{ value }")).errors
+        clock[0] += 10
+
+        # the only probe is cancelled while in flight
+        state["hang"] = True
+        task = asyncio.ensure_future(probe_schema.execute_async("{ value }"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # the next resolution gets to probe, and closes the breaker
+        state.update(hang=False, fail=False)
+        result = await probe_schema.execute_async("{ value }")
+        assert result.errors is None
+        assert result.data == {"value": 1}
+
+    asyncio.run(scenario())
+
+
+def test_breaker_ignores_calls_started_before_it_opened() -> None:
+    clock = [0.0]
+    states: list[str] = []
+    LateBreaker = CircuitBreakerDirective(  # noqa: N806
+        window=2,
+        min_calls=2,
+        reset_timeout=10,
+        on_state_change=lambda _, state: states.append(state),
+        clock=lambda: clock[0],
+        name="late",
+    )
+    gates: list[asyncio.Event] = []
+
+    class LateQuery(graphene.ObjectType):
+        slow = directive(LateBreaker, field=graphene.Int(), dependency="db")
+        failing = directive(LateBreaker, field=graphene.Int(), dependency="db")
+
+        @staticmethod
+        async def resolve_slow(*_: object) -> int:
+            gate = asyncio.Event()
+            gates.append(gate)
+            await gate.wait()
+            return 1
+
+        @staticmethod
+        def resolve_failing(*_: object) -> int:
+            raise ConnectionError("db down")
+
+    late_schema = build_schema(query=LateQuery, directives=[LateBreaker])
+
+    async def scenario() -> None:
+        started_closed = asyncio.ensure_future(late_schema.execute_async("{ slow }"))
+        await asyncio.sleep(0)
+        for _ in range(2):
+            assert (await late_schema.execute_async("{ failing }")).errors
+        assert states == ["open"]
+
+        clock[0] += 10
+        probe = asyncio.ensure_future(late_schema.execute_async("{ slow }"))
+        await asyncio.sleep(0)
+        assert states == ["open", "half_open"]
+
+        # the success of the call started while closed does not close the breaker
+        gates[0].set()
+        assert (await started_closed).data == {"slow": 1}
+        assert states == ["open", "half_open"]
+        result = await late_schema.execute_async("{ failing }")
+        assert result.errors[0].extensions["code"] == "CIRCUIT_OPEN"
+
+        # the probe does
+        gates[1].set()
+        assert (await probe).data == {"slow": 1}
+        assert states == ["open", "half_open", "closed"]
+
+    asyncio.run(scenario())
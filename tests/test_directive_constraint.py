@@ -0,0 +1,194 @@
+import graphene
+import pytest
+from graphql import execute_sync, parse
+
+from graphene_directives import (
+    ConstraintDirective,
+    DirectiveValidationError,
+    build_schema,
+    directive,
+)
+
+Constraint = ConstraintDirective()
+
+
+class AddressInput(graphene.InputObjectType):
+    zip_code = directive(
+        Constraint, field=graphene.String(required=True), pattern="^[0-9]{5}$"
+    )
+
+
+class UserInput(graphene.InputObjectType):
+    name = directive(
+        Constraint, field=graphene.String(required=True), min_length=2, max_length=8
+    )
+    tags = directive(Constraint, field=graphene.List(graphene.String), max_length=2)
+    addresses = graphene.List(AddressInput)
+    friends = graphene.List(lambda: UserInput)
+
+
+class Item(graphene.ObjectType):
+    name = graphene.String(user=graphene.Argument(UserInput))
+
+    @staticmethod
+    def resolve_name(root: int, _info: object, user: dict) -> str:
+        return f"{user['name']} {root}"
+
+
+class Query(graphene.ObjectType):
+    items = graphene.List(Item)
+    search = graphene.Field(
+        graphene.String,
+        term=directive(
+            Constraint, field=graphene.Argument(graphene.String), pattern="^[a-z]+$"
+        ),
+        limit=directive(
+            Constraint, field=graphene.Argument(graphene.Int), min=1, max=100
+        ),
+    )
+    create_user = graphene.String(user=graphene.Argument(UserInput, required=True))
+    echo = graphene.String(value=graphene.Argument(graphene.String))
+
+    @staticmethod
+    def resolve_items(*_: object) -> list[int]:
+        return list(range(3))
+
+    @staticmethod
+    def resolve_search(*_: object, term: str = "", limit: int = 10) -> str:
+        return f"{term}:{limit}"
+
+    @staticmethod
+    def resolve_create_user(*_: object, user: dict) -> str:
+        return user["name"]
+
+    @staticmethod
+    def resolve_echo(*_: object, value: str) -> str:
+        return value
+
+
+schema = build_schema(query=Query, directives=[Constraint])
+
+
+def test_constraint_schema() -> None:
+    schema_str = str(schema)
+    assert 'zipCode: String! @constraint(pattern: "^[0-9]{5}$")' in schema_str
+    assert (
+        'search(term: String @constraint(pattern: "^[a-z]+$"), limit: Int @constraint(min: 1.0, max: 100.0)): String'
+        in schema_str
+    )
+
+
+def test_constraint_valid_arguments() -> None:
+    result = schema.execute('{ search(term: "abc", limit: 5) }')
+    assert result.errors is None
+    assert result.data == {"search": "abc:5"}
+
+
+def test_constraint_reports_all_violations() -> None:
+    result = schema.execute('{ search(term: "ABC", limit: 500) }')
+    assert result.data == {"search": None}
+    assert result.errors[0].extensions == {
+        "code": "BAD_USER_INPUT",
+        "violations": [
+            {"path": "term", "message": "must match pattern '^[a-z]+$'"},
+            {"path": "limit", "message": "must be at most 100.0"},
+        ],
+    }
+
+
+def test_constraint_nested_input_fields() -> None:
+    result = schema.execute(
+        """{
+            createUser(user: {
+                name: "x"
+                tags: ["a", "b", "c"]
+                addresses: [{zipCode: "12345"}, {zipCode: "1234"}]
+                friends: [{name: "a very long name"}]
+            })
+        }"""
+    )
+    assert result.data == {"createUser": None}
+    assert result.errors[0].extensions["violations"] == [
+        {"path": "user.name", "message": "length must be at least 2"},
+        {"path": "user.tags", "message": "length must be at most 2"},
+        {
+            "path": "user.addresses[1].zipCode",
+            "message": "must match pattern '^[0-9]{5}$'",
+        },
+        {"path": "user.friends[0].name", "message": "length must be at most 8"},
+    ]
+
+    result = schema.execute('{ createUser(user: {name: "john"}) }')
+    assert result.errors is None
+    assert result.data == {"createUser": "john"}
+
+
+def test_constraint_unconstrained_fields_untouched() -> None:
+    query_type = schema.graphql_schema.query_type
+    assert query_type.fields["echo"].resolve.__name__ == "resolve_echo"
+
+
+def test_constraint_invalid_pattern() -> None:
+    class InvalidQuery(graphene.ObjectType):
+        field = graphene.String(
+            value=directive(
+                Constraint, field=graphene.Argument(graphene.String), pattern="("
+            )
+        )
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(query=InvalidQuery, directives=[Constraint])
+
+
+def test_constraint_incompatible_type() -> None:
+    class PatternOnInt(graphene.ObjectType):
+        field = graphene.String(
+            value=directive(
+                Constraint, field=graphene.Argument(graphene.Int), pattern="^1"
+            )
+        )
+
+    class MinOnString(graphene.InputObjectType):
+        value = directive(Constraint, field=graphene.String(), min=1)
+
+    class MinOnStringQuery(graphene.ObjectType):
+        field = graphene.String(value=graphene.Argument(MinOnString))
+
+    class LengthOnInt(graphene.ObjectType):
+        field = graphene.String(
+            n=directive(Constraint, field=graphene.Argument(graphene.Int), max_length=3)
+        )
+
+    for query in (PatternOnInt, MinOnStringQuery, LengthOnInt):
+        with pytest.raises(DirectiveValidationError):
+            build_schema(query=query, directives=[Constraint])
+
+
+def test_constraint_list_items_checked_per_field_node() -> None:
+    context: dict = {}
+    result = schema.execute(
+        '{ items { name(user: {name: "john"}) } }', context_value=context
+    )
+    assert result.errors is None
+    assert result.data == {
+        "items": [{"name": "john 0"}, {"name": "john 1"}, {"name": "john 2"}]
+    }
+    assert len(context["_graphene_directives"]["@constraint"]) == 1
+
+    result = schema.execute('{ items { name(user: {name: "j"}) } }', context_value={})
+    assert result.data == {"items": [{"name": None}] * 3}
+    assert len(result.errors) == 3
+
+
+def test_constraint_variables_checked_on_every_execution() -> None:
+    # Literal arguments are checked once per field node, variables have to be checked again
+    document = parse("query ($term: String) { search(term: $term, limit: 5) }")
+    for term, valid in (("abc", True), ("ABC", False), ("abc", True)):
+        result = execute_sync(
+            schema.graphql_schema, document, variable_values={"term": term}
+        )
+        assert (result.errors is None) is valid
+
+    document = parse('{ search(term: "ABC", limit: 5) }')
+    for _ in range(2):
+        assert execute_sync(schema.graphql_schema, document).errors
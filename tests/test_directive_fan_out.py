@@ -0,0 +1,173 @@
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterator
+
+import graphene
+import pytest
+
+from graphene_directives import (
+    DirectiveValidationError,
+    FanOutDirective,
+    build_schema,
+    directive,
+)
+
+drops: Counter = Counter()
+feeds: dict[str, asyncio.Queue] = {}
+started: list[str] = []
+closed: list[str] = []
+
+
+def on_drop(type_name: str, field_name: str) -> None:
+    drops[f"{type_name}.{field_name}"] += 1
+
+
+FanOut = FanOutDirective(queue_size=10, on_drop=on_drop)
+
+
+async def ticker(topic: str) -> AsyncIterator[int]:
+    started.append(topic)
+    try:
+        while True:
+            item = await feeds[topic].get()
+            if item is None:
+                return
+            yield item
+    finally:
+        closed.append(topic)
+
+
+class Query(graphene.ObjectType):
+    ping = graphene.String()
+
+
+class Subscription(graphene.ObjectType):
+    ticks = directive(FanOut, field=graphene.Int(topic=graphene.String()))
+    small_ticks = directive(
+        FanOut, field=graphene.Int(topic=graphene.String()), queue_size=2
+    )
+
+    @staticmethod
+    def subscribe_ticks(_root: object, _info: object, topic: str) -> AsyncIterator:
+        return ticker(topic)
+
+    @staticmethod
+    async def subscribe_small_ticks(
+        _root: object, _info: object, topic: str
+    ) -> AsyncIterator:
+        return ticker(topic)
+
+
+schema = build_schema(query=Query, subscription=Subscription, directives=[FanOut])
+
+
+async def settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def subscribe(field: str, topic: str) -> AsyncIterator:
+    return await schema.subscribe(f'subscription {{ {field}(topic: "{topic}") }}')
+
+
+def reset(*topics: str) -> None:
+    started.clear()
+    closed.clear()
+    drops.clear()
+    for topic in topics:
+        feeds[topic] = asyncio.Queue()
+
+
+def test_fan_out_shares_upstream() -> None:
+    async def run() -> None:
+        reset("a", "b")
+        first, second, other = (
+            await subscribe("ticks", "a"),
+            await subscribe("ticks", "a"),
+            await subscribe("ticks", "b"),
+        )
+        pending = [asyncio.ensure_future(it.__anext__()) for it in (first, second)]
+        other_pending = asyncio.ensure_future(other.__anext__())
+        await settle()
+        assert sorted(started) == ["a", "b"]
+
+        feeds["a"].put_nowait(1)
+        feeds["b"].put_nowait(2)
+        assert [(await task).data for task in pending] == [{"ticks": 1}] * 2
+        assert (await other_pending).data == {"ticks": 2}
+
+        await first.aclose()
+        await settle()
+        assert closed == []
+
+        feeds["a"].put_nowait(3)
+        assert (await second.__anext__()).data == {"ticks": 3}
+
+        await second.aclose()
+        await other.aclose()
+        await settle()
+        assert sorted(closed) == ["a", "b"]
+
+    asyncio.run(run())
+
+
+def test_fan_out_restarts_after_teardown() -> None:
+    async def run() -> None:
+        reset("c")
+        for value in range(2):
+            iterator = await subscribe("ticks", "c")
+            pending = asyncio.ensure_future(iterator.__anext__())
+            await settle()
+            feeds["c"].put_nowait(value)
+            assert (await pending).data == {"ticks": value}
+            await iterator.aclose()
+            await settle()
+        assert started == ["c", "c"]
+        assert closed == ["c", "c"]
+
+    asyncio.run(run())
+
+
+def test_fan_out_drops_for_slow_subscriber() -> None:
+    async def run() -> None:
+        reset("d")
+        fast, slow = (
+            await subscribe("smallTicks", "d"),
+            await subscribe("smallTicks", "d"),
+        )
+        pending = [asyncio.ensure_future(it.__anext__()) for it in (fast, slow)]
+        await settle()
+        feeds["d"].put_nowait(0)
+        await asyncio.gather(*pending)
+
+        received = []
+        for value in range(1, 6):
+            feeds["d"].put_nowait(value)
+            await settle()
+            received.append((await fast.__anext__()).data["smallTicks"])
+        assert received == [1, 2, 3, 4, 5]
+
+        # the slow subscriber only kept the 2 most recent events
+        assert (await slow.__anext__()).data == {"smallTicks": 4}
+        assert (await slow.__anext__()).data == {"smallTicks": 5}
+        assert drops == {"Subscription.smallTicks": 3}
+
+        feeds["d"].put_nowait(None)
+        await settle()
+        for iterator in (fast, slow):
+            with pytest.raises(StopAsyncIteration):
+                await iterator.__anext__()
+        assert closed == ["d"]
+
+    asyncio.run(run())
+
+
+def test_fan_out_invalid_usage() -> None:
+    class QueryField(graphene.ObjectType):
+        value = directive(FanOut, field=graphene.Int())
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(query=QueryField, directives=[FanOut])
+
+    with pytest.raises(DirectiveValidationError):
+        FanOutDirective(drop="all")
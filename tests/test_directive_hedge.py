@@ -0,0 +1,114 @@
+import asyncio
+from collections import Counter
+
+import graphene
+import pytest
+
+from graphene_directives import (
+    DirectiveValidationError,
+    HedgeDirective,
+    build_schema,
+    directive,
+)
+
+Hedge = HedgeDirective(after_ms=50, min_samples=5)
+
+calls: Counter = Counter()
+cancelled: Counter = Counter()
+latencies: dict[str, list[float]] = {}
+
+
+async def replica(field: str) -> str:
+    calls[field] += 1
+    call = calls[field]
+    try:
+        await asyncio.sleep(latencies[field][call - 1])
+    except asyncio.CancelledError:
+        cancelled[field] += 1
+        raise
+    return f"{field}-{call}"
+
+
+class Query(graphene.ObjectType):
+    value = directive(Hedge, field=graphene.String(), max_extra=2)
+    adaptive = directive(Hedge, field=graphene.String())
+    failing = directive(Hedge, field=graphene.String(), after_ms=10)
+    sync_value = directive(Hedge, field=graphene.String())
+
+    @staticmethod
+    async def resolve_value(*_: object) -> str:
+        return await replica("value")
+
+    @staticmethod
+    async def resolve_adaptive(*_: object) -> str:
+        return await replica("adaptive")
+
+    @staticmethod
+    async def resolve_failing(*_: object) -> str:
+        calls["failing"] += 1
+        await asyncio.sleep(0.05)
+        raise ValueError("unavailable")
+
+    @staticmethod
+    def resolve_sync_value(*_: object) -> str:
+        calls["sync_value"] += 1
+        return "sync"
+
+
+schema = build_schema(query=Query, directives=[Hedge])
+
+
+def execute(query: str) -> graphene.types.schema.ExecutionResult:
+    return asyncio.run(schema.execute_async(query))
+
+
+def test_hedge_takes_first_result_and_cancels_loser() -> None:
+    latencies["value"] = [1.0, 1.0, 0.0]
+    result = execute("{ value }")
+    assert not result.errors
+    # the second hedge is started 50ms after the first one and wins
+    assert result.data == {"value": "value-3"}
+    assert calls["value"] == 3
+    assert cancelled["value"] == 2
+
+
+def test_hedge_fast_resolution_is_not_duplicated() -> None:
+    calls.clear()
+    latencies["value"] = [0.0]
+    assert execute("{ value }").data == {"value": "value-1"}
+    assert calls["value"] == 1
+
+
+def test_hedge_adaptive_delay() -> None:
+    calls.clear()
+    cancelled.clear()
+    latencies["adaptive"] = [0.001] * 10 + [0.04, 0.0]
+
+    async def run() -> list:
+        return [await schema.execute_async("{ adaptive }") for _ in range(11)]
+
+    results = asyncio.run(run())
+    assert results[-1].data == {"adaptive": "adaptive-12"}
+    # 40ms is below after_ms, it is hedged only once the fast latencies were observed
+    assert calls["adaptive"] == 12
+    assert cancelled["adaptive"] == 1
+
+
+def test_hedge_errors_and_sync() -> None:
+    calls.clear()
+    result = execute("{ failing syncValue }")
+    assert result.errors[0].message == "unavailable"
+    assert calls["failing"] == 2
+    assert result.data == {"failing": None, "syncValue": "sync"}
+    assert calls["sync_value"] == 1
+
+
+def test_hedge_invalid_usage() -> None:
+    with pytest.raises(DirectiveValidationError):
+        HedgeDirective(percentile=2)
+
+    class NegativeQuery(graphene.ObjectType):
+        value = directive(Hedge, field=graphene.String(), max_extra=-1)
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(query=NegativeQuery, directives=[Hedge])
@@ -0,0 +1,108 @@
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterator, Iterator
+
+import graphene
+import pytest
+
+from graphene_directives import (
+    DirectiveValidationError,
+    MaxItemsDirective,
+    build_schema,
+    directive,
+)
+
+metrics: Counter = Counter()
+pulled: list[int] = []
+
+
+def on_exceeded(type_name: str, field_name: str, limit: int) -> None:
+    metrics[f"{type_name}.{field_name}:{limit}"] += 1
+
+
+MaxItems = MaxItemsDirective(on_exceeded=on_exceeded)
+
+
+def numbers() -> Iterator[int]:
+    for i in range(100_000):
+        pulled.append(i)
+        yield i
+
+
+async def async_numbers() -> AsyncIterator[int]:
+    for i in range(100_000):
+        pulled.append(i)
+        yield i
+
+
+class Query(graphene.ObjectType):
+    items = directive(MaxItems, field=graphene.List(graphene.Int), limit=3)
+    strict_items = directive(
+        MaxItems, field=graphene.List(graphene.Int), limit=3, reject=True
+    )
+    small_items = directive(MaxItems, field=graphene.List(graphene.Int), limit=3)
+    generated = directive(MaxItems, field=graphene.List(graphene.Int), limit=3)
+    streamed = directive(MaxItems, field=graphene.List(graphene.Int), limit=3)
+    awaited = directive(MaxItems, field=graphene.List(graphene.Int), limit=3)
+
+    @staticmethod
+    def resolve_items(*_: object) -> list[int]:
+        return list(range(10))
+
+    @staticmethod
+    def resolve_strict_items(*_: object) -> list[int]:
+        return list(range(10))
+
+    @staticmethod
+    def resolve_small_items(*_: object) -> list[int]:
+        return [1, 2]
+
+    @staticmethod
+    def resolve_generated(*_: object) -> Iterator[int]:
+        return numbers()
+
+    @staticmethod
+    def resolve_streamed(*_: object) -> AsyncIterator[int]:
+        return async_numbers()
+
+    @staticmethod
+    async def resolve_awaited(*_: object) -> list[int]:
+        return list(range(10))
+
+
+schema = build_schema(query=Query, directives=[MaxItems])
+
+
+def test_max_items_truncate_and_reject() -> None:
+    metrics.clear()
+    result = schema.execute("{ items smallItems strictItems }")
+    assert result.data == {
+        "items": [0, 1, 2],
+        "smallItems": [1, 2],
+        "strictItems": None,
+    }
+    assert result.errors[0].extensions == {"code": "MAX_ITEMS_EXCEEDED", "limit": 3}
+    assert metrics == {"Query.items:3": 1, "Query.strictItems:3": 1}
+
+
+def test_max_items_generator_not_materialized() -> None:
+    pulled.clear()
+    result = schema.execute("{ generated }")
+    assert result.data == {"generated": [0, 1, 2]}
+    assert pulled == [0, 1, 2, 3]
+
+
+def test_max_items_async() -> None:
+    pulled.clear()
+    result = asyncio.run(schema.execute_async("{ streamed awaited }"))
+    assert result.errors is None
+    assert result.data == {"streamed": [0, 1, 2], "awaited": [0, 1, 2]}
+    assert pulled == [0, 1, 2, 3]
+
+
+def test_max_items_list_fields_only() -> None:
+    class InvalidQuery(graphene.ObjectType):
+        name = directive(MaxItems, field=graphene.String(), limit=3)
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(query=InvalidQuery, directives=[MaxItems])
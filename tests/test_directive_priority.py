@@ -0,0 +1,134 @@
+import asyncio
+import time
+from functools import partial
+
+import graphene
+
+from graphene_directives import (
+    EventLoopLag,
+    InFlightRequests,
+    PriorityDirective,
+    build_schema,
+    directive,
+    get_priority_table,
+)
+
+load = {"value": 0.0}
+
+Priority = PriorityDirective(
+    load_signal=lambda: load["value"], thresholds={0: 10, 1: 100}
+)
+
+
+@directive(Priority, level=1)
+class Product(graphene.ObjectType):
+    name = directive(Priority, field=graphene.String(), level=5)
+    description = graphene.String()
+    recommendations = directive(Priority, field=graphene.List(graphene.String), level=0)
+
+
+class Query(graphene.ObjectType):
+    product = graphene.Field(Product)
+
+    @staticmethod
+    def resolve_product(*_: object) -> dict:
+        return {"name": "p", "description": "d", "recommendations": ["a"]}
+
+
+schema = build_schema(query=Query, directives=[Priority])
+
+QUERY = "{ product { name description recommendations } }"
+
+
+def test_priority_table() -> None:
+    assert get_priority_table(schema, Priority) == {
+        ("Product", "name"): 5,
+        ("Product", "description"): 1,
+        ("Product", "recommendations"): 0,
+    }
+
+
+def test_priority_load_shedding() -> None:
+    load["value"] = 5
+    result = schema.execute(QUERY)
+    assert result.errors is None
+
+    load["value"] = 50
+    result = schema.execute(QUERY)
+    assert result.data == {
+        "product": {"name": "p", "description": "d", "recommendations": None}
+    }
+    assert result.errors[0].extensions == {
+        "code": "LOAD_SHED",
+        "priority": 0,
+        "load": 50,
+    }
+
+    load["value"] = 500
+    result = schema.execute(QUERY)
+    assert result.data == {
+        "product": {"name": "p", "description": None, "recommendations": None}
+    }
+    assert len(result.errors) == 2
+    load["value"] = 0
+
+
+def test_priority_without_threshold_not_wrapped() -> None:
+    product_type = schema.graphql_schema.get_type("Product")
+    # graphene's default resolver
+    assert isinstance(product_type.fields["name"].resolve, partial)
+
+
+def test_in_flight_requests_signal() -> None:
+    in_flight = InFlightRequests()
+    assert in_flight() == 0
+    with in_flight, in_flight:
+        assert in_flight() == 2
+    assert in_flight() == 0
+
+
+def test_event_loop_lag_signal() -> None:
+    lag = EventLoopLag(interval=0.01)
+
+    async def main() -> float:
+        lag.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # block the loop
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        lag.stop()
+        return lag()
+
+    assert asyncio.run(main()) >= 0.05
+
+
+def test_priority_inherited_from_interface_field() -> None:
+    class Entity(graphene.Interface):
+        summary = directive(Priority, field=graphene.String(), level=0)
+        title = directive(Priority, field=graphene.String(), level=0)
+
+    class Article(graphene.ObjectType):
+        class Meta:
+            interfaces = (Entity,)
+
+        title = directive(Priority, field=graphene.String(), level=1)
+
+    class EntityQuery(graphene.ObjectType):
+        article = graphene.Field(Article)
+
+        @staticmethod
+        def resolve_article(*_: object) -> dict:
+            return {"summary": "s", "title": "t"}
+
+    entity_schema = build_schema(query=EntityQuery, directives=[Priority])
+    table = get_priority_table(entity_schema, Priority)
+    assert table[("Article", "summary")] == 0
+    assert table[("Article", "title")] == 1
+
+    load["value"] = 50
+    try:
+        result = entity_schema.execute("{ article { summary title } }")
+    finally:
+        load["value"] = 0
+    assert result.data == {"article": {"summary": None, "title": "t"}}
+    assert result.errors[0].extensions["priority"] == 0
@@ -0,0 +1,164 @@
+import gc
+import sqlite3
+from typing import Any
+
+import graphene
+from graphql import execute, parse
+
+from graphene_directives import (
+    ColumnDirective,
+    build_schema,
+    directive,
+    get_selected_columns,
+)
+from graphene_directives.directives import projection
+
+Column = ColumnDirective()
+
+connection = sqlite3.connect(":memory:")
+connection.row_factory = sqlite3.Row
+connection.executescript(
+    """
+    CREATE TABLE books (id INTEGER, title TEXT, isbn TEXT, summary TEXT, author_name TEXT);
+    INSERT INTO books VALUES (1, 'Dune', '0441013597', 'Spice', 'Frank Herbert');
+    INSERT INTO books VALUES (2, 'Emma', '0141439580', 'Match', 'Jane Austen');
+    """
+)
+statements: list[str] = []
+connection.set_trace_callback(statements.append)
+
+
+class Author(graphene.ObjectType):
+    name = directive(Column, field=graphene.String(), name="author_name")
+
+
+class Book(graphene.ObjectType):
+    id = directive(Column, field=graphene.Int(), name="id")
+    title = directive(Column, field=graphene.String(), name="title")
+    isbn = directive(Column, field=graphene.String(), name="isbn")
+    label = directive(
+        Column,
+        field=directive(Column, field=graphene.String(), name="isbn"),
+        name="title",
+    )
+    author = graphene.Field(Author)
+
+    @staticmethod
+    def resolve_label(root: dict, _info: Any) -> str:
+        return f"{root['title']} ({root['isbn']})"
+
+    @staticmethod
+    def resolve_author(root: dict, _info: Any) -> dict:
+        return {"name": root["author_name"]}
+
+
+class Query(graphene.ObjectType):
+    books = graphene.List(Book)
+
+    @staticmethod
+    def resolve_books(_root: Any, info: Any) -> list[dict]:
+        # nested paths ("author.author_name") are stored on the books table too
+        columns = {column.split(".")[-1] for column in get_selected_columns(info)}
+        query = f"SELECT {', '.join(sorted(columns))} FROM books ORDER BY id"  # noqa: S608
+        return [dict(row) for row in connection.execute(query).fetchall()]
+
+
+schema = build_schema(query=Query, directives=[Column])
+
+
+def test_selected_columns_query() -> None:
+    statements.clear()
+    result = schema.execute("{ books { title } }")
+    assert result.errors is None
+    assert result.data == {"books": [{"title": "Dune"}, {"title": "Emma"}]}
+    assert statements == ["SELECT title FROM books ORDER BY id"]
+
+
+def test_selected_columns_fragments_and_nesting() -> None:
+    statements.clear()
+    result = schema.execute(
+        """
+        query {
+            books {
+                ...BookFields
+                ... on Book { author { name } }
+                __typename
+            }
+        }
+        fragment BookFields on Book { id label }
+        """
+    )
+    assert result.errors is None
+    assert result.data["books"][0] == {
+        "id": 1,
+        "label": "Dune (0441013597)",
+        "author": {"name": "Frank Herbert"},
+        "__typename": "Book",
+    }
+    assert statements == ["SELECT author_name, id, isbn, title FROM books ORDER BY id"]
+
+
+def test_selected_columns_variables_not_memoized() -> None:
+    query = "query ($withIsbn: Boolean!) { books { id isbn @include(if: $withIsbn) } }"
+
+    statements.clear()
+    schema.execute(query, variable_values={"withIsbn": True})
+    schema.execute(query, variable_values={"withIsbn": False})
+    assert statements == [
+        "SELECT id, isbn FROM books ORDER BY id",
+        "SELECT id FROM books ORDER BY id",
+    ]
+
+
+def test_selected_columns_memoized_per_document() -> None:
+    document = parse("{ books { id title } }")
+    projection._selected_columns_memo.clear()
+    execute(schema.graphql_schema, document)
+    execute(schema.graphql_schema, document)
+    assert len(projection._selected_columns_memo) == 1
+    ((_, schemas),) = projection._selected_columns_memo.values()
+    ((key, (_, columns)),) = schemas[schema.graphql_schema].items()
+    assert key[1:] == (("books",), "Book", "column")
+    assert columns == frozenset({"id", "title"})
+
+    # the entries go away with the document
+    del document, schemas
+    gc.collect()
+    assert projection._selected_columns_memo == {}
+
+
+def test_selected_columns_memo_is_per_document_not_per_equal_node() -> None:
+    # the books field nodes of both documents are equal, their fragments are not
+    statements.clear()
+    first = schema.execute("{ books { ...F } } fragment F on Book { id }")
+    second = schema.execute("{ books { ...F } } fragment F on Book { isbn }")
+    assert first.data == {"books": [{"id": 1}, {"id": 2}]}
+    assert second.data == {"books": [{"isbn": "0441013597"}, {"isbn": "0141439580"}]}
+    assert statements == [
+        "SELECT id FROM books ORDER BY id",
+        "SELECT isbn FROM books ORDER BY id",
+    ]
+
+
+def test_selected_columns_memoized_per_schema() -> None:
+    class RenamedBook(graphene.ObjectType):
+        class Meta:
+            name = "Book"
+
+        id = directive(Column, field=graphene.Int(), name="id")
+        title = directive(Column, field=graphene.String(), name="summary")
+
+    class RenamedQuery(graphene.ObjectType):
+        books = graphene.List(RenamedBook)
+        resolve_books = Query.resolve_books
+
+    renamed_schema = build_schema(query=RenamedQuery, directives=[Column])
+    document = parse("{ books { title } }")
+
+    statements.clear()
+    execute(schema.graphql_schema, document)
+    execute(renamed_schema.graphql_schema, document)
+    assert statements == [
+        "SELECT title FROM books ORDER BY id",
+        "SELECT summary FROM books ORDER BY id",
+    ]
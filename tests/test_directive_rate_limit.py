@@ -0,0 +1,121 @@
+import graphene
+import pytest
+
+from graphene_directives import (
+    DirectiveValidationError,
+    InMemoryRateLimitStore,
+    RateLimitDirective,
+    RateLimitStore,
+    build_schema,
+    directive,
+)
+
+now = [0.0]
+
+
+class DictStore(RateLimitStore):
+    def __init__(self) -> None:
+        self.buckets = {}
+
+    def get(self, key: object) -> tuple[float, float]:
+        return self.buckets.get(key)
+
+    def set(self, key: object, state: tuple[float, float]) -> None:
+        self.buckets[key] = state
+
+
+store = DictStore()
+RateLimit = RateLimitDirective(
+    get_client=lambda info: info.context["client"], store=store, clock=lambda: now[0]
+)
+
+
+class Query(graphene.ObjectType):
+    search = directive(RateLimit, field=graphene.String(), per_second=1, burst=2)
+    profile = directive(
+        RateLimit, field=graphene.String(), per_second=10, burst=1, key="client"
+    )
+    user = directive(
+        RateLimit,
+        field=graphene.Field(graphene.String, user_id=graphene.Argument(graphene.ID)),
+        per_second=1,
+        key="userId",
+    )
+
+    @staticmethod
+    def resolve_search(*_: object) -> str:
+        return "search"
+
+    @staticmethod
+    def resolve_profile(*_: object) -> str:
+        return "profile"
+
+    @staticmethod
+    def resolve_user(_root: object, _info: object, user_id: str) -> str:
+        return user_id
+
+
+schema = build_schema(query=Query, directives=[RateLimit])
+
+
+def execute(query: str, client: str = "a") -> graphene.types.schema.ExecutionResult:
+    return schema.execute(query, context={"client": client})
+
+
+def test_rate_limit_token_bucket() -> None:
+    assert [execute("{ search }").data["search"] for _ in range(2)] == ["search"] * 2
+    result = execute("{ search }")
+    assert result.data == {"search": None}
+    assert result.errors[0].extensions == {"code": "RATE_LIMITED", "retryAfter": 1.0}
+
+    now[0] += 0.5
+    assert execute("{ search }").errors[0].extensions["retryAfter"] == 0.5
+    now[0] += 0.5
+    assert execute("{ search }").data == {"search": "search"}
+
+
+def test_rate_limit_keys() -> None:
+    assert not execute("{ profile }", client="a").errors
+    assert execute("{ profile }", client="a").errors
+    assert not execute("{ profile }", client="b").errors
+
+    assert not execute('{ user(userId: "1") }').errors
+    assert execute('{ user(userId: "1") }').errors
+    assert not execute('{ user(userId: "2") }').errors
+    assert ("Query.user", "2") in store.buckets
+
+
+def test_rate_limit_in_memory_store_evicts_idle_keys() -> None:
+    memory = InMemoryRateLimitStore(max_keys=2)
+    memory.set("a", (1.0, 0.0))
+    memory.set("b", (1.0, 0.0))
+    assert memory.get("a") == (1.0, 0.0)
+    memory.set("c", (1.0, 0.0))
+    assert len(memory) == 2
+    assert memory.get("b") is None
+    assert memory.get("a") is not None
+
+
+def test_rate_limit_invalid_usage() -> None:
+    class BadKey(graphene.ObjectType):
+        value = directive(RateLimit, field=graphene.String(), per_second=1, key="id")
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(query=BadKey, directives=[RateLimit])
+
+    no_client = RateLimitDirective()
+
+    class NoClient(graphene.ObjectType):
+        value = directive(
+            no_client, field=graphene.String(), per_second=1, key="client"
+        )
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(query=NoClient, directives=[no_client])
+
+    class PartialStore(RateLimitStore):
+        def get(self, _key: object) -> None:
+            return None
+
+    with pytest.raises(TypeError):
+        PartialStore()
@@ -0,0 +1,109 @@
+from typing import Any, Callable
+
+import graphene
+from graphql import GraphQLArgument, GraphQLNonNull, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    Schema,
+    build_schema,
+    directive,
+)
+
+
+def upper_wrapper(
+    resolver: Callable,
+    _parent_type: Any,
+    _field_name: str,
+    _field_type: Any,
+    _inputs: list[dict],
+    _schema: Schema,
+) -> Callable:
+    def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+        return resolver(root, info, **kwargs).upper()
+
+    return resolve
+
+
+def suffix_wrapper(
+    resolver: Callable,
+    _parent_type: Any,
+    _field_name: str,
+    _field_type: Any,
+    inputs: list[dict],
+    _schema: Schema,
+) -> Callable:
+    suffix = "".join(values["value"] for values in inputs)
+
+    def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+        return resolver(root, info, **kwargs) + suffix
+
+    return resolve
+
+
+UpperDirective = CustomDirective(
+    name="upper",
+    locations=[DirectiveLocation.FIELD_DEFINITION],
+    description="Upper cases the field value.",
+    resolver_wrapper=upper_wrapper,
+)
+
+SuffixDirective = CustomDirective(
+    name="suffix",
+    locations=[DirectiveLocation.FIELD_DEFINITION],
+    args={"value": GraphQLArgument(GraphQLNonNull(GraphQLString))},
+    is_repeatable=True,
+    description="Appends a suffix to the field value.",
+    resolver_wrapper=suffix_wrapper,
+)
+
+
+class User(graphene.ObjectType):
+    name = directive(UpperDirective, field=graphene.String())
+    nick_name = directive(
+        SuffixDirective,
+        field=directive(
+            SuffixDirective,
+            field=directive(UpperDirective, field=graphene.String()),
+            value="_b",
+        ),
+        value="_a",
+    )
+    email = graphene.String()
+
+    @staticmethod
+    def resolve_email(root: Any, _info: Any) -> str:
+        return root["email"]
+
+
+class Query(graphene.ObjectType):
+    user = graphene.Field(User)
+
+    @staticmethod
+    def resolve_user(*_: Any) -> dict:
+        return {"name": "john", "nick_name": "jo", "email": "john@example.com"}
+
+
+schema = build_schema(query=Query, directives=[UpperDirective, SuffixDirective])
+
+
+def test_resolver_wrapper_applied() -> None:
+    result = schema.execute("{ user { name nickName email } }")
+    assert result.errors is None
+    # upper is declared first, so it wraps the suffixes
+    assert result.data == {
+        "user": {"name": "JOHN", "nickName": "JO_B_A", "email": "john@example.com"}
+    }
+
+
+def test_resolver_wrapper_skips_non_annotated_fields() -> None:
+    user_type = schema.graphql_schema.get_type("User")
+    assert user_type.fields["email"].resolve.__name__ == "resolve_email"
+    assert user_type.fields["name"].resolve.__name__ == "resolve"
+
+
+def test_resolver_wrapper_schema_unchanged() -> None:
+    assert 'nickName: String @upper @suffix(value: "_b") @suffix(value: "_a")' in str(
+        schema
+    )
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+
+import graphene
+import pytest
+
+from graphene_directives import (
+    DirectiveValidationError,
+    StaticDirective,
+    build_schema,
+    directive,
+)
+
+calls: Counter = Counter()
+errors: list[Exception] = []
+version = [1]
+
+Static = StaticDirective(on_refresh_error=errors.append)
+
+
+class Query(graphene.ObjectType):
+    features = directive(Static, field=graphene.List(graphene.String))
+    config = directive(Static, field=graphene.String(), lazy=True)
+    remote = directive(Static, field=graphene.String(), lazy=True)
+    version = directive(Static, field=graphene.Int(), refresh_seconds=0.01)
+
+    @staticmethod
+    def resolve_features(*_: object) -> list[str]:
+        calls["features"] += 1
+        return ["a", "b"]
+
+    @staticmethod
+    def resolve_config(*_: object) -> str:
+        calls["config"] += 1
+        return "config"
+
+    @staticmethod
+    async def resolve_remote(*_: object) -> str:
+        calls["remote"] += 1
+        return "remote"
+
+    @staticmethod
+    def resolve_version(*_: object) -> int:
+        if version[0] == 3:
+            raise ValueError("refresh failed")
+        return version[0]
+
+
+schema = build_schema(query=Query, directives=[Static])
+
+
+def test_static_computed_at_build() -> None:
+    assert calls["features"] == 1
+    for _ in range(3):
+        assert schema.execute("{ features }").data == {"features": ["a", "b"]}
+    assert calls["features"] == 1
+
+
+def test_static_lazy() -> None:
+    assert calls["config"] == 0
+    for _ in range(3):
+        assert schema.execute("{ config }").data == {"config": "config"}
+    assert calls["config"] == 1
+
+    async def run() -> list:
+        return [(await schema.execute_async("{ remote }")).data for _ in range(3)]
+
+    assert asyncio.run(run()) == [{"remote": "remote"}] * 3
+    assert calls["remote"] == 1
+
+
+def wait_for(predicate: object) -> None:
+    deadline = time.monotonic() + 2
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_static_refresh() -> None:
+    assert schema.execute("{ version }").data == {"version": 1}
+    version[0] = 2
+    wait_for(lambda: schema.execute("{ version }").data == {"version": 2})
+    assert schema.execute("{ version }").data == {"version": 2}
+
+    version[0] = 3
+    wait_for(lambda: schema.execute("{ version }").data and errors)
+    assert isinstance(errors[0], ValueError)
+    assert schema.execute("{ version }").data == {"version": 2}
+
+    # refreshes are driven by resolutions, no thread is left running in between
+    wait_for(
+        lambda: not any(t.name.startswith("@static") for t in threading.enumerate())
+    )
+    assert not any(t.name.startswith("@static") for t in threading.enumerate())
+
+
+def test_static_invalid_usage() -> None:
+    class WithArgs(graphene.ObjectType):
+        value = directive(Static, field=graphene.String(id=graphene.ID()))
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(query=WithArgs, directives=[Static])
+
+    class EagerAsync(graphene.ObjectType):
+        value = directive(Static, field=graphene.String())
+
+        @staticmethod
+        async def resolve_value(*_: object) -> str:
+            return "value"
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(query=EagerAsync, directives=[Static])
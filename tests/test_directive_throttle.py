@@ -0,0 +1,152 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import graphene
+import pytest
+
+from graphene_directives import (
+    DirectiveValidationError,
+    ThrottleDirective,
+    build_schema,
+    directive,
+)
+from graphene_directives.directives.throttle import _throttle
+
+Throttle = ThrottleDirective(max_batch=5)
+
+closed: list[str] = []
+
+
+async def burst(name: str, count: int) -> AsyncIterator[int]:
+    try:
+        for i in range(count):
+            yield i
+    finally:
+        closed.append(name)
+
+
+async def ticks() -> AsyncIterator[int]:
+    for i in range(3):
+        yield i
+        await asyncio.sleep(0.05)
+
+
+class Query(graphene.ObjectType):
+    ping = graphene.String()
+
+
+class Subscription(graphene.ObjectType):
+    latest = directive(Throttle, field=graphene.Int(), ms=20)
+    batch = directive(
+        Throttle, field=graphene.List(graphene.Int), ms=20, strategy="batch"
+    )
+    slow = directive(Throttle, field=graphene.Int(), ms=10)
+    plain = graphene.Int()
+
+    @staticmethod
+    async def subscribe_latest(*_: object) -> AsyncIterator[int]:
+        return burst("latest", 10)
+
+    @staticmethod
+    def subscribe_batch(*_: object) -> AsyncIterator[int]:
+        return burst("batch", 12)
+
+    @staticmethod
+    def subscribe_slow(*_: object) -> AsyncIterator[int]:
+        return ticks()
+
+    @staticmethod
+    def subscribe_plain(*_: object) -> AsyncIterator[int]:
+        return burst("plain", 3)
+
+
+schema = build_schema(query=Query, subscription=Subscription, directives=[Throttle])
+
+
+def collect(field: str, limit: int = 100) -> list[Any]:
+    async def run() -> list[Any]:
+        result = await schema.subscribe(f"subscription {{ {field} }}")
+        events = []
+        async for event in result:
+            assert not event.errors
+            events.append(event.data[field])
+            if len(events) == limit:
+                await result.aclose()
+                break
+        return events
+
+    return asyncio.run(run())
+
+
+def test_throttle_sdl() -> None:
+    sdl = str(schema)
+    assert "latest: Int @throttle(ms: 20)" in sdl
+    assert 'batch: [Int] @throttle(ms: 20, strategy: "batch")' in sdl
+
+
+def test_throttle_latest_drops_intermediate_events() -> None:
+    assert collect("latest") == [0, 9]
+
+
+def test_throttle_batch_is_bounded() -> None:
+    # first event emitted on the leading edge, the 11 others buffered, only the last 5 kept
+    assert collect("batch") == [[0], [7, 8, 9, 10, 11]]
+
+
+def test_throttle_slow_source_is_untouched() -> None:
+    assert collect("slow") == [0, 1, 2]
+
+
+def test_throttle_closes_source() -> None:
+    closed.clear()
+    assert collect("latest", limit=1) == [0]
+    assert closed == ["latest"]
+
+
+def test_throttle_cancelled_while_waiting() -> None:
+    async def stalled() -> AsyncIterator[int]:
+        yield 0
+        await asyncio.Event().wait()
+
+    async def run() -> None:
+        throttled = _throttle(stalled(), 0.01, 1, False)
+        assert await throttled.__anext__() == 0
+        waiting = asyncio.ensure_future(throttled.__anext__())
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        # the source is closed after its pending __anext__ is done, not while running
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+    asyncio.run(run())
+
+
+def test_throttle_not_applied() -> None:
+    assert collect("plain") == [0, 1, 2]
+
+
+def test_throttle_invalid_usage() -> None:
+    class BatchQuery(graphene.ObjectType):
+        ping = graphene.String()
+
+    class BatchSubscription(graphene.ObjectType):
+        value = directive(Throttle, field=graphene.Int(), ms=20, strategy="batch")
+
+        @staticmethod
+        def subscribe_value(*_: object) -> AsyncIterator[int]:
+            return burst("value", 1)
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(
+            query=BatchQuery, subscription=BatchSubscription, directives=[Throttle]
+        )
+
+    class QueryField(graphene.ObjectType):
+        value = directive(Throttle, field=graphene.Int(), ms=20)
+
+    with pytest.raises(DirectiveValidationError):
+        build_schema(query=QueryField, directives=[Throttle])
+
+    with pytest.raises(DirectiveValidationError):
+        ThrottleDirective(max_batch=0)
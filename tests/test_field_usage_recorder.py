@@ -0,0 +1,126 @@
+import threading
+import time
+from itertools import cycle
+
+import graphene
+import pytest
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    DirectiveValidationError,
+    FieldUsageRecorder,
+    build_schema,
+    directive,
+)
+
+TrackDirective = CustomDirective(
+    name="track",
+    locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+)
+
+
+@directive(TrackDirective)
+class Legacy(graphene.ObjectType):
+    code = graphene.String()
+
+
+class Query(graphene.ObjectType):
+    name = directive(TrackDirective, field=graphene.String())
+    old_name = graphene.String(deprecation_reason="use name")
+    plain = graphene.String()
+    legacy = graphene.Field(Legacy)
+
+    @staticmethod
+    def resolve_name(*_: object) -> str:
+        return "name"
+
+    @staticmethod
+    def resolve_old_name(*_: object) -> str:
+        return "old"
+
+    @staticmethod
+    def resolve_legacy(*_: object) -> dict:
+        return {"code": "x"}
+
+
+def test_field_usage_recorder_tracks_annotated_fields() -> None:
+    schema = build_schema(query=Query, directives=[TrackDirective])
+    recorder = FieldUsageRecorder(sample_rate=1, directives=[TrackDirective])
+    assert sorted(recorder.instrument(schema)) == [
+        "Legacy.code",
+        "Query.name",
+        "Query.oldName",
+    ]
+
+    for _ in range(3):
+        result = schema.execute("{ name oldName plain legacy { code } }")
+        assert result.data == {
+            "name": "name",
+            "oldName": "old",
+            "plain": None,
+            "legacy": {"code": "x"},
+        }
+    assert recorder.snapshot() == {
+        "Query.name": 3,
+        "Query.oldName": 3,
+        "Legacy.code": 3,
+    }
+    assert recorder.reset() == {"Query.name": 3, "Query.oldName": 3, "Legacy.code": 3}
+    assert recorder.snapshot() == {}
+
+
+def test_field_usage_recorder_sampling_and_threads() -> None:
+    schema = build_schema(query=Query, directives=[TrackDirective])
+    draws = cycle([0.05, 0.5, 0.5, 0.5])
+    lock = threading.Lock()
+
+    def sample() -> float:
+        with lock:
+            return next(draws)
+
+    recorder = FieldUsageRecorder(
+        sample_rate=0.25, include_deprecated=False, sample=sample
+    )
+    assert recorder.instrument(schema) == []
+
+    recorder = FieldUsageRecorder(
+        sample_rate=0.25,
+        directives=[TrackDirective],
+        include_deprecated=False,
+        sample=sample,
+    )
+    assert recorder.instrument(schema) == ["Query.name", "Legacy.code"]
+
+    def run() -> None:
+        for _ in range(20):
+            schema.execute("{ name }")
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert recorder.snapshot(estimate=False) == {"Query.name": 20}
+    assert recorder.snapshot() == {"Query.name": 80}
+    # the counters of the exited threads are folded into the totals
+    deadline = time.monotonic() + 1
+    while recorder._thread_counters and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert recorder._thread_counters == {}
+    assert recorder.snapshot(estimate=False) == {"Query.name": 20}
+
+
+def test_field_usage_recorder_instrument_twice() -> None:
+    schema = build_schema(query=Query, directives=[TrackDirective])
+    recorder = FieldUsageRecorder(sample_rate=1, directives=[TrackDirective])
+    assert recorder.instrument(schema) == recorder.instrument(schema)
+
+    schema.execute("{ name }")
+    assert recorder.snapshot() == {"Query.name": 1}
+
+
+def test_field_usage_recorder_invalid_rate() -> None:
+    with pytest.raises(DirectiveValidationError):
+        FieldUsageRecorder(sample_rate=0)
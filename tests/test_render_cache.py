@@ -0,0 +1,131 @@
+import gc
+import weakref
+from typing import Any
+
+import graphene
+from graphql import GraphQLArgument, GraphQLInt, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    RenderCache,
+    build_schema,
+    directive,
+)
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+    args={"max_age": GraphQLArgument(GraphQLInt)},
+)
+OwnerDirective = CustomDirective(
+    name="owner",
+    locations=[DirectiveLocation.OBJECT],
+    args={"name": GraphQLArgument(GraphQLString)},
+    input_transform=lambda inputs, schema: {**inputs, "name": schema.tenant},
+)
+
+
+@directive(CacheDirective, max_age=30)
+class Product(graphene.ObjectType):
+    name = directive(CacheDirective, field=graphene.String(), max_age=40)
+
+
+@directive(OwnerDirective)
+class Shop(graphene.ObjectType):
+    title = graphene.String()
+
+
+class Query(graphene.ObjectType):
+    product = graphene.Field(Product)
+    shop = graphene.Field(Shop)
+
+
+def build(render_cache: RenderCache, tenant: str, auto_camelcase: bool = True) -> Any:
+    schema = build_schema(
+        query=Query,
+        directives=[CacheDirective, OwnerDirective],
+        auto_camelcase=auto_camelcase,
+        render_cache=render_cache,
+    )
+    schema.tenant = tenant
+    return schema
+
+
+def test_render_cache_shares_blocks_between_schemas() -> None:
+    render_cache = RenderCache()
+    first = build(render_cache, "a")
+    document = str(first)
+    assert render_cache.hits == 0
+
+    second = build(render_cache, "b")
+    assert str(second) == document.replace('"a"', '"b"')
+    assert render_cache.hits > 0
+    # blocks applying an input_transform directive are rendered per schema
+    assert 'type Shop @owner(name: "b")' in second.sdl_for_type("Shop")
+    assert sorted(d.name for d in second.get_directives_used()) == ["cache", "owner"]
+
+    # other settings do not share entries
+    hits = render_cache.hits
+    str(build(render_cache, "a", auto_camelcase=False))
+    assert render_cache.hits == hits
+
+
+def test_render_cache_invalidated_by_refresh() -> None:
+    render_cache = RenderCache()
+    schema = build(render_cache, "a")
+    str(schema)
+
+    applications = Product.name._directive_cache_field
+    applications[0]["maxAge"] = 60
+    try:
+        schema.refresh(types=[Product])
+        assert "maxAge: 60" in build(render_cache, "a").sdl_for_type("Product")
+    finally:
+        applications[0]["maxAge"] = 40
+        render_cache.invalidate()
+    assert len(render_cache) == 0
+
+
+def test_render_cache_is_bounded_and_weak() -> None:
+    render_cache = RenderCache(max_entries=2)
+    for _ in range(3):
+        str(build(render_cache, "a"))
+    assert len(render_cache) == 2
+
+    class Temporary(graphene.ObjectType):
+        value = graphene.String()
+
+    class TemporaryQuery(graphene.ObjectType):
+        temporary = graphene.Field(Temporary)
+
+    render_cache = RenderCache()
+    str(build_schema(query=TemporaryQuery, render_cache=render_cache))
+    assert len(render_cache) > 0
+    del Temporary, TemporaryQuery
+    gc.collect()
+    assert len(render_cache) == 0
+
+
+def test_render_cache_releases_evicted_directives() -> None:
+    render_cache = RenderCache(max_entries=2)
+    released = []
+    for evict in (lambda: str(build(render_cache, "a")), render_cache.invalidate):
+        temporary_directive = CustomDirective(
+            name="temporary",
+            locations=[DirectiveLocation.OBJECT],
+            args={"max_age": GraphQLArgument(GraphQLInt)},
+        )
+        str(
+            build_schema(
+                query=Query,
+                directives=[CacheDirective, temporary_directive],
+                render_cache=render_cache,
+            )
+        )
+        ref = weakref.ref(temporary_directive)
+        del temporary_directive
+        evict()
+        gc.collect()
+        released.append(ref() is None)
+    assert released == [True, True]
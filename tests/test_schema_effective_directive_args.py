@@ -0,0 +1,87 @@
+import graphene
+import pytest
+from graphql import GraphQLArgument, GraphQLInt, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    SchemaDirective,
+    build_schema,
+    directive,
+)
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[
+        DirectiveLocation.SCHEMA,
+        DirectiveLocation.OBJECT,
+        DirectiveLocation.INTERFACE,
+        DirectiveLocation.FIELD_DEFINITION,
+    ],
+    args={
+        "max_age": GraphQLArgument(GraphQLInt),
+        "scope": GraphQLArgument(GraphQLString),
+    },
+    is_repeatable=True,
+)
+LinkDirective = CustomDirective(
+    name="link",
+    locations=[DirectiveLocation.SCHEMA],
+    args={"url": GraphQLArgument(GraphQLString)},
+)
+
+
+@directive(CacheDirective, max_age=30, scope="PUBLIC")
+class Node(graphene.Interface):
+    id = directive(CacheDirective, field=graphene.ID(), max_age=3600)
+    name = graphene.String()
+
+
+@directive(CacheDirective, max_age=200)
+class User(graphene.ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    name = directive(CacheDirective, field=graphene.String(), scope="PRIVATE")
+    email = directive(CacheDirective, field=graphene.String(), max_age=0)
+
+
+class Query(graphene.ObjectType):
+    user = graphene.Field(User)
+    version = graphene.String()
+
+
+schema = build_schema(
+    query=Query,
+    directives=[CacheDirective, LinkDirective],
+    schema_directives=[
+        SchemaDirective(CacheDirective, {"max_age": 10, "scope": "PUBLIC"}),
+        SchemaDirective(LinkDirective, {"url": "https://example.com"}),
+    ],
+)
+
+
+def test_effective_directive_args_precedence() -> None:
+    table = schema.effective_directive_args
+
+    # field over type over interface over schema
+    assert table[("User", "name")]["cache"] == {"max_age": 200, "scope": "PRIVATE"}
+    assert table[("User", "email")]["cache"] == {"max_age": 0, "scope": "PUBLIC"}
+    # the interface field level is still below the type level
+    assert table[("User", "id")]["cache"] == {"max_age": 200, "scope": "PUBLIC"}
+    assert table[("Node", "id")]["cache"] == {"max_age": 3600, "scope": "PUBLIC"}
+    assert table[("Node", "name")]["cache"] == {"max_age": 30, "scope": "PUBLIC"}
+    assert table[("Query", "version")]["cache"] == {"max_age": 10, "scope": "PUBLIC"}
+    # schema only directives are not merged into fields
+    assert "link" not in table[("Query", "version")]
+    # nor into the introspection types
+    assert not any(type_name.startswith("__") for type_name, _ in table)
+
+
+def test_effective_directive_args_read_only() -> None:
+    table = schema.effective_directive_args
+    assert table is schema.effective_directive_args
+    with pytest.raises(TypeError):
+        table[("User", "name")] = {}
+    with pytest.raises(TypeError):
+        table[("User", "name")]["cache"]["max_age"] = 1
@@ -0,0 +1,126 @@
+import gc
+
+import graphene
+import pytest
+from graphql import GraphQLArgument, GraphQLInt, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    DirectiveValidationError,
+    build_schema,
+    directive,
+)
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[
+        DirectiveLocation.OBJECT,
+        DirectiveLocation.FIELD_DEFINITION,
+        DirectiveLocation.ARGUMENT_DEFINITION,
+    ],
+    args={"max_age": GraphQLArgument(GraphQLInt)},
+    is_repeatable=True,
+)
+TagDirective = CustomDirective(
+    name="tag",
+    locations=[DirectiveLocation.ENUM_VALUE],
+    args={"name": GraphQLArgument(GraphQLString)},
+)
+
+
+@directive(CacheDirective, max_age=30)
+class Product(graphene.ObjectType):
+    name = directive(CacheDirective, field=graphene.String(), max_age=40)
+    price = graphene.Float(
+        currency=directive(
+            CacheDirective, field=graphene.Argument(graphene.String), max_age=5
+        )
+    )
+
+    @staticmethod
+    def resolve_name(*_: object) -> str:
+        return "cup"
+
+
+class Node(graphene.Interface):
+    name = directive(CacheDirective, field=graphene.String(), max_age=10)
+
+
+class ProductRecord(graphene.ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+
+class Query(graphene.ObjectType):
+    product = graphene.Field(Product, resolver=lambda *_: {})
+    record = graphene.Field(ProductRecord)
+
+
+def test_freeze_makes_directive_metadata_immutable() -> None:
+    schema = build_schema(query=Query, directives=[CacheDirective, TagDirective])
+    document = str(schema)
+    blocks = dict(schema.sdl_blocks)
+    hashes = dict(schema.sdl_hashes)
+    index = schema.directive_index
+
+    assert schema.freeze() is schema
+    assert schema.freeze() is schema
+    assert str(schema) == document
+    assert schema._sdl_blocks is None
+    assert schema.sdl_hashes == hashes
+    assert schema._sdl_blocks is None
+    assert schema.sdl_for_type("Product") == blocks["Product"]
+    assert schema.execute("{ product { name } }").data == {"product": {"name": "cup"}}
+
+    frozen_index = schema.directive_index
+    assert frozen_index is not index
+    assert isinstance(frozen_index.for_type("Product"), tuple)
+    assert frozen_index.for_type("Product")[0].arguments == {"max_age": 30}
+    with pytest.raises(TypeError):
+        frozen_index.for_type("Product")[0].arguments["max_age"] = 60
+    with pytest.raises(TypeError):
+        schema.directives_used["tag"] = TagDirective
+    assert not hasattr(frozen_index.for_type("Product")[0], "__dict__")
+
+    # the derived tables hold the applications of the frozen index
+    inherited = schema.inherited_directives[("ProductRecord", "name")]
+    assert inherited[0] is frozen_index.for_field("Node", "name")[0]
+    with pytest.raises(TypeError):
+        inherited[0].arguments["max_age"] = 60
+    assert schema.effective_directive_args[("ProductRecord", "name")] == {
+        "cache": {"max_age": 10}
+    }
+    assert list(schema.directives_used) == ["cache"]
+
+    with pytest.raises(DirectiveValidationError, match="frozen"):
+        schema.refresh(types=["Product"])
+
+
+def test_freeze_leaves_shared_types_alone() -> None:
+    @directive(CacheDirective, max_age=30)
+    class Shared(graphene.ObjectType):
+        name = directive(CacheDirective, field=graphene.String(), max_age=40)
+
+    class SharedQuery(graphene.ObjectType):
+        shared = graphene.Field(Shared)
+
+    frozen = build_schema(query=SharedQuery, directives=[CacheDirective]).freeze()
+    document = str(frozen)
+    other = build_schema(query=SharedQuery, directives=[CacheDirective])
+
+    # the graphene types still belong to the other schemas
+    assert isinstance(Shared._directive_cache_non_field, list)
+    directive(CacheDirective, max_age=10)(Shared)
+    other.refresh(types=["Shared"])
+    assert "@cache(maxAge: 10)" in other.sdl_for_type("Shared")
+    assert str(frozen) == document
+
+
+def test_freeze_gc_freeze() -> None:
+    schema = build_schema(query=Query, directives=[CacheDirective, TagDirective])
+    try:
+        schema.freeze(gc_freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,108 @@
+from typing import Any, Callable
+
+import graphene
+from graphql import GraphQLArgument, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    build_schema,
+    directive,
+)
+
+
+def tag_wrapper(
+    resolver: Callable,
+    _parent_type: Any,
+    _field_name: str,
+    _field_type: Any,
+    inputs: list[dict],
+    _schema: Any,
+) -> Callable:
+    tags = "".join(f"[{values['name']}]" for values in inputs)
+
+    def resolve(root: Any, info: Any, **kwargs: Any) -> Any:
+        return f"{resolver(root, info, **kwargs)}{tags}"
+
+    return resolve
+
+
+TagDirective = CustomDirective(
+    name="tag",
+    locations=[
+        DirectiveLocation.OBJECT,
+        DirectiveLocation.INTERFACE,
+        DirectiveLocation.UNION,
+        DirectiveLocation.FIELD_DEFINITION,
+    ],
+    args={"name": GraphQLArgument(GraphQLString)},
+    is_repeatable=True,
+    resolver_wrapper=tag_wrapper,
+)
+
+
+@directive(TagDirective, name="node")
+class Node(graphene.Interface):
+    id = directive(TagDirective, field=graphene.ID(), name="node.id")
+
+
+class Named(graphene.Interface):
+    name = directive(TagDirective, field=graphene.String(), name="named.name")
+
+
+@directive(TagDirective, name="user")
+class User(graphene.ObjectType):
+    class Meta:
+        interfaces = (Node, Named)
+
+    email = graphene.String()
+
+
+class Bot(graphene.ObjectType):
+    owner = graphene.String()
+
+
+@directive(TagDirective, name="actor")
+class Actor(graphene.Union):
+    class Meta:
+        types = (User, Bot)
+
+
+class Query(graphene.ObjectType):
+    user = graphene.Field(User)
+    actor = graphene.Field(Actor)
+
+    @staticmethod
+    def resolve_user(*_: object) -> dict:
+        return {"id": "1", "name": "ada", "email": "a@b.c"}
+
+
+schema = build_schema(query=Query, directives=[TagDirective])
+
+
+def names(type_name: str, field_name: str) -> list[str]:
+    return [
+        application.arguments["name"]
+        for application in schema.inherited_directives.get((type_name, field_name), ())
+    ]
+
+
+def test_inherited_directives_table() -> None:
+    assert names("User", "id") == ["actor", "node", "node.id"]
+    assert names("User", "name") == ["actor", "node", "named.name"]
+    assert names("User", "email") == ["actor", "node"]
+    assert names("Bot", "owner") == ["actor"]
+    assert names("Node", "id") == []
+    assert ("Query", "user") not in schema.inherited_directives
+
+
+def test_inherited_directives_wrap_resolvers() -> None:
+    result = schema.execute("{ user { id name email } }")
+    assert not result.errors
+    assert result.data == {
+        "user": {
+            "id": "1[actor][node][node.id][user]",
+            "name": "ada[actor][node][named.name][user]",
+            "email": "a@b.c[actor][node][user]",
+        }
+    }
@@ -0,0 +1,79 @@
+import graphene
+from graphql import GraphQLArgument, GraphQLInt, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    build_schema,
+    directive,
+)
+
+environment = {"owner": "team-a"}
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+    args={"max_age": GraphQLArgument(GraphQLInt)},
+)
+OwnerDirective = CustomDirective(
+    name="owner",
+    locations=[DirectiveLocation.OBJECT, DirectiveLocation.ARGUMENT_DEFINITION],
+    args={"name": GraphQLArgument(GraphQLString)},
+    input_transform=lambda inputs, _schema: {**inputs, "name": environment["owner"]},
+)
+
+
+@directive(CacheDirective, max_age=30)
+class Product(graphene.ObjectType):
+    name = directive(CacheDirective, field=graphene.String(), max_age=40)
+
+
+class Review(graphene.ObjectType):
+    stars = graphene.Field(
+        graphene.Int,
+        scale=directive(OwnerDirective, field=graphene.Argument(graphene.Int)),
+    )
+
+
+@directive(OwnerDirective)
+class Shop(graphene.ObjectType):
+    title = graphene.String()
+
+
+class Query(graphene.ObjectType):
+    product = graphene.Field(Product)
+    review = graphene.Field(Review)
+    shop = graphene.Field(Shop)
+
+
+def test_refresh_rerenders_changed_types_only() -> None:
+    schema = build_schema(query=Query, directives=[CacheDirective, OwnerDirective])
+    document = str(schema)
+    assert str(schema) is document
+
+    applications = Product.name._directive_cache_field
+    applications[0]["maxAge"] = 60
+    try:
+        assert schema.refresh(types=[Product]) == ["Product"]
+        assert "name: String @cache(maxAge: 60)" in schema.sdl_for_type("Product")
+        assert str(schema) == document.replace("maxAge: 40", "maxAge: 60")
+        # unchanged blocks are reused as is
+        assert schema.sdl_blocks.rendered()[-1] == "Product"
+    finally:
+        applications[0]["maxAge"] = 40
+
+
+def test_refresh_follows_directive_dependencies() -> None:
+    schema = build_schema(query=Query, directives=[CacheDirective, OwnerDirective])
+    document = str(schema)
+    assert 'scale: Int @owner(name: "team-a")' in document
+
+    environment["owner"] = "team-b"
+    try:
+        assert sorted(schema.refresh(directives=[OwnerDirective])) == ["Review", "Shop"]
+        assert str(schema) == document.replace("team-a", "team-b")
+        assert schema.directive_index.for_type("Shop")[0].arguments == {
+            "name": "team-b"
+        }
+    finally:
+        environment["owner"] = "team-a"
@@ -0,0 +1,138 @@
+from typing import Callable
+
+import graphene
+from graphql import GraphQLArgument, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    build_schema,
+    directive,
+)
+from graphene_directives.schema import SDL_VARIANTS_MAX_ENTRIES
+
+TagDirective = CustomDirective(
+    name="tag",
+    locations=[
+        DirectiveLocation.OBJECT,
+        DirectiveLocation.INTERFACE,
+        DirectiveLocation.FIELD_DEFINITION,
+        DirectiveLocation.ARGUMENT_DEFINITION,
+        DirectiveLocation.ENUM_VALUE,
+        DirectiveLocation.INPUT_FIELD_DEFINITION,
+    ],
+    args={"name": GraphQLArgument(GraphQLString)},
+    is_repeatable=True,
+)
+
+
+def tagged(name: str) -> Callable[[list], bool]:
+    return lambda applications: any(
+        application.target_directive.name == "tag"
+        and application.arguments.get("name") == name
+        for application in applications
+    )
+
+
+@directive(TagDirective, name="public")
+class Node(graphene.Interface):
+    id = graphene.ID()
+
+
+@directive(TagDirective, name="internal")
+class Secret(graphene.ObjectType):
+    value = graphene.String()
+
+
+class Color(graphene.Enum):
+    RED = 1
+    BLUE = 2
+
+
+class Filter(graphene.InputObjectType):
+    text = graphene.String()
+    debug = directive(TagDirective, field=graphene.Boolean(), name="internal")
+
+
+class User(graphene.ObjectType):
+    class Meta:
+        interfaces = (Node,)
+
+    name = graphene.String()
+    secret = graphene.Field(Secret)
+    email = directive(TagDirective, field=graphene.String(), name="internal")
+    color = graphene.Field(Color)
+
+
+class Query(graphene.ObjectType):
+    users = directive(
+        TagDirective,
+        field=graphene.List(
+            User,
+            filter=graphene.Argument(Filter),
+            trace=directive(
+                TagDirective, field=graphene.Argument(graphene.Boolean), name="internal"
+            ),
+        ),
+        name="public",
+    )
+    secret = graphene.Field(Secret)
+    ping = graphene.String()
+
+
+def test_render_without_predicates_is_the_full_document() -> None:
+    schema = build_schema(query=Query, directives=[TagDirective])
+    assert schema.render() == str(schema)
+
+
+def test_render_exclude_prunes_and_drops_unreachable_types() -> None:
+    schema = build_schema(query=Query, directives=[TagDirective])
+    document = schema.render(exclude=tagged("internal"))
+
+    assert "type Secret" not in document
+    assert "secret:" not in document
+    assert "email:" not in document
+    assert "trace:" not in document
+    assert "debug:" not in document
+    assert "filter: Filter" in document
+    assert "enum Color" in document
+    # interface implementations are kept while the interface is reachable
+    assert "type User implements Node" in document
+    assert "ping: String" in document
+
+
+def test_render_include_keeps_matching_fields() -> None:
+    schema = build_schema(query=Query, directives=[TagDirective])
+    document = schema.render(include=tagged("public"))
+
+    # users is tagged, the fields of User are inherited from the public Node interface
+    assert "users(" in document
+    query_block = document.split("type Query")[1].split("}")[0]
+    assert "ping:" not in query_block
+    assert "secret:" not in query_block
+    assert "name: String" in document
+    assert "email: String" in document
+
+
+def test_render_caches_variants() -> None:
+    schema = build_schema(query=Query, directives=[TagDirective])
+    exclude = tagged("internal")
+    document = schema.render(exclude=exclude)
+    assert schema.render(exclude=exclude) is document
+    assert schema.render(exclude=tagged("internal"), key="public") is (
+        schema.render(exclude=tagged("other"), key="public")
+    )
+    # the variants are dropped by refresh
+    schema.refresh(types=[User])
+    assert schema.render(exclude=exclude) is not document
+    assert schema.render(exclude=exclude) == document
+
+
+def test_render_variants_are_bounded() -> None:
+    schema = build_schema(query=Query, directives=[TagDirective])
+    exclude = tagged("internal")
+    first = schema.render(exclude=exclude, key=0)
+    for key in range(1, SDL_VARIANTS_MAX_ENTRIES + 1):
+        schema.render(exclude=exclude, key=key)
+    assert len(schema._sdl_variants) == SDL_VARIANTS_MAX_ENTRIES
+    assert schema.render(exclude=exclude, key=0) is not first
@@ -0,0 +1,100 @@
+import graphene
+import pytest
+from graphql import GraphQLArgument, GraphQLInt, GraphQLNonNull
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    build_schema,
+    directive,
+)
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[
+        DirectiveLocation.OBJECT,
+        DirectiveLocation.ENUM,
+        DirectiveLocation.ENUM_VALUE,
+        DirectiveLocation.SCALAR,
+        DirectiveLocation.FIELD_DEFINITION,
+        DirectiveLocation.ARGUMENT_DEFINITION,
+    ],
+    args={"max_age": GraphQLArgument(GraphQLNonNull(GraphQLInt))},
+)
+
+
+@directive(CacheDirective, max_age=10)
+class Color(graphene.Enum):
+    RED = 1
+    GREEN = 2
+
+
+@directive(CacheDirective, max_age=20)
+class Date(graphene.Scalar):
+    pass
+
+
+class DateTime(graphene.Scalar):
+    pass
+
+
+@directive(CacheDirective, max_age=30)
+class Product(graphene.ObjectType):
+    name = directive(CacheDirective, field=graphene.String(), max_age=40)
+    price = graphene.Field(
+        graphene.Float,
+        currency=directive(
+            CacheDirective, field=graphene.Argument(graphene.String), max_age=50
+        ),
+    )
+    color = graphene.Field(Color)
+    released = graphene.Field(Date)
+    updated = graphene.Field(DateTime)
+
+
+class Query(graphene.ObjectType):
+    product = graphene.Field(Product)
+
+
+def build() -> graphene.Schema:
+    return build_schema(query=Query, directives=[CacheDirective])
+
+
+def test_sdl_for_type_matches_full_document() -> None:
+    schema = build()
+    document = str(schema)
+    for type_name in ("Product", "Color", "Date", "DateTime", "Query"):
+        assert schema.sdl_for_type(type_name) in document
+
+    assert schema.sdl_for_type("Product") == "\n".join([
+        "type Product  @cache(maxAge: 30) {",
+        "  name: String @cache(maxAge: 40)",
+        "  price(currency: String @cache(maxAge: 50)): Float",
+        "  color: Color",
+        "  released: Date",
+        "  updated: DateTime",
+        "}",
+    ])
+    assert schema.sdl_for_type("Date") == "scalar Date @cache(maxAge: 20)"
+    # a scalar whose name starts with an annotated scalar's name is left untouched
+    assert schema.sdl_for_type("DateTime") == "scalar DateTime"
+
+
+def test_sdl_blocks_are_lazy_and_cached() -> None:
+    schema = build()
+    blocks = schema.sdl_blocks
+    assert blocks.rendered() == []
+    assert list(blocks) == ["Query", "Product", "Color", "Date", "DateTime"]
+    assert "String" not in blocks
+
+    block = schema.sdl_for_type("Color")
+    assert blocks.rendered() == ["Color"]
+    assert schema.sdl_for_type("Color") is block
+
+    str(schema)
+    assert sorted(blocks.rendered()) == sorted(blocks)
+
+
+def test_sdl_for_unknown_type() -> None:
+    with pytest.raises(KeyError):
+        build().sdl_for_type("Missing")
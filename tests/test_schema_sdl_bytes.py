@@ -0,0 +1,85 @@
+import gzip
+import zlib
+
+import graphene
+import pytest
+from graphql import GraphQLArgument, GraphQLInt, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    DirectiveValidationError,
+    SchemaDirective,
+    build_schema,
+    directive,
+    service_field,
+)
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[DirectiveLocation.FIELD_DEFINITION],
+    args={"max_age": GraphQLArgument(GraphQLInt)},
+)
+
+
+class Query(graphene.ObjectType):
+    _service = service_field()
+    name = directive(CacheDirective, field=graphene.String(), max_age=40)
+
+
+def test_service_field_resolves_the_sdl() -> None:
+    schema = build_schema(query=Query, directives=[CacheDirective])
+    sdl = str(schema)
+    assert "_service" not in sdl
+    assert "_Service" not in sdl
+    assert "name: String @cache(maxAge: 40)" in sdl
+
+    result = schema.execute("{ _service { sdl } }")
+    assert result.errors is None
+    assert result.data == {"_service": {"sdl": sdl}}
+
+
+def test_sdl_bytes_are_encoded_once() -> None:
+    schema = build_schema(query=Query, directives=[CacheDirective])
+    raw = schema.sdl_bytes()
+    assert raw == str(schema).encode()
+    assert schema.sdl_bytes() is raw
+
+    assert gzip.decompress(schema.sdl_bytes("gzip")) == raw
+    assert zlib.decompress(schema.sdl_bytes("deflate")) == raw
+    # no timestamp in the gzip header, the bytes only depend on the SDL
+    assert schema.sdl_bytes("gzip") == gzip.compress(raw, compresslevel=9, mtime=0)
+
+    try:
+        assert schema.sdl_bytes("zstd")
+    except DirectiveValidationError as error:
+        assert "zstandard" in str(error)
+
+    with pytest.raises(DirectiveValidationError, match="SDL encoding"):
+        schema.sdl_bytes("br")
+
+    schema.refresh(types=["Query"])
+    assert schema.sdl_bytes() is not raw
+    assert schema.sdl_bytes() == raw
+
+
+def test_service_field_on_a_derived_schema() -> None:
+    ContactDirective = CustomDirective(  # noqa: N806
+        name="contact",
+        locations=[DirectiveLocation.SCHEMA],
+        args={"name": GraphQLArgument(GraphQLString)},
+    )
+    base = build_schema(
+        query=Query,
+        directives=[CacheDirective, ContactDirective],
+        schema_directives=[SchemaDirective(ContactDirective, {"name": "prod"})],
+    )
+    derived = base.with_schema_directives([
+        SchemaDirective(ContactDirective, {"name": "staging"})
+    ])
+
+    query = "{ _service { sdl } }"
+    assert derived.execute(query).data == {"_service": {"sdl": str(derived)}}
+    assert '@contact(name: "staging")' in str(derived)
+    assert base.execute(query).data == {"_service": {"sdl": str(base)}}
+    assert '@contact(name: "prod")' in str(base)
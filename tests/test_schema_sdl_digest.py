@@ -0,0 +1,85 @@
+import graphene
+from graphql import GraphQLArgument, GraphQLInt
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    build_schema,
+    directive,
+)
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[DirectiveLocation.OBJECT, DirectiveLocation.FIELD_DEFINITION],
+    args={"max_age": GraphQLArgument(GraphQLInt)},
+)
+AuditDirective = CustomDirective(
+    name="audit", locations=[DirectiveLocation.FIELD_DEFINITION]
+)
+
+
+def make_query(reverse: bool) -> type:
+    class Color(graphene.Enum):
+        RED = 1
+        BLUE = 2
+
+    @directive(CacheDirective, max_age=30)
+    class Product(graphene.ObjectType):
+        name = directive(CacheDirective, field=graphene.String(), max_age=40)
+        color = graphene.Field(Color)
+        price = directive(
+            AuditDirective,
+            field=directive(CacheDirective, field=graphene.Float(), max_age=5),
+        )
+
+    class Review(graphene.ObjectType):
+        stars = graphene.Int()
+
+    fields = {"product": graphene.Field(Product), "review": graphene.Field(Review)}
+    if reverse:
+        fields = dict(reversed(fields.items()))
+    return type("Query", (graphene.ObjectType,), fields)
+
+
+def build(reverse: bool = False, canonical_sdl: bool = True) -> object:
+    directives = [CacheDirective, AuditDirective]
+    return build_schema(
+        query=make_query(reverse),
+        directives=directives[::-1] if reverse else directives,
+        canonical_sdl=canonical_sdl,
+    )
+
+
+def test_canonical_sdl_ignores_declaration_order() -> None:
+    schema = build()
+    reversed_schema = build(reverse=True)
+
+    assert str(schema) == str(reversed_schema)
+    assert schema.sdl_digest == reversed_schema.sdl_digest
+    assert str(schema).index("directive @audit") < str(schema).index("directive @cache")
+    assert str(schema).index("type Product") < str(schema).index("type Query")
+    assert "  color: Color\n  name: String @cache(maxAge: 40)" in str(schema)
+    # directive applications are sorted by directive name
+    assert "price: Float @audit @cache(maxAge: 5)" in str(schema)
+
+    # the declaration order is kept by default
+    assert str(build(canonical_sdl=False)) != str(build(True, canonical_sdl=False))
+
+
+def test_sdl_hashes_and_digest_follow_changes() -> None:
+    schema = build()
+    hashes = dict(schema.sdl_hashes)
+    assert set(hashes) == set(schema.sdl_blocks)
+    digest = schema.sdl_digest
+    assert schema.sdl_digest is digest
+
+    product = schema.graphql_schema.type_map["Product"].graphene_type
+    applications = product._directive_cache_non_field
+    applications[0]["maxAge"] = 60
+    schema.refresh(types=["Product"])
+    assert schema.sdl_digest != digest
+    assert {
+        type_name
+        for type_name, content_hash in schema.sdl_hashes.items()
+        if hashes[type_name] != content_hash
+    } == {"Product"}
@@ -0,0 +1,107 @@
+import gzip
+import os
+import tempfile
+from pathlib import Path
+
+import graphene
+import pytest
+from graphql import GraphQLArgument, GraphQLInt
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    DirectiveValidationError,
+    SharedSDL,
+    build_schema,
+    directive,
+    service_field,
+)
+
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[DirectiveLocation.FIELD_DEFINITION],
+    args={"max_age": GraphQLArgument(GraphQLInt)},
+)
+
+
+class Query(graphene.ObjectType):
+    _service = service_field()
+    name = directive(CacheDirective, field=graphene.String(), max_age=40)
+
+
+def test_publish_sdl_releases_in_process_copies(tmp_path: Path) -> None:
+    schema = build_schema(query=Query, directives=[CacheDirective])
+    document = str(schema)
+    digest = schema.sdl_digest
+
+    shared = schema.publish_sdl(str(tmp_path / "schema.sdl"), ("identity", "gzip"))
+    assert shared.digest == digest
+    assert schema._sdl_document is None
+    assert schema.sdl_blocks.rendered() == []
+
+    with schema.sdl_view() as view:
+        assert view.readonly
+        assert view == document.encode()
+    with schema.sdl_view("gzip") as view:
+        assert gzip.decompress(view) == document.encode()
+    assert str(schema) == document
+    assert schema.execute("{ _service { sdl } }").data == {
+        "_service": {"sdl": document}
+    }
+
+    # a worker started afresh maps the same artifact
+    with SharedSDL.open(shared.path) as reopened:
+        with reopened.view() as view:
+            assert view == document.encode()
+        with pytest.raises(DirectiveValidationError, match="not in the SDL artifact"):
+            reopened.view("zstd")
+    with pytest.raises(ValueError, match="closed"):
+        reopened.view()
+
+    schema.refresh(types=["Query"])
+    assert str(schema) == document
+    assert schema._sdl_document is not None
+    shared.close()
+
+
+def test_shared_sdl_write_failure_cleans_up(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    descriptors = []
+    mkstemp = tempfile.mkstemp
+
+    def tracked_mkstemp(**kwargs: str) -> tuple[int, str]:
+        descriptor, path = mkstemp(**kwargs)
+        descriptors.append(descriptor)
+        return descriptor, path
+
+    def failing_fdopen(*_: object) -> None:
+        raise OSError("fdopen failed")
+
+    monkeypatch.setattr(tempfile, "mkstemp", tracked_mkstemp)
+    monkeypatch.setattr(os, "fdopen", failing_fdopen)
+    with pytest.raises(OSError, match="fdopen failed"):
+        SharedSDL.write(str(tmp_path / "schema.sdl"), {"identity": b"type Query"}, "")
+
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises(OSError):
+        os.fstat(descriptors[0])
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_workers_read_the_shared_artifact(tmp_path: Path) -> None:
+    schema = build_schema(query=Query, directives=[CacheDirective])
+    document = str(schema).encode()
+    schema.publish_sdl(str(tmp_path / "schema.sdl"))
+
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # worker
+        os.close(read_end)
+        with schema.sdl_view() as view:
+            os.write(write_end, b"1" if view == document else b"0")
+        os._exit(0)
+    os.close(write_end)
+    assert os.read(read_end, 1) == b"1"
+    os.close(read_end)
+    os.waitpid(pid, 0)
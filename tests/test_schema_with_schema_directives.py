@@ -0,0 +1,101 @@
+import graphene
+import pytest
+from graphql import GraphQLArgument, GraphQLInt, GraphQLNonNull, GraphQLString
+
+from graphene_directives import (
+    CustomDirective,
+    DirectiveLocation,
+    DirectiveValidationError,
+    SchemaDirective,
+    build_schema,
+    directive,
+)
+
+LinkDirective = CustomDirective(
+    name="link",
+    locations=[DirectiveLocation.SCHEMA],
+    args={"url": GraphQLArgument(GraphQLNonNull(GraphQLString))},
+    is_repeatable=True,
+)
+ContactDirective = CustomDirective(
+    name="contact",
+    locations=[DirectiveLocation.SCHEMA],
+    args={"name": GraphQLArgument(GraphQLNonNull(GraphQLString))},
+)
+CacheDirective = CustomDirective(
+    name="cache",
+    locations=[DirectiveLocation.SCHEMA, DirectiveLocation.FIELD_DEFINITION],
+    args={"max_age": GraphQLArgument(GraphQLInt)},
+)
+
+
+class Query(graphene.ObjectType):
+    name = directive(CacheDirective, field=graphene.String(), max_age=40)
+    title = graphene.String()
+
+
+def build() -> object:
+    return build_schema(
+        query=Query,
+        directives=[LinkDirective, ContactDirective, CacheDirective],
+        schema_directives=[
+            SchemaDirective(target_directive=LinkDirective, arguments={"url": "a"})
+        ],
+    )
+
+
+def test_with_schema_directives_only_changes_the_header() -> None:
+    schema = build()
+    document = str(schema)
+
+    derived = schema.with_schema_directives([
+        SchemaDirective(target_directive=ContactDirective, arguments={"name": "b"}),
+        SchemaDirective(target_directive=CacheDirective, arguments={"max_age": 10}),
+    ])
+
+    assert derived.graphql_schema.type_map is schema.graphql_schema.type_map
+    assert derived.directive_index is schema.directive_index
+    assert derived.sdl_blocks["Query"] is schema.sdl_blocks["Query"]
+    assert str(schema) is document
+    assert str(derived) == document.replace(
+        '@link(url: "a")', '@contact(name: "b")\n\t@cache(maxAge: 10)'
+    )
+    assert derived.effective_directive_args["Query", "title"]["cache"] == {
+        "max_age": 10
+    }
+    assert "cache" not in schema.effective_directive_args.get(("Query", "title"), {})
+
+    assert str(schema.with_schema_directives([])) == document.split("\n\n", 1)[1]
+
+
+def test_with_schema_directives_validates_repeatable() -> None:
+    contact = SchemaDirective(
+        target_directive=ContactDirective, arguments={"name": "b"}
+    )
+    with pytest.raises(DirectiveValidationError, match="not repeatable"):
+        build().with_schema_directives([contact, contact])
+
+
+def test_refresh_applies_to_each_derived_schema() -> None:
+    schema = build()
+    str(schema)
+    derived = schema.with_schema_directives([])
+    document = str(derived)
+
+    applications = Query.name._directive_cache_field
+    applications[0]["maxAge"] = 60
+    try:
+        schema.refresh(types=["Query"])
+        assert "maxAge: 60" in str(schema)
+        assert str(derived) is document
+        assert derived.directive_index.for_field("Query", "name")[0].arguments == {
+            "max_age": 40
+        }
+
+        assert derived.refresh(types=["Query"]) == ["Query"]
+        assert str(derived) == document.replace("maxAge: 40", "maxAge: 60")
+        assert derived.directive_index.for_field("Query", "name")[0].arguments == {
+            "max_age": 60
+        }
+    finally:
+        applications[0]["maxAge"] = 40